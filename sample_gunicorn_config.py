@@ -14,4 +14,19 @@ raw_env = [
 ]
 
 
+def on_starting(server):
+    # Prepare the data of every wiki once, in the master process, so that
+    #  workers can just map it into memory
+    from wikichron.utils.data_store import build_prepared_data_of_all_wikis
+    build_prepared_data_of_all_wikis()
 
+
+def post_worker_init(worker):
+    # Load in memory the wikis listed in WIKICHRON_PRELOAD_WIKIS (if any)
+    #  before this worker starts to serve requests
+    from wikichron.utils.data_store import preload_wikis_from_env
+    preload_wikis_from_env()
+    # Start the pool the metrics are computed with (see wikichron/utils/executor.py),
+    #  instead of doing it in the middle of a request
+    from wikichron.utils.executor import start_executor
+    start_executor()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   benchmark_network_centralities.py
+
+   Descp: Compare the exact betweenness and closeness of the networks of the
+      available wikis with their approximations (see the approximate mode
+      of BaseNetwork.calculate_betweenness() and calculate_closeness()),
+      in time and error:
+         * rho: Spearman rank correlation between exact and approximate values.
+         * top10: fraction of the top 10% nodes (by exact value) which are
+            also in the top 10% of the approximation.
+         * mre: mean relative error of the approximation.
+
+      Usage: python3 scripts/benchmark_network_centralities.py [wiki csv ...]
+      (all the wikis in wikis.json by default)
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+from scipy.stats import spearmanr
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from wikichron.utils.data_manager import load_wikis
+from wikichron.utils.data_store import get_data_store, data_dir
+from wikichron.dash.apps.networks.networks import interface
+
+
+def compare(exact, approx):
+    exact = np.asarray(exact, dtype=float)
+    approx = np.asarray(approx, dtype=float)
+    valid = ~(np.isnan(exact) | np.isnan(approx))
+    exact = exact[valid]
+    approx = approx[valid]
+    if len(exact) < 2:
+        return (float('nan'), float('nan'), float('nan'))
+
+    rho = spearmanr(exact, approx).correlation
+    k = max(1, len(exact) // 10)
+    top_exact = set(np.argsort(-exact, kind='mergesort')[:k])
+    top_approx = set(np.argsort(-approx, kind='mergesort')[:k])
+    nonzero = exact != 0
+    mre = np.mean(np.abs(approx[nonzero] - exact[nonzero]) / np.abs(exact[nonzero]))\
+        if nonzero.any() else 0.0
+    return (rho, len(top_exact & top_approx) / k, mre)
+
+
+def benchmark(network, metric):
+    """ Returns the times and errors of the exact and approximate metric """
+    results = {}
+    for approximate in (False, True):
+        copy = type(network)(is_directed=network.graph.is_directed(),
+                            graph=network.graph.copy(), alias=network.alias)
+        time_start = time.perf_counter()
+        getattr(copy, f'calculate_{metric}')(approximate=approximate)
+        results[approximate] = (time.perf_counter() - time_start,
+                                copy.graph.vs[metric] if metric in copy.graph.vs.attributes() else [])
+    return (results[False][0], results[True][0]) + compare(results[False][1], results[True][1])
+
+
+def main(*args):
+    wikis = [wiki for wiki in load_wikis() if not args or wiki['data'] in args]
+    print('wiki,network,nodes,edges,metric,exact_s,approx_s,rho,top10,mre')
+    for wiki in wikis:
+        if not os.path.isfile(os.path.join(data_dir, wiki['data'])):
+            continue
+        df = get_data_store().get(wiki)
+        for network_type in interface.get_available_networks():
+            network = interface.factory_network(network_type.CODE, wiki['name'])
+            network.build_network(df, '', '')
+            for metric in ('betweenness', 'closeness'):
+                row = benchmark(network, metric)
+                print('{},{},{},{},{},{:.4f},{:.4f},{:.3f},{:.3f},{:.3f}'.format(
+                    wiki['data'], network_type.CODE, network.graph.vcount(),
+                    network.graph.ecount(), metric, *row))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*sys.argv[1:]))
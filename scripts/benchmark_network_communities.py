@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   benchmark_network_communities.py
+
+   Descp: Compare the community detection algorithms available for the
+      networks (see BaseNetwork.calculate_communities()) on the networks of
+      the available wikis, in number of communities, modularity and time,
+      to choose the algorithm of every network type
+      (WIKICHRON_NETWORKS_COMMUNITIES_<NETWORK CODE>).
+
+      Usage: python3 scripts/benchmark_network_communities.py [wiki csv ...]
+      (all the wikis in wikis.json by default)
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from wikichron.utils.data_manager import load_wikis
+from wikichron.utils.data_store import get_data_store, data_dir
+from wikichron.dash.apps.networks.networks import interface
+from wikichron.dash.apps.networks.networks.models.BaseNetwork import COMMUNITY_ALGORITHMS
+
+
+def benchmark(network, algorithm):
+    """ Returns the algorithm used, communities, modularity and seconds taken """
+    copy = type(network)(is_directed=network.graph.is_directed(),
+                        graph=network.graph.copy(), alias=network.alias)
+    copy.calculate_communities(algorithm)
+    return (copy.graph['communities_algorithm'], copy.graph['n_communities'],
+            copy.graph['modularity'], copy.graph['communities_time'])
+
+
+def main(*args):
+    wikis = [wiki for wiki in load_wikis() if not args or wiki['data'] in args]
+    print('wiki,network,nodes,edges,algorithm,used,communities,modularity,seconds')
+    for wiki in wikis:
+        if not os.path.isfile(os.path.join(data_dir, wiki['data'])):
+            continue
+        df = get_data_store().get(wiki)
+        for network_type in interface.get_available_networks():
+            network = interface.factory_network(network_type.CODE, wiki['name'])
+            network.build_network(df, '', '')
+            for algorithm in list(COMMUNITY_ALGORITHMS) + ['auto']:
+                row = benchmark(network, algorithm)
+                print('{},{},{},{},{},{},{},{},{:.4f}'.format(
+                    wiki['data'], network_type.CODE, network.graph.vcount(),
+                    network.graph.ecount(), algorithm, *row))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*sys.argv[1:]))
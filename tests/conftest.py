@@ -0,0 +1,65 @@
+"""
+   conftest.py
+
+   Descp: Shared fixtures of the test suite.
+
+      The bundled wikis (data/) are copied to a temporary directory, which
+      is set as WIKICHRON_DATA_DIR before importing wikichron, so the cache
+      files written next to the csv files don't end up in the repository.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import os
+import json
+import glob
+import shutil
+import tempfile
+
+import pytest
+
+REPO_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+data_dir = tempfile.mkdtemp(prefix='wikichron-tests-')
+for path in glob.glob(os.path.join(REPO_DATA_DIR, '*.csv')) + [os.path.join(REPO_DATA_DIR, 'wikis.json')]:
+    shutil.copy(path, data_dir)
+os.environ['WIKICHRON_DATA_DIR'] = data_dir
+
+from wikichron.utils.data_store import get_data_store # noqa: E402
+
+
+def get_bundled_wikis():
+    """ Wikis of wikis.json whose csv is bundled in data/ """
+    with open(os.path.join(data_dir, 'wikis.json')) as wikis_json_file:
+        wikis = json.load(wikis_json_file)
+    return [wiki for wiki in wikis if os.path.isfile(os.path.join(data_dir, wiki['data']))]
+
+
+BUNDLED_WIKIS = get_bundled_wikis()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(data_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope='session')
+def wiki_data_dir():
+    return data_dir
+
+
+@pytest.fixture(scope='session')
+def bundled_wikis():
+    return BUNDLED_WIKIS
+
+
+@pytest.fixture(params=BUNDLED_WIKIS, ids=lambda wiki: wiki['data'])
+def wiki(request):
+    return request.param
+
+
+@pytest.fixture
+def wiki_df(wiki):
+    """ Data of the wiki as the apps get it from the data store """
+    return get_data_store().get(wiki)
@@ -0,0 +1,512 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   monowiki_stats.py
+
+   Descp: Original implementation of the monowiki metrics which were moved
+      to the edits matrix and the contributor-month table, which the
+      current ones are tested to be equivalent to.
+
+      Only changed to run on newer pandas versions too: pd.Timedelta(1, 'M')
+      is written as the number of seconds it stood for, and NaT differences
+      are filled before dividing them.
+
+   Created on: 14-nov-2017
+
+   Copyright 2017-2019 Abel 'Akronix' Serrano Juste <akronix5@gmail.com>
+"""
+
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+
+
+# Users
+
+
+###### General helper functions ######
+
+def set_category_name(list_of_series, list_of_names):
+    '''
+    Set the name to be given to each pd series.
+    '''
+    for i in range(len(list_of_series)):
+        list_of_series[i].name = list_of_names[i]
+
+
+def get_accum_number_of_edits_until_each_month(data, index):
+    '''
+    Returns a pd DataFrame with the suitable shape for calculating the metrics:
+    one row contains the contributor_id, timestamp and nEdits -- cumulative number of edits done until the given timestamp
+    '''
+    df = data.groupby(['contributor_id']).apply(lambda x: x.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('nEdits').reindex(index, fill_value=0).cumsum()).reset_index()
+    return df
+
+
+def filter_anonymous(data):
+    '''
+    Erase anonymous users from the DataFrame in data
+    '''
+    data = data[data['contributor_name'] != 'Anonymous']
+    return data
+
+
+#### Helper users active ####
+
+def users_active_more_than_x_editions(data, index, x):
+    monthly_edits = data.groupby([pd.Grouper(key='timestamp', freq='MS'), 'contributor_name']).size()
+    monthly_edits_filtered = monthly_edits[monthly_edits > x].to_frame(name='pages_edited').reset_index()
+    series = monthly_edits_filtered.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
+    if index is not None:
+        series = series.reindex(index, fill_value=0)
+    return series
+
+
+#### Helper metric 2 ####
+
+def add_x_months(data, months):
+    return data['timestamp'].apply(lambda x: x + relativedelta(months = +months))
+
+
+def displace_x_months_per_user(data, months):
+    return data.shift(months)
+
+
+def current_streak_x_or_y_months_in_a_row(mothly, index, z, y, edits):
+
+    mothly['add_months'] = add_x_months(mothly, z)
+    lista = ['contributor_id']
+    lista.append('add_months')
+    if y > 0:
+      mothly['add_y_months'] = add_x_months(mothly, y)
+      lista.append('add_y_months')
+    group_users = mothly[lista].groupby(['contributor_id'])
+    displace_z_month = displace_x_months_per_user(group_users['add_months'], z)
+    mothly['displace']= displace_z_month
+    if y > 0:
+      displace_y_month = displace_x_months_per_user(group_users['add_y_months'], y)
+      mothly['displace_y_month']= displace_y_month
+      current_streak = mothly[(mothly['displace'] == mothly['timestamp']) & (mothly['displace_y_month'] != mothly['timestamp'])]
+    elif z == 1:
+      current_streak = mothly[mothly['displace'] != mothly['timestamp']]
+    elif z == 6:
+      current_streak = mothly[mothly['displace'] == mothly['timestamp']]
+
+    if edits == 0:
+      series = current_streak.groupby(pd.Grouper(key = 'timestamp', freq = 'MS')).size()
+    elif edits == 1:
+      series = current_streak.groupby(pd.Grouper(key = 'timestamp', freq = 'MS'))['size'].sum()
+
+    if index is not None:
+        series = series.reindex(index, fill_value=0)
+    return series
+
+
+#### Helper Active editors by Experience ####
+
+def generate_condition_users_by_number_of_edits(data, x, y):
+    '''
+    Determine the group of users to be included in one of the categories of the Active editors by experience metric.
+    '''
+    if (y != 0) and (x > 0):
+        condition = (data['medits'] > 0) & ((data['nEdits_until_previous_month'] >= x) & (data['nEdits_until_previous_month'] <= y))
+    elif (y == 0) and (x == 0):
+        condition = (data['nEdits_until_previous_month'] == -1)
+    elif (y == 0) and (x > 0):
+        condition = (data['medits'] > 0) & (data['nEdits_until_previous_month'] >= x)
+
+    return condition
+
+
+###### Callable Functions ######
+
+############################ New and Reincident users ###############################################################
+
+def users_new(data, index):
+    users = data.drop_duplicates('contributor_id')
+    series = users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
+    if index is not None:
+        series = series.reindex(index, fill_value=0)
+    return series
+
+
+############################ METRIC 2 #################################################################################################
+
+def current_streak(data, index):
+    data = filter_anonymous(data)
+
+    mothly = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('size').reset_index()
+
+    this_month = current_streak_x_or_y_months_in_a_row(mothly, index, 1, 0, 0)
+    two_three_months = current_streak_x_or_y_months_in_a_row(mothly, index, 1, 3, 0)
+    four_six_months = current_streak_x_or_y_months_in_a_row(mothly, index, 3, 6, 0)
+    more_six = current_streak_x_or_y_months_in_a_row(mothly, index, 6, 0, 0)
+
+    set_category_name([this_month, two_three_months, four_six_months, more_six], ['1 month editing', 'Btw. 2 and 3 consecutive months', 'Btw. 4 and 6 consecutive months', 'More than 6 consecutive months'])
+
+    return [this_month, two_three_months, four_six_months, more_six, 1]
+
+
+def current_streak_only_mains(data, index):
+    data = data[data['page_ns']==0]
+    return current_streak(data, index)
+
+
+def edits_by_current_streak(data, index):
+    data = filter_anonymous(data)
+
+    mothly = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('size').reset_index()
+
+    this_month = current_streak_x_or_y_months_in_a_row(mothly, index, 1, 0, 1)
+    two_three_months = current_streak_x_or_y_months_in_a_row(mothly, index, 1, 3, 1)
+    four_six_months = current_streak_x_or_y_months_in_a_row(mothly, index, 3, 6, 1)
+    more_six = current_streak_x_or_y_months_in_a_row(mothly, index, 6, 0, 1)
+
+    set_category_name([this_month, two_three_months, four_six_months, more_six], ['1 month editing', 'Btw. 2 and 3 consecutive months', 'Btw. 4 and 6 consecutive months', 'More than 6 consecutive months'])
+
+    return [this_month, two_three_months, four_six_months, more_six, 1]
+
+
+def edits_by_current_streak_only_mains(data, index):
+    data = data[data['page_ns']==0]
+    return edits_by_current_streak(data, index)
+
+
+############################ Users by tenure #################################################################################
+
+def users_first_edit(data, index):
+    '''Calculate the monthly number of users whose first edit was between 1 and 3, 4 and 6, 6 and 12, and more than 12 months ago
+    '''
+    data = filter_anonymous(data)
+    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
+
+    mins = format_data.groupby('contributor_id')['timestamp'].transform('min')
+    format_data['months'] = format_data['timestamp'].sub(mins).div(pd.Timedelta(seconds=2629746)).round().astype(int)
+
+    this_month = users_new(data, index)
+
+    one_three = pd.Series(format_data[(format_data['months'] >= 1) & (format_data['months'] <= 3)].groupby(['timestamp']).size(), index).fillna(0)
+    four_six = pd.Series(format_data[(format_data['months'] >= 4) & (format_data['months'] <= 6)].groupby(['timestamp']).size(), index).fillna(0)
+    six_twelve = pd.Series(format_data[(format_data['months'] >= 7) & (format_data['months'] <= 12)].groupby(['timestamp']).size(), index).fillna(0)
+    more_twelve = pd.Series(format_data[format_data['months'] >= 13].groupby(['timestamp']).size(), index).fillna(0)
+
+    this_month.name = 'New users'
+    one_three.name = 'Btw. 1 and 3 months ago'
+    four_six.name = 'Btw. 4 and 6 months ago'
+    six_twelve.name = 'Btw. 6 and 12 months ago'
+    more_twelve.name = 'More than 12 months ago'
+
+    return [this_month, one_three, four_six, six_twelve, more_twelve, 1]
+
+
+def users_first_edit_abs(data, index):
+    '''
+    Calculate the monthly percentage of users whose first edit was between 1 and 3, 4 and 6, 6 and 12, and more than 12 months ago
+    '''
+    data = filter_anonymous(data)
+    monthly_total_users = data.groupby([pd.Grouper(key='timestamp', freq='MS'), 'contributor_id']).size().reset_index()
+    monthly_total_users = monthly_total_users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
+    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
+    
+    mins = format_data.groupby('contributor_id')['timestamp'].transform('min')
+    format_data['months'] = format_data['timestamp'].sub(mins).div(pd.Timedelta(seconds=2629746)).round().astype(int)
+    
+    this_month = (users_new(data, index) / monthly_total_users) * 100
+    one_three = ((pd.Series(format_data[(format_data['months'] >= 1) & (format_data['months'] <= 3)].groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users) * 100
+    four_six = ((pd.Series(format_data[(format_data['months'] >= 4) & (format_data['months'] <= 6)].groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users) * 100
+    six_twelve = ((pd.Series(format_data[(format_data['months'] >= 7) & (format_data['months'] <= 12)].groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users) * 100
+    more_twelve = ((pd.Series(format_data[format_data['months'] >= 13].groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users) * 100
+
+    this_month.name = 'New users'
+    one_three.name = 'Btw. 1 and 3 months ago'
+    four_six.name = 'Btw. 4 and 6 months ago'
+    six_twelve.name = 'Btw. 6 and 12 months ago'
+    more_twelve.name = 'More than 12 months ago'
+    
+    return [this_month, one_three, four_six, six_twelve, more_twelve, 1]
+
+############################ Users by the date of the last edit ###########################################################################
+
+def users_last_edit(data, index):
+    '''
+    Get the monthly number of users whose last edit was less than 1, between 2 and 3, 4 and 6, and more than 6 months ago
+    '''
+    data = filter_anonymous(data)
+    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
+    format_data['months'] = format_data.groupby('contributor_id')['timestamp'].diff().fillna(pd.Timedelta(0)).div(pd.Timedelta(days=30.44)).round().astype(int)
+
+    new_users = users_new(data, index)
+    one_month = pd.Series((format_data[format_data['months'] == 1]).groupby(['timestamp']).size(), index).fillna(0)
+    two_three_months = pd.Series((format_data[(format_data['months'] == 2) | (format_data['months'] == 3)]).groupby(['timestamp']).size(), index).fillna(0)
+    four_six_months = pd.Series((format_data[(format_data['months'] >= 4) & (format_data['months'] <= 6)]).groupby(['timestamp']).size(), index).fillna(0)
+    more_six_months = pd.Series((format_data[format_data['months'] > 6]).groupby(['timestamp']).size(), index).fillna(0)
+
+    new_users.name = 'New users'
+    one_month.name = '1 month ago'
+    two_three_months.name = 'Btw. 2 and 3 months ago'
+    four_six_months.name = 'Btw. 4 and 6 months ago'
+    more_six_months.name = 'More than six months ago'
+
+    return [new_users, one_month, two_three_months, four_six_months, more_six_months, 1]
+
+def users_last_edit_abs(data, index):
+    '''
+    Get the monthly percentage of users whose last edit was less than 1, between 2 and 3, 4 and 6, and more than 6 months ago
+    '''
+    data = filter_anonymous(data)
+    monthly_total_users = data.groupby([pd.Grouper(key='timestamp', freq='MS'), 'contributor_id']).size().reset_index()
+    monthly_total_users = monthly_total_users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
+    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
+    format_data['months'] = format_data.groupby('contributor_id')['timestamp'].diff().fillna(pd.Timedelta(0)).div(pd.Timedelta(days=30.44)).round().astype(int)
+
+    new_users = (users_new(data, index) / monthly_total_users) * 100
+    one_month = ((pd.Series((format_data[format_data['months'] == 1]).groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users)*100
+    two_three_months = ((pd.Series((format_data[(format_data['months'] == 2) | (format_data['months'] == 3)]).groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users)*100
+    four_six_months = ((pd.Series((format_data[(format_data['months'] >= 4) & (format_data['months'] <= 6)]).groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users)*100
+    more_six_months = ((pd.Series((format_data[format_data['months'] > 6]).groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users)*100
+
+    new_users.name = 'New users'
+    one_month.name = '1 month ago'
+    two_three_months.name = 'Btw. 2 and 3 months ago'
+    four_six_months.name = 'Btw. 4 and 6 months ago'
+    more_six_months.name = 'More than six months ago'
+
+    return [new_users, more_six_months, four_six_months, two_three_months, one_month, 1]
+
+############################ Active editors by experience #####################################################################
+
+def users_number_of_edits(data, index):
+    '''
+    Get the monthly number of users that belong to each category, in the Active editors by experience metric.
+    '''
+    data = filter_anonymous(data)
+    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
+    format_data['nEdits'] = (format_data[['medits', 'contributor_id']].groupby(['contributor_id']))['medits'].cumsum()
+    format_data['nEdits_until_previous_month'] = (format_data[['nEdits','contributor_id']].groupby(['contributor_id']))['nEdits'].shift().fillna(-1)
+
+    new_users = users_new(data, index)
+    one_four = pd.Series(format_data[generate_condition_users_by_number_of_edits(format_data, 1,4)].groupby(['timestamp']).size(), index).fillna(0)
+    between_5_24 = pd.Series(format_data[generate_condition_users_by_number_of_edits(format_data,5,24)].groupby(['timestamp']).size(), index).fillna(0)
+    between_25_99 = pd.Series(format_data[generate_condition_users_by_number_of_edits(format_data,25,99)].groupby(['timestamp']).size(), index).fillna(0)
+    highEq_100 = pd.Series(format_data[generate_condition_users_by_number_of_edits(format_data,100,0)].groupby(['timestamp']).size(), index).fillna(0)
+
+
+    new_users.name = 'New users'
+    one_four.name = 'Btw. 1 and 4 edits'
+    between_5_24.name = 'Btw. 5 and 24 edits'
+    between_25_99.name = 'Btw. 25 and 99 edits'
+    highEq_100.name = 'More than 99 edits'
+
+    return [new_users, one_four, between_5_24, between_25_99, highEq_100, 1]
+
+
+############################ Edits by editor experience (absolute and relative) #########################################
+
+
+def number_of_edits_by_experience_abs(data, index):
+    '''
+    Get the monthly number of edits by each user category in the Active editors by experience metric
+    '''
+    data = filter_anonymous(data)
+    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
+    format_data['nEdits'] = (format_data[['medits', 'contributor_id']].groupby(['contributor_id']))['medits'].cumsum()
+    format_data['nEdits_until_previous_month'] = (format_data[['nEdits','contributor_id']].groupby(['contributor_id']))['nEdits'].shift().fillna(-1)
+
+    new_users = format_data[generate_condition_users_by_number_of_edits(format_data, 0,0)]
+    one_four = format_data[generate_condition_users_by_number_of_edits(format_data, 1,4)]
+    between_5_24 = format_data[generate_condition_users_by_number_of_edits(format_data, 5,24)]
+    between_25_99 = format_data[generate_condition_users_by_number_of_edits(format_data, 25,99)]
+    highEq_100 = format_data[generate_condition_users_by_number_of_edits(format_data, 100,0)]
+
+    new_users = new_users.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    one_four = one_four.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    between_5_24 = between_5_24.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    between_25_99 = between_25_99.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    highEq_100 = highEq_100.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+
+    new_users.name = "New users"
+    one_four.name = "Btw. 1 and 4 edits"
+    between_5_24.name = "Btw. 5 and 24 edits"
+    between_25_99.name = "Btw. 24 and 99 edits"
+    highEq_100.name = "More than 99 edits"
+
+    return [new_users, one_four, between_5_24, between_25_99, highEq_100, 1]
+
+
+def number_of_edits_by_experience_rel(data, index):
+    '''
+    Get the monthly proportion of edits done by each user category in the Active editors by experience metrics
+    '''
+    categories = number_of_edits_by_experience_abs(data, index)
+
+    data = filter_anonymous(data)
+    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
+    format_data['nEdits'] = (format_data[['medits', 'contributor_id']].groupby(['contributor_id']))['medits'].cumsum()
+    format_data['nEdits_until_previous_month'] = (format_data[['nEdits','contributor_id']].groupby(['contributor_id']))['nEdits'].shift().fillna(-1)
+    monthly_total_edits = format_data.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+
+    edits_new_users = ((categories[0] / monthly_total_edits)*100).fillna(0)
+    edits_beginners = ((categories[1] / monthly_total_edits)*100).fillna(0)
+    edits_advanced = ((categories[2] / monthly_total_edits)*100).fillna(0)
+    edits_experimented = ((categories[3] / monthly_total_edits)*100).fillna(0)
+    edits_H_experimented = ((categories[4] / monthly_total_edits)*100).fillna(0)
+
+    edits_new_users.name = "New users"
+    edits_beginners.name = "Btw. 1 and 4 edits"
+    edits_advanced.name = "Btw. 5 and 24 edits"
+    edits_experimented.name = "Btw. 24 and 99 edits"
+    edits_H_experimented.name = "More than 99 edits"
+
+    return [edits_new_users, edits_beginners, edits_advanced, edits_experimented, edits_H_experimented, 1]
+
+############################ Edits by editor's tenure #########################################
+
+def number_of_edits_by_tenure(data, index):
+    '''
+    Get the monthly number of edits by each user category in the Users by tenure metric
+    '''
+    data = filter_anonymous(data)
+    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
+
+    mins = format_data.groupby('contributor_id')['timestamp'].transform('min')
+    format_data['months'] = format_data['timestamp'].sub(mins).div(pd.Timedelta(seconds=2629746)).round().astype(int)
+
+    new_users = format_data[format_data['months'] == 0]
+    one_three = format_data[(format_data['months'] >= 1) & (format_data['months'] <= 3)]
+    four_six = format_data[(format_data['months'] >= 4) & (format_data['months'] <= 6)]
+    six_twelve = format_data[(format_data['months'] >= 7) & (format_data['months'] <= 12)]
+    more_twelve = format_data[format_data['months'] >= 13]
+
+    new_users = new_users.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    one_three = one_three.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    four_six = four_six.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    six_twelve = six_twelve.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    more_twelve = more_twelve.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+
+
+    new_users.name = 'New users'
+    one_three.name = 'Btw. 1 and 3 months ago'
+    four_six.name = 'Btw. 4 and 6 months ago'
+    six_twelve.name = 'Btw. 6 and 12 months ago'
+    more_twelve.name = 'More than 12 months ago'
+
+    return [new_users, one_three, four_six, six_twelve, more_twelve, 1]
+
+
+def number_of_edits_by_tenure_abs(data, index):
+    '''
+    Get the monthly proportion of edits done by each user category in the Users by tenure metric
+    '''
+    categories = number_of_edits_by_tenure(data, index)
+
+    data = filter_anonymous(data)
+    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
+    monthly_total_edits = format_data.groupby(['timestamp'])['medits'].sum()
+
+    new_users = (categories[0]/monthly_total_edits)*100
+    one_three = (categories[1]/monthly_total_edits)*100
+    four_six = (categories[2]/monthly_total_edits)*100
+    six_twelve = (categories[3]/monthly_total_edits)*100
+    more_twelve = (categories[4]/monthly_total_edits)*100
+
+    new_users.name = 'New users'
+    one_three.name = 'Btw. 1 and 3 months ago'
+    four_six.name = 'Btw. 4 and 6 months ago'
+    six_twelve.name = 'Btw. 6 and 12 months ago'
+    more_twelve.name = 'More than 12 months ago'
+
+    return [new_users, one_three, four_six, six_twelve, more_twelve, 1]
+
+############################ Edits by editor's last edit date #########################################
+
+def number_of_edits_by_last_edit(data, index):
+    '''
+    Get the monthly number of edits by each user category in the Users by the date of the last edit metric
+    '''
+    data = filter_anonymous(data)
+    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
+    format_data['months'] = format_data.groupby('contributor_id')['timestamp'].diff().fillna(pd.Timedelta(0)).div(pd.Timedelta(days=30.44)).round().astype(int)
+
+    new_users = (format_data[format_data['months'] == 0]).groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    one_month = (format_data[format_data['months'] == 1]).groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    two_three_months = (format_data[(format_data['months'] == 2) | (format_data['months'] == 3)]).groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    four_six_months = (format_data[(format_data['months'] >= 4) & (format_data['months'] <= 6)]).groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    more_six_months = (format_data[format_data['months'] > 6]).groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+
+    new_users.name = 'New users'
+    one_month.name = '1 month ago'
+    two_three_months.name = 'Btw. 2 and 3 months ago'
+    four_six_months.name = 'Btw. 4 and 6 months ago'
+    more_six_months.name = 'More than six months ago'
+
+    return [new_users, one_month, two_three_months, four_six_months, more_six_months, 1]
+
+
+def number_of_edits_by_last_edit_abs(data, index):
+    '''
+    Get the monthly proportion of edits done by each user category in the Users by the date of the last edit metric
+    '''
+    categories = number_of_edits_by_last_edit(data, index)
+    data = filter_anonymous(data)
+    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
+    monthly_total_edits = format_data.groupby(['timestamp'])['medits'].sum()
+
+    new_users = (categories[0] / monthly_total_edits) * 100
+    one_month = (categories[1] / monthly_total_edits) * 100
+    two_three_months = (categories[2] / monthly_total_edits) * 100
+    four_six_months = (categories[3] / monthly_total_edits) * 100
+    more_six_months = (categories[4] / monthly_total_edits) * 100
+
+    new_users.name = 'New users'
+    one_month.name = '1 month ago'
+    two_three_months.name = 'Btw. 2 and 3 months ago'
+    four_six_months.name = 'Btw. 4 and 6 months ago'
+    more_six_months.name = 'More than six months ago'
+
+    return [new_users, more_six_months, four_six_months, two_three_months, one_month, 1]
+    
+########################### % Of edits by % of users (Total and monthly) ###########################################
+
+
+def contributor_pctg_per_contributions_pctg(data, index):
+    """
+    Calculate which % of contributors has contributed
+    in a 50%, 80%, 90% and 99% of the total wiki edits until each month.
+    """
+    data = filter_anonymous(data)
+    format_data =data.groupby(['contributor_id']).apply(lambda x: x.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('nEdits_cumulative').reindex(index, fill_value=0).cumsum()).reset_index()
+    format_data['monthly_total_edits'] = format_data.groupby('timestamp')['nEdits_cumulative'].transform('sum')
+
+    format_data['edits%'] = (format_data['nEdits_cumulative'] / format_data['monthly_total_edits']) * 100
+    format_data = format_data.sort_values(['timestamp', 'edits%'], ascending=[True, False])
+    format_data['edits%accum'] = format_data.groupby('timestamp')['edits%'].cumsum()
+    format_data = format_data[format_data['edits%'] > 0]
+    monthly_total_users = format_data.groupby('timestamp').size().reindex(index).fillna(0)
+    monthly_total_users = monthly_total_users[monthly_total_users >= 10].reindex(index)
+
+    p = [1 for j in range(1, len(format_data.index)+1)]
+    format_data['count'] = p
+    format_data['count_acum'] = format_data.groupby('timestamp')['count'].cumsum()
+
+    category_50 = (format_data[format_data['edits%accum'] >= 50]).groupby('timestamp').head(1)
+    category_50 = category_50.set_index(category_50['timestamp']).reindex(index).fillna(0)['count_acum']
+    category_50= (((category_50 / monthly_total_users)*100)).fillna(0)
+
+    category_80 = (format_data[(format_data['edits%accum'] >=80)]).groupby('timestamp').head(1)
+    category_80 = category_80.set_index(category_80['timestamp']).reindex(index).fillna(0)['count_acum']
+    category_80 = (((category_80 / monthly_total_users)*100)).fillna(0)
+
+    category_90 = (format_data[(format_data['edits%accum'] >=90)]).groupby('timestamp').head(1)
+    category_90 = category_90.set_index(category_90['timestamp']).reindex(index).fillna(0)['count_acum']
+    category_90 = (((category_90 / monthly_total_users)*100)).fillna(0)
+
+    category_99 = (format_data[(format_data['edits%accum'] >=99)]).groupby('timestamp').head(1)
+    category_99 = category_99.set_index(category_99['timestamp']).reindex(index).fillna(0)['count_acum']
+    category_99 = (((category_99 / monthly_total_users)*100)).fillna(0)
+
+
+    category_50.name = "50% of edits"
+    category_80.name = "80% of edits"
+    category_90.name = "90% of edits"
+    category_99.name = "99% of edits"
+
+    return[category_50, category_80, category_90, category_99]
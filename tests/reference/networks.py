@@ -0,0 +1,238 @@
+"""
+   networks.py
+
+   Descp: Original networks, built row by row with iterrows(), which the
+      current bulk builders (graph_builder.py and windows.py) are tested
+      to be equivalent to.
+
+      Every class only overrides generate_from_pandas() of the current one
+      with its original implementation.
+
+   Created on: 18/10/2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import re
+
+from wikichron.dash.apps.networks.data_controller import get_bot_names
+from wikichron.dash.apps.networks.networks.models import CoEditingNetwork as co_editing
+from wikichron.dash.apps.networks.networks.models import TalkPagesNetwork as talk_pages
+from wikichron.dash.apps.networks.networks.models import UserTalkNetwork as user_talk
+
+
+class CoEditingNetwork(co_editing.CoEditingNetwork):
+
+    def generate_from_pandas(self, df):
+        user_per_page = {}
+        mapper_v = {}
+        mapper_e = {}
+        count = 0
+        dff = self.remove_non_article_data(df)
+
+        for _, r in dff.iterrows():
+            # Nodes
+            if not int(r['contributor_id']) in mapper_v:
+                self.graph.add_vertex(count)
+                mapper_v[int(r['contributor_id'])] = count
+                self.graph.vs[count]['id'] = int(r['contributor_id'])
+                self.graph.vs[count]['label'] = r['contributor_name']
+                self.graph.vs[count]['article_edits'] = 0
+                self.graph.vs[count]['articles'] = {int(r['page_id'])}
+                count += 1
+
+            self.graph.vs[mapper_v[int(r['contributor_id'])]]['article_edits'] += 1
+            self.graph.vs[mapper_v[int(r['contributor_id'])]]['articles'].add(int(r['page_id']))
+
+            # A page gets serveral contributors
+            if not int(r['page_id']) in user_per_page:
+                user_per_page[int(r['page_id'])] = {int(r['contributor_id'])}
+            else:
+                if int(r['contributor_id']) not in user_per_page[int(r['page_id'])]:
+                    user_per_page[int(r['page_id'])].add(int(r['contributor_id']))
+
+        count = 0
+        # Edges
+        for _, p in user_per_page.items():
+            for u1 in p:
+                for u2 in p:
+                    if u1 == u2:
+                        continue
+                    k_edge = (u1 << 32) + u2
+                    k_edge_2 = (u2 << 32) + u1
+                    if k_edge in mapper_e:
+                        self.graph.es[mapper_e[k_edge]]['weight'] += 1
+                        continue
+                    elif k_edge_2 in mapper_e:
+                        #self.graph.es[mapper_e[k_edge_2]]['weight'] += 1
+                        continue
+
+                    self.graph.add_edge(mapper_v[u1], mapper_v[u2])
+                    mapper_e[k_edge] = count
+                    count += 1
+                    self.graph.es[mapper_e[k_edge]]['weight'] = 1
+                    self.graph.es[mapper_e[k_edge]]['id'] = k_edge
+                    self.graph.es[mapper_e[k_edge]]['source'] = u1
+                    self.graph.es[mapper_e[k_edge]]['target'] = u2
+
+        # total pages per user
+        if 'articles' in self.graph.vs.attributes():
+            articles = [len(node['articles']) for node in self.graph.vs]
+            self.graph.vs['articles'] = articles
+
+        # total pages
+        self.graph['wiki_articles'] = len(user_per_page)
+        self.graph['wiki_article_edits'] = len(dff.index)
+
+
+class TalkPagesNetwork(talk_pages.TalkPagesNetwork):
+
+    def generate_from_pandas(self, df):
+        user_per_page = {}
+        mapper_v = {}
+        mapper_e = {}
+        count = 0
+
+        dff = self.remove_non_talk_data(df)
+
+        for _, r in dff.iterrows():
+            # Nodes
+            if not int(r['contributor_id']) in mapper_v:
+                self.graph.add_vertex(count)
+                mapper_v[int(r['contributor_id'])] = count
+                self.graph.vs[count]['id'] = int(r['contributor_id'])
+                self.graph.vs[count]['label'] = r['contributor_name']
+                self.graph.vs[count]['talk_edits'] = 0
+                self.graph.vs[count]['talks'] = {int(r['page_id'])}
+                count += 1
+
+            self.graph.vs[mapper_v[int(r['contributor_id'])]]['talk_edits'] += 1
+            self.graph.vs[mapper_v[int(r['contributor_id'])]]['talks'].add(int(r['page_id']))
+
+            # A page gets serveral contributors
+            if not int(r['page_id']) in user_per_page:
+                user_per_page[int(r['page_id'])] = {int(r['contributor_id'])}
+            else:
+                if int(r['contributor_id']) not in user_per_page[r['page_id']]:
+                    user_per_page[r['page_id']].add(int(r['contributor_id']))
+
+        count = 0
+        # Edges
+        for _, p in user_per_page.items():
+            for u1 in p:
+                for u2 in p:
+                    if u1 == u2:
+                        continue
+                    k_edge = (u1 << 32) + u2
+                    k_edge_2 = (u2 << 32) + u1
+                    if k_edge in mapper_e:
+                        self.graph.es[mapper_e[k_edge]]['weight'] += 1
+                        continue
+                    elif k_edge_2 in mapper_e:
+                        #self.graph.es[mapper_e[k_edge_2]]['weight'] += 1
+                        continue
+
+                    self.graph.add_edge(mapper_v[u1], mapper_v[u2])
+                    mapper_e[k_edge] = count
+                    count += 1
+                    self.graph.es[mapper_e[k_edge]]['weight'] = 1
+                    self.graph.es[mapper_e[k_edge]]['id'] = k_edge
+                    self.graph.es[mapper_e[k_edge]]['source'] = u1
+                    self.graph.es[mapper_e[k_edge]]['target'] = u2
+
+        # total pages per user 
+        if 'talks' in self.graph.vs.attributes():
+            talks = [len(node['talks']) for node in self.graph.vs]
+            self.graph.vs['talks'] = talks
+
+        # total pages
+        self.graph['wiki_talks'] = len(user_per_page)
+        self.graph['wiki_talk_edits'] = len(dff.index)
+
+
+class UserTalkNetwork(user_talk.UserTalkNetwork):
+
+    def generate_from_pandas(self, df):
+        user_per_page = {}
+        mapper_v = {}
+        count_v = 0
+        count_e = 0
+
+        bots_name = get_bot_names(self.alias)
+        dff = self.remove_non_user_talk_data(df)
+
+        for _, r in dff.iterrows():
+            ################ Filter ################
+            # remove "User Page:"
+            page_t = re.sub(r'^.+:', '', r['page_title'])
+            # remove everyhing after slash
+            page_t = re.sub(r'[\/].*', '', page_t)
+            # filter anonymous user talk page for ipv4 or ipv6 (i.e it contains "." or ":")
+            if re.search(r'\.|\:', page_t):
+                continue
+            # filter bots pages
+            if page_t in bots_name:
+                continue
+            ########################################
+
+            # Nodes
+            if not r['contributor_name'] in mapper_v:
+                self.graph.add_vertex(count_v)
+                mapper_v[r['contributor_name']] = count_v
+                self.graph.vs[count_v]['id'] = int(r['contributor_id'])
+                self.graph.vs[count_v]['label'] = r['contributor_name']
+                self.graph.vs[count_v]['own_u_edits'] = 0
+                self.graph.vs[count_v]['user_talks'] = {int(r['page_id'])}
+                count_v += 1
+
+            # count diferent pages
+            self.graph.vs[mapper_v[r['contributor_name']]]['user_talks'].add(int(r['page_id']))
+
+            if page_t == r['contributor_name']:
+                self.graph.vs[mapper_v[page_t]]['own_u_edits'] += 1
+            else:
+                # A page gets serveral contributors
+                if not page_t in user_per_page:
+                    user_per_page[page_t] = {r['contributor_name']: 1}
+                else:
+                    if r['contributor_name'] in user_per_page[page_t]:
+                        user_per_page[page_t][r['contributor_name']] += 1
+                    else:
+                        user_per_page[page_t][r['contributor_name']] = 1
+
+        # Edges
+        if self.graph.vcount():
+            max_id = max(self.graph.vs['id']) + 1
+        else:
+            max_id = 1
+
+        for page_name, p_dict in user_per_page.items():
+            for user, edits in p_dict.items():
+                # it could be that an user has no edits but someone edits in its user-talk
+                if page_name not in mapper_v:
+                    self.graph.add_vertex(count_v)
+                    mapper_v[page_name] = count_v
+                    self.graph.vs[count_v]['id'] = max_id
+                    max_id += 1
+                    self.graph.vs[count_v]['label'] = page_name
+                    self.graph.vs[count_v]['own_u_edits'] = 0
+                    self.graph.vs[count_v]['user_talks'] = set()
+                    count_v += 1
+
+                self.graph.add_edge(mapper_v[user], mapper_v[page_name])
+                source = self.graph.vs[mapper_v[user]]['id']
+                target = self.graph.vs[mapper_v[page_name]]['id']
+                edge_id = (source << 32) + target
+                self.graph.es[count_e]['id'] = edge_id
+                self.graph.es[count_e]['weight'] = edits
+                self.graph.es[count_e]['source'] = source
+                self.graph.es[count_e]['target'] = target
+                count_e += 1
+
+        # total pages per user
+        if 'user_talks' in self.graph.vs.attributes():
+            user_talks = [len(node['user_talks']) for node in self.graph.vs]
+            self.graph.vs['user_talks'] = user_talks
+
+        # total pages
+        self.graph['wiki_user_talk_edits'] = len(dff.index)
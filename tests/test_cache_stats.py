@@ -0,0 +1,40 @@
+"""
+   test_cache_stats.py
+
+   Descp: Tests of the stats of the flask caches served in /cacheStats.json.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import pickle
+
+import flask
+from flask_caching import Cache
+
+from wikichron.utils import utils
+
+
+def get_cache(cache_type, **config):
+    app = flask.Flask('wikichron')
+    return Cache(app, config=dict(config, CACHE_TYPE=cache_type))
+
+
+def test_simple_cache_stats():
+    cache = get_cache('wikichron.utils.utils.simple_cache_with_stats')
+    assert utils.get_cache_stats(cache) == {'type': 'SimpleCacheWithStats', 'keys': 0, 'bytes': 0}
+
+    values = {'a': list(range(100)), 'b': 'some text'}
+    cache.set_many(values)
+    cache.set('c', 1, timeout=-1) # already expired
+    nbytes = sum(len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)) for value in values.values())
+    assert utils.get_cache_stats(cache) == {'type': 'SimpleCacheWithStats', 'keys': 2, 'bytes': nbytes}
+    assert cache.get('a') == values['a']
+
+    cache.delete('a')
+    assert utils.get_cache_stats(cache)['keys'] == 1
+
+
+def test_other_cache_stats():
+    assert utils.get_cache_stats(get_cache('null')) == {'type': 'NullCache'}
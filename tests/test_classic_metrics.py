@@ -0,0 +1,128 @@
+"""
+   test_classic_metrics.py
+
+   Descp: Tests of the monthly aggregates of the classic metrics and of
+      the equivalence of every classic metric with its original
+      implementation (see reference/classic_stats.py) on the bundled wikis.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wikichron.dash.apps.classic.metrics import stats, interface
+from wikichron.dash.apps.classic.metrics.monthly_aggregates import (MonthlyAggregates,
+                                remove_from_sorted, insert_into_sorted, NS_MAIN,
+                                NS_ARTICLE_TALK, NS_USER_TALK, NS_OTHER)
+
+from reference import classic_stats
+
+
+@pytest.fixture
+def small_data():
+    """ A few revisions along three months, the second one without activity """
+    return pd.DataFrame({
+        'page_id':          [1, 1, 2, 3, 2, 4, 1, 5],
+        'page_ns':          [0, 0, 1, 3, 1, 0, 0, 4],
+        'contributor_id':   [10, 11, 10, -1, 12, 10, 11, -2],
+        'contributor_name': ['A', 'B', 'A', 'Anonymous', 'C', 'A', 'B', 'Anonymous'],
+        'timestamp': pd.to_datetime(['2018-01-02', '2018-01-05', '2018-01-05', '2018-01-20',
+                                    '2018-03-01', '2018-03-02', '2018-03-10', '2018-03-31 23:59']),
+    })
+
+
+def test_monthly_aggregates(small_data):
+    aggregates = MonthlyAggregates(small_data)
+
+    assert list(aggregates.index) == list(pd.to_datetime(['2018-01-01', '2018-02-01', '2018-03-01']))
+    assert aggregates.edits.shape == (3, 4, 2)
+
+    # edits by month, namespace and anonymous flag
+    assert aggregates.edits.sum(axis=(1, 2)).tolist() == [4, 0, 4]
+    assert aggregates.edits[:, NS_MAIN, 0].tolist() == [2, 0, 2]
+    assert aggregates.edits[:, NS_ARTICLE_TALK, 0].tolist() == [1, 0, 1]
+    assert aggregates.edits[:, NS_USER_TALK, 1].tolist() == [1, 0, 0]
+    assert aggregates.edits[:, NS_OTHER, 1].tolist() == [0, 0, 1]
+
+    assert aggregates.new_pages.sum(axis=(1, 2)).tolist() == [3, 0, 2]
+    assert aggregates.new_users.sum(axis=(1, 2)).tolist() == [3, 0, 2]
+    assert aggregates.new_users[:, :, 1].sum(axis=1).tolist() == [1, 0, 1]
+    assert aggregates.pages_edited.sum(axis=(1, 2)).tolist() == [3, 0, 4]
+    assert aggregates.pages_edited[:, NS_MAIN].sum(axis=1).tolist() == [1, 0, 2]
+
+    assert aggregates.active_users().tolist() == [3, 0, 4]
+    assert aggregates.active_users(2).tolist() == [1, 0, 0]
+    assert aggregates.active_users(anonymous=True).tolist() == [1, 0, 1]
+    assert aggregates.active_users(anonymous=False).tolist() == [2, 0, 3]
+
+
+def test_monthly_aggregates_of_empty_data(small_data):
+    aggregates = MonthlyAggregates(small_data.iloc[:0])
+
+    assert len(aggregates.index) == 0
+    assert aggregates.edits.shape == (0, 4, 2)
+    assert aggregates.active_users().tolist() == []
+    assert list(aggregates.accumulated_contributions()) == []
+
+
+def test_accumulated_contributions(wiki_df):
+    aggregates = MonthlyAggregates(wiki_df)
+    months = wiki_df['timestamp'].values.astype('datetime64[M]')
+
+    accumulated = list(aggregates.accumulated_contributions())
+    assert len(accumulated) == len(aggregates.index)
+    for month, contributions in zip(aggregates.index, accumulated):
+        until_month = wiki_df[months <= month.to_datetime64()]
+        expected = np.sort(until_month.groupby('contributor_id').size().values)
+        assert contributions.tolist() == expected.tolist()
+
+
+def test_sorted_updates():
+    rng = np.random.RandomState(0)
+    for _ in range(100):
+        values = np.sort(rng.randint(0, 10, rng.randint(0, 30)))
+        removed = np.sort(rng.choice(values, rng.randint(0, len(values) + 1), replace=False)) \
+                    if len(values) else values
+        inserted = np.sort(rng.randint(0, 10, rng.randint(0, 10)))
+
+        left = remove_from_sorted(values, removed)
+        expected = list(values)
+        for value in removed:
+            expected.remove(value)
+        assert left.tolist() == expected
+
+        assert insert_into_sorted(left, inserted).tolist() == sorted(expected + list(inserted))
+
+
+def test_index_all_months(wiki_df):
+    expected = classic_stats.calculate_index_all_months(wiki_df.copy())
+    assert list(stats.calculate_index_all_months(wiki_df)) == list(expected)
+
+
+@pytest.mark.parametrize('metric', interface.get_available_metrics(), ids=lambda metric: metric.code)
+def test_equivalent_to_original(metric, wiki_df):
+    index = stats.calculate_index_all_months(wiki_df)
+    # the original metrics may modify the data they get
+    expected = getattr(classic_stats, metric.func.__name__)(wiki_df.copy(), index)
+    series = metric.calculate(wiki_df, index)
+
+    # the frequency of the index is only compared (and check_freq known)
+    #  since pandas 1.1, so the index is compared on its own
+    assert list(series.index) == list(expected.index)
+    pd.testing.assert_series_equal(series.astype(float).reset_index(drop=True),
+                expected.astype(float).reset_index(drop=True), check_names=False)
+
+
+def test_compute_metrics_on_dataframe(wiki_df):
+    metrics = interface.get_available_metrics()
+    computed = interface.compute_metrics_on_dataframe(metrics, wiki_df)
+
+    assert [series.name for series in computed] == \
+        ['{}<>{}'.format(wiki_df.index.name, metric.code) for metric in metrics]
+    index = stats.calculate_index_all_months(wiki_df)
+    for series in computed:
+        assert list(series.index) == list(index)
@@ -0,0 +1,141 @@
+"""
+   test_columnar_cache.py
+
+   Descp: Tests of the columnar cache of the wiki csv files.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import os
+import mmap
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wikichron.utils import columnar_cache
+
+
+@pytest.fixture(params=['200movies.wikia.com.csv', 'es.lagunanegra.wikia.com.csv'])
+def csv_path(request, wiki_data_dir, tmp_path):
+    """ A copy of a bundled wiki csv, with no cache files yet """
+    path = str(tmp_path / request.param)
+    shutil.copy(os.path.join(wiki_data_dir, request.param), path)
+    return path
+
+
+def test_round_trip(csv_path):
+    expected = columnar_cache.to_typed_dataframe(columnar_cache.parse_csv(csv_path))
+
+    df = columnar_cache.load_dataframe(csv_path)
+    assert os.path.isfile(columnar_cache.get_cache_path(csv_path))
+    pd.testing.assert_frame_equal(df, expected)
+
+    for mapped in (False, True):
+        pd.testing.assert_frame_equal(columnar_cache.read_cache(csv_path, mmap=mapped), expected)
+
+
+def is_mapped(values):
+    """ Whether the memory of the array values is a mapped file """
+    if isinstance(values, pd.Categorical):
+        values = values.codes
+    base = values
+    while base is not None:
+        if isinstance(base, mmap.mmap):
+            return True
+        base = getattr(base, 'base', None)
+    return False
+
+
+@pytest.mark.parametrize('use_block_manager', [True, False])
+def test_mapped_dataframe(csv_path, use_block_manager, monkeypatch):
+    if use_block_manager and not columnar_cache.USE_BLOCK_MANAGER:
+        pytest.skip('pandas internals not used with pandas ' + pd.__version__)
+    monkeypatch.setattr(columnar_cache, 'USE_BLOCK_MANAGER', use_block_manager)
+    expected = columnar_cache.load_dataframe(csv_path)
+
+    df = columnar_cache.read_cache(csv_path, mmap=True)
+    pd.testing.assert_frame_equal(df, expected)
+    # columns are built on top of the mapped file, except when pandas 1.x
+    #  or older copies them into its own blocks
+    if use_block_manager or int(pd.__version__.split('.')[0]) >= 2:
+        assert all(is_mapped(df[col].values) for col in df.columns)
+    assert not any(is_mapped(expected[col].values) for col in expected.columns)
+
+
+def test_typed_columns(csv_path):
+    raw = columnar_cache.parse_csv(csv_path)
+    df = columnar_cache.load_dataframe(csv_path)
+
+    assert df['page_id'].dtype == np.int32
+    assert df['page_ns'].dtype == np.int16
+    assert df['timestamp'].dtype == raw['timestamp'].dtype
+    assert (df['page_title'].astype(str).values == raw['page_title'].astype(str).values).all()
+
+    # registered users keep their ids, ips get negative surrogates
+    anonymous = (raw['contributor_name'] == 'Anonymous').values
+    registered_ids = pd.to_numeric(raw['contributor_id'][~anonymous])
+    assert (df['contributor_id'].values[~anonymous] == registered_ids.values).all()
+    assert (df['contributor_id'].values[anonymous] < 0).all()
+    assert df['contributor_id'][anonymous].nunique() == raw['contributor_id'][anonymous].nunique()
+
+
+def test_cache_is_reused(csv_path, monkeypatch):
+    columnar_cache.load_dataframe(csv_path)
+
+    def fail(csv_path):
+        raise AssertionError('csv parsed again')
+
+    monkeypatch.setattr(columnar_cache, 'parse_csv', fail)
+    columnar_cache.load_dataframe(csv_path)
+
+
+def test_cache_invalidated_by_csv_changes(csv_path):
+    columnar_cache.load_dataframe(csv_path)
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert columnar_cache.read_cache(csv_path) is None
+    pd.testing.assert_frame_equal(columnar_cache.load_dataframe(csv_path),
+            columnar_cache.to_typed_dataframe(columnar_cache.parse_csv(csv_path)))
+    assert columnar_cache.read_cache(csv_path) is not None
+
+
+def test_invalid_cache_is_rebuilt(csv_path):
+    expected = columnar_cache.to_typed_dataframe(columnar_cache.parse_csv(csv_path))
+    with open(columnar_cache.get_cache_path(csv_path), 'wb') as cache_file:
+        cache_file.write(b'not a columnar file')
+
+    pd.testing.assert_frame_equal(columnar_cache.load_dataframe(csv_path), expected)
+    pd.testing.assert_frame_equal(columnar_cache.read_cache(csv_path), expected)
+
+
+def test_unreadable_cache_is_ignored(csv_path):
+    expected = columnar_cache.load_dataframe(csv_path)
+    cache_path = columnar_cache.get_cache_path(csv_path)
+    with open(cache_path, 'r+b') as cache_file:
+        cache_file.truncate(len(columnar_cache.MAGIC) + 16)
+
+    with pytest.warns(UserWarning, match='unreadable columnar cache'):
+        df = columnar_cache.load_dataframe(csv_path)
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_prepared_cache(csv_path):
+    df = columnar_cache.load_dataframe(csv_path)
+    df.sort_values(by='timestamp', inplace=True)
+    bots_ids = [int(df['contributor_id'].max())]
+    prepared = df[~df['contributor_id'].isin(bots_ids)]
+    columnar_cache.write_prepared_cache(prepared, csv_path, bots_ids)
+
+    pd.testing.assert_frame_equal(columnar_cache.read_prepared_cache(csv_path, bots_ids), prepared)
+    assert columnar_cache.read_prepared_cache(csv_path, []) is None
+    assert columnar_cache.read_prepared_cache(csv_path, None) is None
+
+
+def test_parse_contributor_ids():
+    with pytest.warns(UserWarning, match='invalid contributor id'):
+        assert columnar_cache.parse_contributor_ids(['1', 2, '127.0.0.1', None, '30']) == [1, 2, 30]
@@ -0,0 +1,179 @@
+"""
+   test_data_store.py
+
+   Descp: Tests of the process-wide store of the wikis data.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from wikichron.utils import data_store
+from wikichron.utils.data_store import WikiDataStore
+
+
+SMALL_WIKIS = ['200movies.wikia.com.csv', 'es.lagunanegra.wikia.com.csv', 'de.undertale.wikia.com.csv']
+
+
+@pytest.fixture
+def wikis(bundled_wikis, wiki_data_dir, tmp_path):
+    """ The small bundled wikis, copied to tmp_path """
+    wikis = [wiki for wiki in bundled_wikis if wiki['data'] in SMALL_WIKIS]
+    for wiki in wikis:
+        shutil.copy(os.path.join(wiki_data_dir, wiki['data']), str(tmp_path))
+    return wikis
+
+
+def get_store(tmp_path, max_bytes=2**40):
+    return WikiDataStore(str(tmp_path), max_bytes)
+
+
+def test_get_prepared_data(wikis, tmp_path):
+    store = get_store(tmp_path)
+    for wiki in wikis:
+        csv_path = os.path.join(str(tmp_path), wiki['data'])
+        df = store.get(wiki)
+        expected = data_store.prepare_wiki_data(csv_path, data_store.get_bots_ids(wiki))
+
+        assert df.index.name == wiki['data']
+        assert df['timestamp'].is_monotonic_increasing
+        assert not df['contributor_id'].isin(data_store.get_bots_ids(wiki)).any()
+        pd.testing.assert_frame_equal(df, expected)
+
+
+def test_hits_and_misses(wikis, tmp_path):
+    store = get_store(tmp_path)
+    store.get(wikis[0])
+    store.get(wikis[0])
+    store.get(wikis[1])
+    store.get(wikis[0])
+
+    stats = store.get_stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (2, 2, 0)
+    assert stats['wikis'] == [wikis[1]['data'], wikis[0]['data']]
+
+
+def test_get_returns_shallow_copies(wikis, tmp_path):
+    store = get_store(tmp_path)
+    df = store.get(wikis[0])
+    df['extra'] = 1
+    df.reset_index(drop=True, inplace=True)
+    df.sort_values(by='page_id', inplace=True)
+
+    again = store.get(wikis[0])
+    assert 'extra' not in again.columns
+    assert again.index.name == wikis[0]['data']
+    assert again['timestamp'].is_monotonic_increasing
+
+
+def test_eviction(wikis, tmp_path):
+    sizes = {wiki['data']: data_store.get_dataframe_nbytes(get_store(tmp_path).get(wiki))
+                for wiki in wikis}
+    a, b, c = wikis
+    store = get_store(tmp_path, sizes[a['data']] + sizes[b['data']] + sizes[c['data']] - 1)
+
+    store.get(a)
+    store.get(b)
+    store.get(a) # a is now the most recently used one
+    store.get(c)
+
+    stats = store.get_stats()
+    assert stats['evictions'] == 1
+    assert stats['wikis'] == [a['data'], c['data']]
+    assert stats['bytes'] <= stats['max_bytes']
+
+    store.get(b)
+    assert store.get_stats()['misses'] == 4
+
+
+def test_eviction_keeps_last_wiki(wikis, tmp_path):
+    store = get_store(tmp_path, 1)
+    for wiki in wikis:
+        assert len(store.get(wiki))
+        assert store.get_stats()['wikis'] == [wiki['data']]
+    assert store.evictions == len(wikis) - 1
+
+
+def test_reloaded_when_csv_changes(wikis, tmp_path):
+    store = get_store(tmp_path)
+    df = store.get(wikis[0])
+    fingerprint = store.get_fingerprint(df)
+
+    csv_path = os.path.join(str(tmp_path), wikis[0]['data'])
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    df = store.get(wikis[0])
+    assert store.misses == 2
+    # the fingerprint only depends on the content of the csv
+    assert store.get_fingerprint(df) == fingerprint
+
+    with open(csv_path, 'r+b') as csv_file:
+        content = csv_file.read()
+        csv_file.seek(0)
+        # the same size, but not the same data
+        csv_file.write(content.replace(b'2', b'3', 1))
+    df = store.get(wikis[0])
+    assert store.misses == 3
+    assert store.get_fingerprint(df) != fingerprint
+
+
+def test_reloaded_when_bots_change(wikis, tmp_path):
+    store = get_store(tmp_path)
+    wiki = dict(wikis[0])
+    n_rows = len(store.get(wiki))
+
+    del wiki['bots']
+    with pytest.warns(UserWarning, match='bots'):
+        assert len(store.get(wiki)) >= n_rows
+    assert store.misses == 2
+
+
+def test_is_stored(wikis, tmp_path):
+    store = get_store(tmp_path)
+    df = store.get(wikis[0])
+
+    assert store.is_stored(df)
+    assert store.get_fingerprint(df) is not None
+    assert not store.is_stored(df.iloc[:len(df)//2])
+    assert store.get_fingerprint(df.iloc[:len(df)//2]) is None
+
+
+def test_get_derived(wikis, tmp_path):
+    store = get_store(tmp_path)
+    df = store.get(wikis[0])
+    nbytes = store.get_nbytes()
+    calls = []
+
+    class Derived:
+        nbytes = 1000
+
+        def __init__(self, df):
+            calls.append(len(df))
+
+    first = store.get_derived(df, 'derived', Derived)
+    assert store.get_derived(store.get(wikis[0]), 'derived', Derived) is first
+    assert calls == [len(df)]
+    assert store.get_nbytes() == nbytes + Derived.nbytes
+
+    # filtered data is not memoized
+    filtered = df.iloc[:len(df)//2]
+    assert store.get_derived(filtered, 'derived', Derived) is not first
+    assert store.get_derived(filtered, 'derived', Derived) is not first
+    assert calls == [len(df), len(filtered), len(filtered)]
+
+
+def test_get_derived_evicted_with_wiki(wikis, tmp_path):
+    store = get_store(tmp_path, 1)
+    df = store.get(wikis[0])
+    first = store.get_derived(df, 'derived', lambda df: object())
+    store.get(wikis[1])
+
+    df = store.get(wikis[0])
+    assert store.get_derived(df, 'derived', lambda df: object()) is not first
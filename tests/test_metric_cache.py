@@ -0,0 +1,168 @@
+"""
+   test_metric_cache.py
+
+   Descp: Tests of the cache of metric cells and of their computation with
+      every kind of executor.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import pandas as pd
+import pytest
+
+from wikichron.utils import executor
+from wikichron.utils import metric_cache
+from wikichron.dash.apps.classic import data_controller
+from wikichron.dash.apps.classic.data_controller import read_data
+from wikichron.dash.apps.classic.metrics.interface import (get_available_metrics,
+                                                compute_metrics_on_dataframe)
+
+METRICS = ['edits', 'users_new', 'gini_accum', 'returning_new_editors']
+SMALL_WIKIS = ['200movies.wikia.com.csv', 'es.lagunanegra.wikia.com.csv']
+
+
+class DictCache:
+    """ The part of the Flask-Caching Cache API load_cells() uses """
+
+    def __init__(self):
+        self.values = {}
+
+    def get_many(self, *keys):
+        return [self.values.get(key) for key in keys]
+
+    def set_many(self, mapping, timeout=None):
+        self.values.update(mapping)
+
+
+@pytest.fixture
+def wikis(bundled_wikis):
+    return [wiki for wiki in bundled_wikis if wiki['data'] in SMALL_WIKIS]
+
+
+@pytest.fixture
+def metrics():
+    metrics_by_function = {metric.func.__name__: metric for metric in get_available_metrics()}
+    return [metrics_by_function[name] for name in METRICS]
+
+
+@pytest.fixture(params=['serial', 'thread', 'process'])
+def executor_kind(request, monkeypatch):
+    monkeypatch.setattr(executor, 'EXECUTOR_KIND', request.param)
+    monkeypatch.setattr(executor, 'WORKERS', 2)
+    monkeypatch.setattr(executor, '_executor', None)
+    yield request.param
+    if executor._executor is not None:
+        executor._executor.shutdown()
+
+
+def assert_same_cells(data, wikis, metrics):
+    for wiki_idx, wiki in enumerate(wikis):
+        expected = compute_metrics_on_dataframe(metrics, read_data(wiki))
+        for metric_idx in range(len(metrics)):
+            pd.testing.assert_series_equal(data[metric_idx][wiki_idx], expected[metric_idx])
+
+
+def test_load_cells(executor_kind, wikis, metrics):
+    cache = DictCache()
+    data = metric_cache.load_cells(cache, 'classic', wikis, metrics, read_data,
+                                    compute_metrics_on_dataframe)
+
+    assert len(data) == len(metrics)
+    assert all(len(metric_data) == len(wikis) for metric_data in data)
+    assert_same_cells(data, wikis, metrics)
+    assert len(cache.values) == len(wikis) * len(metrics)
+
+
+def test_only_missing_cells_are_computed(wikis, metrics, monkeypatch):
+    # calculate() is not picklable, so it's run in this process
+    monkeypatch.setattr(executor, 'EXECUTOR_KIND', 'serial')
+    cache = DictCache()
+    computed = []
+
+    def calculate(metrics, df):
+        computed.extend((df.index.name, metric.code) for metric in metrics)
+        return compute_metrics_on_dataframe(metrics, df)
+
+    metric_cache.load_cells(cache, 'classic', wikis[:1], metrics[:2], read_data, calculate)
+    assert len(computed) == 2
+
+    # adding a wiki and a metric, and reordering them
+    computed.clear()
+    data = metric_cache.load_cells(cache, 'classic', wikis[::-1], metrics[2::-1], read_data, calculate)
+    assert sorted(computed) == sorted([(wikis[1]['data'], metric.code) for metric in metrics[:3]]
+                                    + [(wikis[0]['data'], metrics[2].code)])
+    assert_same_cells(data, wikis[::-1], metrics[2::-1])
+
+    computed.clear()
+    metric_cache.load_cells(cache, 'classic', wikis, metrics[:3], read_data, calculate)
+    assert computed == []
+
+    # other namespaces don't share cells
+    metric_cache.load_cells(cache, 'monowiki', wikis[:1], metrics[:1], read_data, calculate)
+    assert len(computed) == 1
+
+
+def test_cell_keys(wikis, metrics):
+    fingerprint = metric_cache.get_data_fingerprint(wikis[0])
+    key = metric_cache.get_cell_key('classic', wikis[0], fingerprint, metrics[0])
+    assert key == 'classic/{}/{}/{}'.format(wikis[0]['domain'], fingerprint, metrics[0].code)
+
+    # metadata of the wikis don't take part in the keys
+    wiki = dict(wikis[0], name='Other name')
+    assert metric_cache.get_cell_key('classic', wiki, fingerprint, metrics[0]) == key
+
+
+def test_selection_token(wikis, metrics):
+    token = metric_cache.get_selection_token('classic', wikis, metrics)
+    assert metric_cache.get_selection_token('classic', wikis, metrics) == token
+    assert metric_cache.get_selection_token('classic', wikis, metrics[::-1]) != token
+    assert metric_cache.get_selection_token('classic', wikis[:1], metrics) != token
+    assert metric_cache.get_selection_token('monowiki', wikis, metrics) != token
+
+
+def test_selection_result(monkeypatch):
+    monkeypatch.setattr(metric_cache, 'results', metric_cache.ResultsStore(2))
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return value
+
+    assert metric_cache.get_selection_result('a', lambda: compute(1)) == 1
+    assert metric_cache.get_selection_result('a', lambda: compute(2)) == 1
+    assert metric_cache.get_selection_result('b', lambda: compute(3)) == 3
+    metric_cache.get_selection_result('a', lambda: compute(4))
+    assert metric_cache.get_selection_result('c', lambda: compute(5)) == 5
+    # b was the least recently used one
+    assert metric_cache.get_selection_result('b', lambda: compute(6)) == 6
+    assert calls == [1, 3, 5, 6]
+
+
+def test_selection_data_checks_token(wikis, metrics, monkeypatch):
+    monkeypatch.setattr(metric_cache, 'results', metric_cache.ResultsStore(2))
+    computed = []
+
+    def load_and_compute_data(wikis, metrics):
+        computed.append([wiki['data'] for wiki in wikis])
+        return computed[-1]
+
+    # it's defined by set_cache()
+    monkeypatch.setattr(data_controller, 'load_and_compute_data', load_and_compute_data,
+                        raising=False)
+    token = data_controller.compute_selection(wikis, metrics)
+    assert data_controller.get_selection_data(token, wikis, metrics) == computed[0]
+    assert len(computed) == 1
+
+    # the token of another selection doesn't give its data
+    assert data_controller.get_selection_data(token, wikis[:1], metrics) == [wikis[0]['data']]
+    assert data_controller.get_selection_data('forged', wikis, metrics) == computed[0]
+    assert len(computed) == 3
+
+
+def test_run_tasks(executor_kind):
+    executor.start_executor()
+    assert executor.run_tasks(pow, [(2, n) for n in range(10)]) == [2**n for n in range(10)]
+    assert executor.run_tasks(pow, []) == []
+    assert executor.splits_metrics() == (executor_kind == 'thread')
@@ -0,0 +1,161 @@
+"""
+   test_monowiki_metrics.py
+
+   Descp: Tests of the sparse per-wiki tables of the monowiki metrics (the
+      edits matrix and the contributor-month table) and of the equivalence
+      of the metrics built on them with their original implementation (see
+      reference/monowiki_stats.py) on the bundled wikis.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wikichron.dash.apps.monowiki.metrics import monowiki_stats
+from wikichron.dash.apps.monowiki.metrics.edits_matrix import EditsMatrix
+from wikichron.dash.apps.monowiki.metrics.contributor_months import ContributorMonths
+
+from reference import monowiki_stats as original_stats
+
+METRICS = [
+    'current_streak',
+    'current_streak_only_mains',
+    'edits_by_current_streak',
+    'edits_by_current_streak_only_mains',
+    'users_first_edit',
+    'users_first_edit_abs',
+    'users_last_edit',
+    'users_last_edit_abs',
+    'users_number_of_edits',
+    'number_of_edits_by_experience_abs',
+    'number_of_edits_by_experience_rel',
+    'number_of_edits_by_tenure',
+    'number_of_edits_by_tenure_abs',
+    'number_of_edits_by_last_edit',
+    'number_of_edits_by_last_edit_abs',
+    'contributor_pctg_per_contributions_pctg',
+]
+
+
+@pytest.fixture
+def small_data():
+    """ Edits of two registered users and an anonymous one along five months """
+    return pd.DataFrame({
+        'page_id':          [1, 2, 1, 3, 1, 2, 2],
+        'page_ns':          [0, 1, 0, 0, 0, 0, 1],
+        'contributor_id':   [20, 10, 10, -1, 10, 20, 10],
+        'contributor_name': ['B', 'A', 'A', 'Anonymous', 'A', 'B', 'A'],
+        'timestamp': pd.to_datetime(['2018-01-03', '2018-01-10', '2018-02-01', '2018-02-02',
+                                    '2018-02-28', '2018-05-01', '2018-05-15']),
+    })
+
+
+def test_edits_matrix(small_data):
+    matrix = EditsMatrix(small_data)
+
+    assert list(matrix.index) == list(pd.date_range('2018-01-01', periods=5, freq='MS'))
+    assert matrix.contributors.tolist() == [-1, 10, 20]
+    assert matrix.monthly.toarray().tolist() == [
+        [0, 1, 0, 0, 0],
+        [1, 2, 0, 0, 1],
+        [1, 0, 0, 0, 1],
+    ]
+    assert matrix.registered.tolist() == [1, 2]
+    assert matrix.registered_monthly.toarray().tolist() == [[1, 2, 0, 0, 1], [1, 0, 0, 0, 1]]
+    assert matrix.registered_cumulative.tolist() == [[1, 3, 3, 3, 4], [1, 1, 1, 1, 2]]
+
+
+def test_contributor_months(small_data):
+    table = ContributorMonths(small_data).table
+
+    assert table['contributor_id'].tolist() == [10, 10, 10, 20, 20]
+    assert table['timestamp'].tolist() == list(pd.to_datetime(
+                ['2018-01-01', '2018-02-01', '2018-05-01', '2018-01-01', '2018-05-01']))
+    assert table['medits'].tolist() == [1, 2, 1, 1, 1]
+    assert table['nEdits'].tolist() == [1, 3, 4, 1, 2]
+    assert table['nEdits_until_previous_month'].tolist() == [-1, 1, 3, -1, 1]
+    assert table['tenure'].tolist() == [0, 1, 4, 0, 4]
+    assert table['months_since_previous'].tolist() == [0, 1, 3, 0, 4]
+    assert table['first_month'].tolist() == [True, False, False, True, False]
+    assert table['streak'].tolist() == [1, 2, 1, 1, 1]
+
+
+def test_sparse_tables_of_empty_data(small_data):
+    empty = small_data.iloc[:0]
+    assert EditsMatrix(empty).monthly.shape == (0, 0)
+    contributor_months = ContributorMonths(empty)
+    assert contributor_months.table.empty
+    assert len(contributor_months.users_per_month(contributor_months.table['streak'] >= 1, None)) == 0
+
+
+def test_contributor_months_of_wiki(wiki_df):
+    contributor_months = ContributorMonths(wiki_df)
+    table = contributor_months.table
+
+    # the same as grouping the edits of every registered user by month
+    registered = original_stats.filter_anonymous(wiki_df)
+    expected = registered.groupby(['contributor_id', pd.Grouper(key='timestamp', freq='MS')]) \
+                            .size().to_frame('medits').reset_index()
+    expected['nEdits'] = expected.groupby('contributor_id')['medits'].cumsum()
+
+    assert table['contributor_id'].tolist() == expected['contributor_id'].tolist()
+    assert table['timestamp'].tolist() == expected['timestamp'].tolist()
+    assert table['medits'].tolist() == expected['medits'].tolist()
+    assert table['nEdits'].tolist() == expected['nEdits'].tolist()
+    assert (contributor_months.index[contributor_months.month] == table['timestamp']).all()
+
+
+def test_edits_matrix_of_wiki(wiki_df):
+    matrix = EditsMatrix(wiki_df)
+    index = monowiki_stats.calculate_index_all_months(wiki_df)
+    assert list(matrix.index) == list(index)
+
+    expected = wiki_df.groupby(['contributor_id', pd.Grouper(key='timestamp', freq='MS')]).size() \
+                        .unstack(fill_value=0).reindex(columns=index, fill_value=0)
+    assert matrix.contributors.tolist() == expected.index.tolist()
+    assert (matrix.monthly.toarray() == expected.values).all()
+    assert matrix.monthly.sum() == len(wiki_df)
+
+
+def test_accum_number_of_edits_equivalent_to_original(wiki_df):
+    index = monowiki_stats.calculate_index_all_months(wiki_df)
+    expected = original_stats.get_accum_number_of_edits_until_each_month(wiki_df.copy(), index)
+    df = monowiki_stats.get_accum_number_of_edits_until_each_month(wiki_df, index)
+
+    pd.testing.assert_frame_equal(df.reset_index(drop=True), expected.reset_index(drop=True),
+                                check_dtype=False, check_index_type=False)
+
+
+@pytest.mark.parametrize('metric', METRICS)
+def test_equivalent_to_original(metric, wiki_df):
+    index = monowiki_stats.calculate_index_all_months(wiki_df)
+    # the original metrics may modify the data they get
+    expected = getattr(original_stats, metric)(wiki_df.copy(), index)
+    result = getattr(monowiki_stats, metric)(wiki_df, index)
+
+    assert len(result) == len(expected)
+    for series, expected_series in zip(result, expected):
+        if not isinstance(expected_series, pd.Series):
+            assert series == expected_series
+            continue
+        assert series.name == expected_series.name
+        # see test_equivalent_to_original() of test_classic_metrics.py
+        assert list(series.index) == list(expected_series.index)
+        pd.testing.assert_series_equal(series.astype(float).reset_index(drop=True),
+                    expected_series.astype(float).reset_index(drop=True), check_names=False)
+
+
+def test_metrics_do_not_modify_data(wiki_df):
+    index = monowiki_stats.calculate_index_all_months(wiki_df)
+    columns = list(wiki_df.columns)
+    timestamps = wiki_df['timestamp'].values.copy()
+
+    for metric in METRICS:
+        getattr(monowiki_stats, metric)(wiki_df, index)
+
+    assert list(wiki_df.columns) == columns
+    assert np.array_equal(wiki_df['timestamp'].values, timestamps)
@@ -0,0 +1,179 @@
+"""
+   test_network_builders.py
+
+   Descp: Tests of the bulk builders of the co-editing, talk pages and user
+      talk networks (graph_builder.py) and of their time windows
+      (windows.py), which must build the same graphs as the original
+      networks (see reference/networks.py) on the bundled wikis.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import numpy as np
+import pytest
+
+from wikichron.dash.apps.networks.networks.models import windows
+from wikichron.dash.apps.networks.networks.models import graph_builder
+from wikichron.dash.apps.networks.networks.models.CoEditingNetwork import CoEditingNetwork
+from wikichron.dash.apps.networks.networks.models.TalkPagesNetwork import TalkPagesNetwork
+from wikichron.dash.apps.networks.networks.models.UserTalkNetwork import UserTalkNetwork
+
+from reference import networks as original_networks
+
+NETWORKS = [
+    (CoEditingNetwork, original_networks.CoEditingNetwork),
+    (TalkPagesNetwork, original_networks.TalkPagesNetwork),
+    (UserTalkNetwork, original_networks.UserTalkNetwork),
+]
+
+
+def get_edges(graph):
+    """ Weight of every edge, by the ids of its nodes """
+    edges = {}
+    for edge in graph.es:
+        source = graph.vs[edge.source]['id']
+        target = graph.vs[edge.target]['id']
+        assert {edge['source'], edge['target']} == {source, target}
+        assert edge['id'] == (edge['source'] << 32) + edge['target']
+        key = (source, target) if graph.is_directed() else frozenset((source, target))
+        assert key not in edges
+        edges[key] = edge['weight']
+    return edges
+
+
+def assert_same_graph(graph, expected):
+    assert graph.is_directed() == expected.is_directed()
+    assert graph.vcount() == expected.vcount()
+    assert sorted(graph.vs.attributes()) == sorted(expected.vs.attributes())
+    for attribute in expected.vs.attributes():
+        assert list(graph.vs[attribute]) == list(expected.vs[attribute]), attribute
+    assert sorted(graph.es.attributes()) == sorted(expected.es.attributes())
+    assert get_edges(graph) == get_edges(expected)
+    assert {key: graph[key] for key in graph.attributes()} == \
+            {key: expected[key] for key in expected.attributes()}
+
+
+def get_time_windows(df):
+    """ Some (lower_bound, upper_bound) windows of the slider for df """
+    months = df['timestamp'].dt.to_period('M').unique()
+    first = months[0]
+    middle = months[len(months) // 3]
+    last = months[len(months) // 2]
+    return [
+        (str(first.start_time), str(months[-1].end_time.floor('D'))),
+        (str(middle.start_time), str(last.end_time.floor('D'))),
+        (str(first.start_time), str(first.end_time.floor('D'))),
+        (str(months[-1].start_time), str(months[-1].end_time.floor('D'))),
+        ('1990-01-01', '1990-12-31'),
+    ]
+
+
+@pytest.mark.parametrize('network_class, original_class', NETWORKS,
+                        ids=lambda cls: cls.__name__)
+def test_equivalent_to_original(network_class, original_class, wiki, wiki_df):
+    dff = network_class().filter_anonymous(wiki_df)
+    network = network_class(alias=wiki['name'])
+    original = original_class(alias=wiki['name'])
+    network.generate_from_pandas(dff)
+    original.generate_from_pandas(dff)
+
+    assert_same_graph(network.graph, original.graph)
+    if network.graph.is_directed():
+        assert [edge.tuple for edge in network.graph.es] == [edge.tuple for edge in original.graph.es]
+
+
+@pytest.mark.parametrize('network_class, original_class', NETWORKS,
+                        ids=lambda cls: cls.__name__)
+def test_windows_equivalent_to_original(network_class, original_class, wiki, wiki_df):
+    for lower_bound, upper_bound in get_time_windows(wiki_df):
+        network = network_class(alias=wiki['name'])
+        original = original_class(alias=wiki['name'])
+        assert network.generate_from_windows(wiki_df, lower_bound, upper_bound)
+        original.generate_from_pandas(original.filter_anonymous(
+                    original.filter_by_time(wiki_df, lower_bound, upper_bound)))
+
+        assert_same_graph(network.graph, original.graph)
+
+
+@pytest.mark.parametrize('network_class, original_class', NETWORKS,
+                        ids=lambda cls: cls.__name__)
+def test_build_network_equivalent_to_original(network_class, original_class, wiki, wiki_df):
+    lower_bound, upper_bound = get_time_windows(wiki_df)[1]
+    network = network_class(alias=wiki['name'])
+    original = original_class(alias=wiki['name'])
+    original.generate_from_windows = lambda df, lower_bound, upper_bound: False
+    network.build_network(wiki_df, lower_bound, upper_bound)
+    original.build_network(wiki_df, lower_bound, upper_bound)
+
+    assert_same_graph(network.graph, original.graph)
+
+
+def test_no_windows_for_filtered_data(wiki, wiki_df):
+    network = CoEditingNetwork(alias=wiki['name'])
+    assert not network.generate_from_windows(wiki_df.iloc[:len(wiki_df)//2], '', '')
+
+
+def test_co_edition_checkpoints(wiki_df):
+    dff = CoEditingNetwork().filter_anonymous(wiki_df)
+    co_edition = windows.CoEditionWindows.from_dataframe(dff)
+    n_rows = len(dff)
+    assert co_edition.checkpoint_bounds[0] == 0
+    assert co_edition.checkpoint_bounds[-1] == n_rows
+
+    bounds = [0, n_rows] + list(co_edition.checkpoint_bounds) \
+            + list(np.random.RandomState(0).randint(0, n_rows + 1, 20))
+    for start in bounds:
+        for end in bounds:
+            if start > end:
+                continue
+            counts = co_edition.get_counts(start, end)
+            expected = co_edition.count(start, end)
+            assert (counts != expected).nnz == 0
+            assert counts.sum() == end - start
+
+
+def test_precooked_windows(wiki, wiki_df, tmp_path, monkeypatch):
+    network = CoEditingNetwork(alias=wiki['name'])
+    built = network.build_windows(wiki_df)
+    monkeypatch.setattr(windows, 'precooked_dir', str(tmp_path))
+    windows.write_precooked(built, wiki_df, network.CODE)
+
+    loaded = windows.load_precooked(wiki_df, network.CODE)
+    assert isinstance(loaded, windows.CoEditionWindows)
+    assert np.array_equal(loaded.timestamp, built.timestamp)
+    assert np.array_equal(loaded.user_ids, built.user_ids)
+    assert list(loaded.names) == list(built.names)
+    assert np.array_equal(loaded.checkpoint_bounds, built.checkpoint_bounds)
+    assert np.array_equal(loaded.user_rows, built.user_rows)
+    assert len(loaded.checkpoints) == len(built.checkpoints)
+    for checkpoint, expected in zip(loaded.checkpoints, built.checkpoints):
+        assert (checkpoint != expected).nnz == 0
+
+    # checkpoints are loaded, not counted again
+    monkeypatch.setattr(windows.CoEditionWindows, 'count', None)
+    assert windows.load_precooked(wiki_df, network.CODE) is not None
+
+    # precooked files of other data are not used
+    assert windows.load_precooked(wiki_df.iloc[:len(wiki_df)//2], network.CODE) is None
+    with pytest.raises(ValueError):
+        windows.write_precooked(built, wiki_df.iloc[:len(wiki_df)//2], network.CODE)
+
+
+def test_count_pairs():
+    first = np.array([2, 1, 0, 2, 0, 1, 2])
+    second = np.array([1, 0, 1, 0, 1, 0, 1])
+    firsts, seconds, counts = graph_builder.count_pairs(first, second, 2)
+
+    # sorted by first code and then in order of first appearance
+    assert list(zip(firsts.tolist(), seconds.tolist(), counts.tolist())) == \
+            [(0, 1, 2), (1, 0, 2), (2, 1, 2), (2, 0, 1)]
+
+
+def test_co_occurrence_edges():
+    users_pages = graph_builder.incidence_matrix(np.array([0, 1, 1, 2, 2, 0, 2]),
+                                                np.array([0, 0, 0, 1, 0, 1, 2]), (4, 3))
+    sources, targets, weights = graph_builder.co_occurrence_edges(users_pages)
+    assert list(zip(sources.tolist(), targets.tolist(), weights.tolist())) == \
+            [(0, 1, 1), (0, 2, 2), (1, 2, 1)]
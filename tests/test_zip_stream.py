@@ -0,0 +1,104 @@
+"""
+   test_zip_stream.py
+
+   Descp: Tests of the zip archives streamed for the downloads.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import io
+import zipfile
+
+import flask
+import numpy as np
+import pandas as pd
+import pytest
+
+from wikichron.utils import zip_stream
+
+
+def read_zip(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as zip_file:
+        assert zip_file.testzip() is None
+        return {name: zip_file.read(name) for name in zip_file.namelist()}
+
+
+def test_stream_zip():
+    files = [
+        ('a.txt', [b'first chunk, ', b'second chunk']),
+        ('empty.txt', []),
+        ('dir/b.bin', [bytes(range(256)) * 1000]),
+    ]
+    data = b''.join(zip_stream.stream_zip(files))
+
+    assert read_zip(data) == {name: b''.join(chunks) for name, chunks in files}
+
+
+def test_stream_zip_is_lazy():
+    # random bytes, so they can't be held back by the compressor
+    random_bytes = np.random.RandomState(0).bytes
+    contents = [random_bytes(10000) for _ in range(100)]
+    produced = []
+
+    def chunks():
+        for content in contents:
+            produced.append(content)
+            yield content
+
+    stream = zip_stream.stream_zip([('big.bin', chunks())])
+    sent = []
+    while sum(map(len, sent)) < 50000:
+        sent.append(next(stream))
+    assert len(produced) < len(contents)
+
+    sent.extend(stream)
+    assert read_zip(b''.join(sent)) == {'big.bin': b''.join(contents)}
+
+
+def test_csv_chunks(wiki_df):
+    chunks = list(zip_stream.csv_chunks(wiki_df, chunk_rows=1000))
+
+    assert len(chunks) == -(-len(wiki_df) // 1000)
+    assert b''.join(chunks).decode() == wiki_df.to_csv()
+
+
+def test_csv_chunks_of_empty_dataframe(wiki_df):
+    empty = wiki_df.iloc[:0]
+    assert b''.join(zip_stream.csv_chunks(empty)).decode() == empty.to_csv()
+
+
+def test_dataframe_files(wiki_df):
+    named_dataframes = [('first', wiki_df.iloc[:500]), ('second', wiki_df.iloc[500:])]
+    data = b''.join(zip_stream.stream_zip(zip_stream.dataframe_files(named_dataframes)))
+
+    assert read_zip(data) == {
+        'first.csv': wiki_df.iloc[:500].to_csv().encode(),
+        'second.csv': wiki_df.iloc[500:].to_csv().encode(),
+    }
+
+
+@pytest.mark.skipif(not zip_stream.is_parquet_available(), reason='No parquet engine installed')
+def test_parquet_files():
+    df = pd.DataFrame({0: [1, 2, 3], 'b': ['x', 'y', 'z']})
+    data = b''.join(zip_stream.stream_zip(zip_stream.dataframe_files([('df', df)], 'parquet')))
+
+    parquet = pd.read_parquet(io.BytesIO(read_zip(data)['df.parquet']))
+    assert list(parquet.columns) == ['0', 'b']
+    assert parquet['0'].tolist() == [1, 2, 3]
+    assert parquet['b'].tolist() == ['x', 'y', 'z']
+
+
+def test_send_zip():
+    app = flask.Flask('wikichron')
+    files = [('a.csv', [b'a,b\n', b'1,2\n'])]
+
+    with app.test_request_context():
+        response = zip_stream.send_zip(files, 'data.zip')
+        assert response.mimetype == 'application/zip'
+        assert response.headers['Content-Disposition'] == 'attachment; filename="data.zip"'
+        assert response.is_streamed
+        data = b''.join(response.response)
+
+    assert read_zip(data) == {'a.csv': b'a,b\n1,2\n'}
@@ -9,3 +9,5 @@ class DevelopmentConfig(object):
     APP_HOSTNAME = f'localhost:{PORT}'
     DEBUG = True
     VERSION = __version__
+    # serve the size of the caches in /cacheStats.json
+    CACHE_STATS = os.getenv('WIKICHRON_CACHE_STATS', '').lower() in ('1', 'true')
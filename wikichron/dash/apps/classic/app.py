@@ -10,7 +10,6 @@
    Copyright 2017-2018 Abel 'Akronix' Serrano Juste <akronix5@gmail.com>
 """
 # Python built-in imports
-import flask
 import glob
 import os
 import json
@@ -19,8 +18,6 @@ import time
 from warnings import warn
 from urllib.parse import parse_qs, urljoin
 from codecs import decode
-from io import BytesIO
-import zipfile
 
 # Dash framework imports
 import dash
@@ -39,6 +36,7 @@ import pandas as pd
 import redis
 
 # Local imports:
+from wikichron.utils import zip_stream
 from .utils import get_mode_config
 from .metrics import interface as interface
 from . import cache
@@ -308,45 +306,29 @@ def start_download_data_server(app, download_pathname):
 
         (wikis, metrics) = extract_wikis_and_metrics_from_selection_dict(selection)
 
-        data = data_controller.load_and_compute_data(wikis, metrics)
+        file_format = selection.get('format', ['csv'])[0]
+        if file_format not in zip_stream.FORMATS:
+            return 'Unknown download format: {}'.format(file_format)
+        if file_format == 'parquet' and not zip_stream.is_parquet_available():
+            return 'Parquet downloads are not available!'
 
-        # output in-memory zip file
-        in_memory_zip = BytesIO()
-        zipfile_ob = zipfile.ZipFile(in_memory_zip, mode='w',
-                                    compression=zipfile.ZIP_DEFLATED)
+        token = data_controller.compute_selection(wikis, metrics)
+        data = data_controller.get_selection_data(token, wikis, metrics)
 
-        # For each wiki, create a DataFrame and add a column for the data of
-        #   each metric.
-        # Then, generate a csv for that DataFrame and append it to the output zip file
+        # For each wiki, create a DataFrame with a column for the data of
+        #   each metric, which is streamed to the output zip file while the
+        #   DataFrame of the next wiki is not yet built.
         # Remember this is the structure of data: data[metric][wiki]
-        for wiki_idx in range(len(data[0])):
-
-            # These two following lines are equivalent to the other next 3 lines
-            #   but they are, probably, more difficult to understand and
-            #  to maintain, although probably more pandas-ish:
-            #~ metrics_data_for_this_wiki = [metric[wiki_idx] for metric in data ]
-            #~ wiki_df = pd.concat(metrics_data_for_this_wiki, axis=1)
-
-            wiki_df = pd.DataFrame()
-            for metric in data:
-                # assign the name of the metric as the name of the column for its data:
-                wiki_df[metric[wiki_idx].name] = metric[wiki_idx]
-
-            csv_str = wiki_df.to_csv()
-            # append dataframe csv to zip file with name of the wiki:
-            zipfile_ob.writestr('{}.csv'.format(wikis[wiki_idx]['name']), csv_str)
-
-        # testing zip format and integrity
-        error = zipfile_ob.testzip()
-        if error is None:
-            zipfile_ob.close()
-            in_memory_zip.seek(0) # move ByteIO cursor to the start
-            return flask.send_file(in_memory_zip, as_attachment=True,
-                        attachment_filename='computed_data.zip',
-                        mimetype='application/zip')
-        else:
-            zipfile_ob.close()
-            raise Exeption('There was an error compressing the data in a zip file: {}'.format(error))
+        def wikis_dataframes():
+            for wiki_idx in range(len(data[0])):
+                wiki_df = pd.DataFrame()
+                for metric in data:
+                    # assign the name of the metric as the name of the column for its data:
+                    wiki_df[metric[wiki_idx].name] = metric[wiki_idx]
+                yield (wikis[wiki_idx]['name'], wiki_df)
+
+        return zip_stream.send_zip(zip_stream.dataframe_files(wikis_dataframes(), file_format),
+                                    'computed_data.zip')
 
     return
 
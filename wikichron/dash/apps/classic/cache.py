@@ -13,6 +13,9 @@ def set_up_cache(app, debug):
             'CACHE_REDIS_URL': app.server.config['REDIS_URL']
         })
     else:
-        cache = Cache(app.server, config={'CACHE_TYPE': 'simple'})
+        cache = Cache(app.server, config={
+            # the 'simple' backend, which can also tell its size
+            'CACHE_TYPE': 'wikichron.utils.utils.simple_cache_with_stats'
+        })
 
     return cache
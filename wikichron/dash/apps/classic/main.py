@@ -65,6 +65,29 @@ def generate_graphs(data, metrics, wikis, relative_time):
 
 
 
+def get_graphs_view(selected_wikis, selected_metrics, selected_timerange,
+                    relative_time, time_axis_json):
+    """
+    Returns which wikis and metrics (their indexes) are visible in the
+    graphs, and the time range to show, if any.
+    """
+    # Show only the selected timerange in the slider.
+    new_timerange = list(selected_timerange) if selected_timerange else None
+
+    # In case we are displaying calendar dates, then we have to do a
+    # conversion from "relative dates" to the actual 'natural' date.
+    if new_timerange and not relative_time:
+        time_axis = pd.DatetimeIndex(json.loads(time_axis_json))
+        new_timerange[0] = time_axis[selected_timerange[0]]
+        new_timerange[1] = time_axis[selected_timerange[1]]
+
+    return {
+        'wikis': selected_wikis or [],
+        'metrics': selected_metrics or [],
+        'range': new_timerange
+    }
+
+
 def generate_main_content(wikis_arg, metrics_arg, relative_time_arg,
                             query_string):
     """
@@ -339,7 +362,9 @@ def generate_main_content(wikis_arg, metrics_arg, relative_time_arg,
             html.Div(id='signal-data', style={'display': 'none'}),
             html.Div(id='time-axis', className='time-index', style={'display': 'none'}),
             html.Div(id='ready', style={'display': 'none'}),
-            gdc.Import(src='/js/common/dash/sliderHandlerLabels.js')
+            html.Div(id='graphs-view', style={'display': 'none'}),
+            gdc.Import(src='/js/common/dash/sliderHandlerLabels.js'),
+            gdc.Import(src='/js/classic/dash/graphs_view.js')
         ]
     );
 
@@ -360,9 +385,10 @@ def bind_callbacks(app):
         print('--> Retrieving and computing data')
         print( '\t for the following wikis: {}'.format( wikis_names ))
         print( '\tof the following metrics: {}'.format( metric_names ))
-        data = data_controller.load_and_compute_data(wikis, metrics)
+        # the data of the selection is kept server-side, under this token
+        token = data_controller.compute_selection(wikis, metrics)
         print('<-- Done retrieving and computing data!')
-        return True
+        return token
 
 
     @app.callback(
@@ -383,7 +409,7 @@ def bind_callbacks(app):
         wikis = selection['wikis']
         metrics = extract_metrics_objs_from_metrics_codes(selection['metrics'])
 
-        data = data_controller.load_and_compute_data(wikis, metrics)
+        data = data_controller.get_selection_data(signal, wikis, metrics)
 
         # get time axis of the oldest one and use it as base numbers for the slider:
         time_axis_index = data_controller.generate_longest_time_axis([ wiki for wiki in data[0] ],
@@ -417,19 +443,25 @@ def bind_callbacks(app):
 
     @app.callback(
         Output('graphs', 'children'),
-        [Input('ready', 'children')],
+        [Input('time-axis', 'children')],
         [State('wikis-selection-dropdown', 'value'),
         State('metrics-selection-dropdown', 'value'),
         State('dates-slider', 'value'),
         State('time-axis-selection', 'value'),
         State('initial-selection', 'children'),
-        State('time-axis', 'children')]
+        State('signal-data', 'children')]
     )
-    def update_graphs(ready,
+    def update_graphs(time_axis_json,
             selected_wikis, selected_metrics, selected_timerange,
-            selected_timeaxis, selection_json, time_axis_json):
+            selected_timeaxis, selection_json, token):
+        """
+        The graphs of every metric, with the traces of every wiki, are only
+        generated when the data or the time axis change. Afterwards, the
+        visible wikis and metrics and the time range are applied to them in
+        the browser (see update_graphs_view()).
+        """
 
-        if not ready: # waiting for all parameters to be ready
+        if not time_axis_json or not token or not selected_timeaxis: # waiting for all parameters to be ready
             return;
 
         # get wikis x metrics selection
@@ -437,7 +469,7 @@ def bind_callbacks(app):
         wikis = selection['wikis']
         metrics = extract_metrics_objs_from_metrics_codes(selection['metrics'])
 
-        data = data_controller.load_and_compute_data(wikis, metrics)
+        data = data_controller.get_selection_data(token, wikis, metrics)
 
         if debug:
             print('Updating graphs. Selection: [{}, {}, {}, {}]'.format(selected_wikis, selected_metrics, selected_timerange, selected_timeaxis))
@@ -452,47 +484,33 @@ def bind_callbacks(app):
         from sys import getsizeof
         print('Size of graphs in memory: {} bytes.'.format(getsizeof(new_graphs)))
 
-        for i, metric in enumerate(metrics):
-            for j, wiki in enumerate(wikis):
-                metric_data = new_graphs[i][j]
-                if relative_time:
-                    x_axis = list(range(len(metric_data.x))) # relative to the age of the wiki in months
-                else:
-                    x_axis = metric_data.x # natural months
-            new_graphs[i][j].x = x_axis
+        view = get_graphs_view(selected_wikis, selected_metrics, selected_timerange,
+                                relative_time, time_axis_json)
 
         for wiki_idx in range(len(wikis)):
-            if wiki_idx in selected_wikis:
+            if wiki_idx in view['wikis']:
                 for metric_idx in range(len(metrics)):
                     new_graphs[metric_idx][wiki_idx]['visible'] = True
             else:
                 for metric_idx in range(len(metrics)):
                     new_graphs[metric_idx][wiki_idx]['visible'] = "legendonly"
 
-
-        # Show only the selected timerange in the slider.
-        new_timerange = selected_timerange
-
-        # In case we are displaying calendar dates, then we have to do a
-        # conversion from "relative dates" to the actual 'natural' date.
-        if not relative_time:
-            time_axis = pd.DatetimeIndex(json.loads(time_axis_json))
-            new_timerange[0] = time_axis[selected_timerange[0]]
-            new_timerange[1] = time_axis[selected_timerange[1]]
-
-        # Dash' graphs:
+        # Dash' graphs, the ones of the metrics not selected are hidden:
         dash_graphs = []
         for i, metric in enumerate(metrics):
-            if (i in selected_metrics):
-                dash_graphs.append(
-                    dcc.Graph(
+            layout = {'title': metric.text}
+            if view['range']:
+                layout['xaxis'] = {'range': view['range']}
+            dash_graphs.append(
+                html.Div(
+                    id='graph-container-{}'.format(i),
+                    className='graph-container',
+                    style={} if i in view['metrics'] else {'display': 'none'},
+                    children=dcc.Graph(
                         id='graph-{}'.format(i),
                         figure={
                             'data': new_graphs[i],
-                            'layout': {
-                                'title': metric.text,
-                                'xaxis': {'range': new_timerange }
-                            }
+                            'layout': layout
                         },
                         config={
                             'displaylogo': False,
@@ -501,10 +519,35 @@ def bind_callbacks(app):
                         }
                     )
                 )
+            )
 
         return dash_graphs # update_graphs
 
 
+    @app.callback(
+        Output('graphs-view', 'children'),
+        [Input('wikis-selection-dropdown', 'value'),
+        Input('metrics-selection-dropdown', 'value'),
+        Input('dates-slider', 'value')],
+        [State('time-axis-selection', 'value'),
+        State('time-axis', 'children')]
+    )
+    def update_graphs_view(selected_wikis, selected_metrics, selected_timerange,
+            selected_timeaxis, time_axis_json):
+        """
+        Only writes which wikis and metrics are visible and the time range,
+        which graphs_view.js applies to the graphs already plotted, so
+        their traces are not generated and sent again.
+        """
+        if not time_axis_json or not selected_timeaxis:
+            return ''
+
+        relative_time = selected_timeaxis == 'relative'
+        view = get_graphs_view(selected_wikis, selected_metrics, selected_timerange,
+                                relative_time, time_axis_json)
+        return json.dumps(view, default=str)
+
+
     @app.callback(
         Output('date-slider-container', 'children'),
         [Input('time-axis', 'children'),
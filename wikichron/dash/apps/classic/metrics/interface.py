@@ -52,7 +52,7 @@ def compute_metrics_on_dataframe(metrics, df):
         df -- Dataframe to compute and calculate the metrics on.
         Return a list of panda series corresponding to the provided metrics.
     """
-    index = stats.calculate_index_all_months(df) #TOIMPROVE
+    index = stats.calculate_index_all_months(df)
     metrics_data = []
     for metric in metrics:
         metric_series = metric.calculate(df, index)
@@ -61,22 +61,6 @@ def compute_metrics_on_dataframe(metrics, df):
     return metrics_data
 
 
-def compute_data(dataframes, metrics):
-    """ Load analyzed data by every metric for every dataframe and return it in two dimensional array """
-
-    metrics_by_wiki = []
-    for df in dataframes:
-        metrics_by_wiki.append(compute_metrics_on_dataframe(metrics, df))
-
-    # transposing matrix row=>wikis, column=>metrics to row=>metrics, column=>wikis
-    wiki_by_metrics = []
-    for metric_idx in range(len(metrics)):
-        metric_row = [metrics_by_wiki[wiki_idx].pop(0) for wiki_idx in range(len(metrics_by_wiki))]
-        wiki_by_metrics.append(metric_row)
-
-    return wiki_by_metrics
-
-
 # Too inefficient with the current implementation
 # TOIMPROVE
 # NOTBEENUSED
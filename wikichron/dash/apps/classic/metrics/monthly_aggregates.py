@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   monthly_aggregates.py
+
+   Descp: Monthly aggregates of a wiki which the pages, edits and users
+      metrics are derived from.
+
+      Instead of grouping the whole data by month again for every metric,
+      every revision gets its month ordinal once, and then all the counts
+      are computed in one pass with np.bincount over a table indexed by
+      (month, namespace, anonymous flag).
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import pandas as pd
+import numpy as np
+
+from wikichron.utils.data_store import get_derived
+
+# Namespaces with their own column in the aggregates table.
+# Any other namespace is counted in the last column (NS_OTHER)
+NS_MAIN = 0
+NS_ARTICLE_TALK = 1
+NS_USER_TALK = 2
+NS_OTHER = 3
+NAMESPACES = {0: NS_MAIN, 1: NS_ARTICLE_TALK, 3: NS_USER_TALK}
+N_NAMESPACES = 4
+
+
+def first_occurrences(keys):
+    """ Returns the positions where each distinct key appears for the first time """
+    _, positions = np.unique(keys, return_index=True)
+    return positions
+
+
+class MonthlyAggregates:
+    """
+       Per-month counts of a wiki data (which is expected to be sorted by
+       timestamp, as the data store serves it).
+
+       Every count table has shape (n_months, N_NAMESPACES, 2), where the
+       last axis tells whether the revision was made by an anonymous user.
+    """
+
+    def __init__(self, data):
+        n_rows = len(data)
+
+        # month ordinal of every revision, counting from the first month
+        months = data['timestamp'].values.astype('datetime64[M]')
+        if n_rows:
+            first_month = months.min()
+            self.n_months = int((months.max() - first_month).astype(np.int64)) + 1
+            self.month = (months - first_month).astype(np.int64)
+            self.index = pd.date_range(first_month, periods=self.n_months,
+                                        freq='MS', name='timestamp')
+        else:
+            self.n_months = 0
+            self.month = np.empty(0, dtype=np.int64)
+            self.index = pd.DatetimeIndex([], freq='MS', name='timestamp')
+
+        page_ns = data['page_ns'].values
+        namespace = np.full(n_rows, NS_OTHER, dtype=np.int64)
+        for ns, column in NAMESPACES.items():
+            namespace[page_ns == ns] = column
+        anonymous = (data['contributor_name'] == 'Anonymous').values.astype(np.int64)
+
+        # position in the flattened (month, namespace, anonymous) table
+        cell = (self.month * N_NAMESPACES + namespace) * 2 + anonymous
+
+        page_codes, _ = pd.factorize(data['page_id'].values)
+        user_codes, _ = pd.factorize(data['contributor_id'].values)
+        page_month = page_codes.astype(np.int64) * self.n_months + self.month
+        user_month = user_codes.astype(np.int64) * self.n_months + self.month
+
+        self.edits = self._count(cell)
+        self.new_pages = self._count(cell[first_occurrences(page_codes)])
+        self.new_users = self._count(cell[first_occurrences(user_codes)])
+        self.pages_edited = self._count(cell[first_occurrences(page_month)])
+
+        # number of edits of every user in every month they were active,
+        #  split by the anonymous flag
+        user_month_anonymous, self.user_month_edits = np.unique(
+                            user_month * 2 + anonymous, return_counts=True)
+        self.user_month = user_month_anonymous // 2
+        self.user_month_anonymous = user_month_anonymous % 2
+
+
+    def _count(self, cells):
+        counts = np.bincount(cells, minlength=self.n_months * N_NAMESPACES * 2)
+        return counts.reshape((self.n_months, N_NAMESPACES, 2))
+
+
+    @property
+    def nbytes(self):
+        return sum(array.nbytes for array in (self.month, self.edits,
+                    self.new_pages, self.new_users, self.pages_edited,
+                    self.user_month, self.user_month_edits,
+                    self.user_month_anonymous))
+
+
+    def to_series(self, values, index=None, fill_value=0):
+        series = pd.Series(values, index=self.index)
+        if index is not None and not index.equals(self.index):
+            series = series.reindex(index, fill_value=fill_value)
+        return series
+
+
+    def _get_edits_per_user_month(self):
+        """
+           Returns the distinct (user, month) pairs, encoded as
+           user * n_months + month, and the edits of the user in that month.
+        """
+        # add up anonymous and registered edits of the same user and month,
+        #  if any (e.g. a user whose name changed to or from "Anonymous")
+        user_month, position = np.unique(self.user_month, return_inverse=True)
+        edits = np.bincount(position, weights=self.user_month_edits).astype(np.int64)
+        return (user_month, edits)
+
+
+    def active_users(self, min_edits=1, anonymous=None):
+        """
+           Number of users with at least min_edits edits per month.
+           anonymous -- if True (False), count only anonymous (registered) users.
+        """
+        if anonymous is None:
+            user_month, edits = self._get_edits_per_user_month()
+        else:
+            selected = self.user_month_anonymous == int(anonymous)
+            user_month = self.user_month[selected]
+            edits = self.user_month_edits[selected]
+
+        months = user_month[edits >= min_edits] % max(self.n_months, 1)
+        return np.bincount(months, minlength=self.n_months)
+
+
+    def accumulated_contributions(self):
+        """
+           Generator which yields, for every month, the number of edits
+           made by every user until that month (included), sorted in
+           ascending order.
+
+           Instead of counting all the edits so far again for every month,
+           it keeps the running count of every user and a sorted array of
+           those counts, which is updated only with the users active in
+           each month.
+        """
+        user_month, edits = self._get_edits_per_user_month()
+        users = user_month // max(self.n_months, 1)
+        months = user_month % max(self.n_months, 1)
+
+        # group the user-month pairs by month
+        by_month = np.argsort(months, kind='mergesort')
+        users = users[by_month]
+        edits = edits[by_month]
+        month_bounds = np.searchsorted(months[by_month], np.arange(self.n_months + 1))
+
+        counts = np.zeros(users.max() + 1 if len(users) else 0, dtype=np.int64)
+        sorted_counts = np.empty(0, dtype=np.int64)
+        for month in range(self.n_months):
+            month_slice = slice(month_bounds[month], month_bounds[month + 1])
+            month_users = users[month_slice]
+            old_counts = counts[month_users]
+            new_counts = old_counts + edits[month_slice]
+            counts[month_users] = new_counts
+
+            sorted_counts = remove_from_sorted(sorted_counts,
+                                        np.sort(old_counts[old_counts > 0]))
+            sorted_counts = insert_into_sorted(sorted_counts, np.sort(new_counts))
+            yield sorted_counts
+
+
+def remove_from_sorted(sorted_array, values):
+    """
+       Remove one occurrence of every element of values (which must be
+       sorted and contained in sorted_array) from sorted_array.
+    """
+    if not len(values):
+        return sorted_array
+    # repeated values have to be removed from consecutive positions
+    repetition = np.arange(len(values)) - np.searchsorted(values, values, side='left')
+    positions = np.searchsorted(sorted_array, values, side='left') + repetition
+    return np.delete(sorted_array, positions)
+
+
+def insert_into_sorted(sorted_array, values):
+    """ Insert values (which must be sorted) into sorted_array, keeping it sorted """
+    positions = np.searchsorted(sorted_array, values, side='left')
+    return np.insert(sorted_array, positions, values)
+
+
+def get_monthly_aggregates(data):
+    """ Returns the MonthlyAggregates of data, built once per wiki """
+    return get_derived(data, 'classic_monthly_aggregates', MonthlyAggregates)
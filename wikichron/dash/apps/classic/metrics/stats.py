@@ -10,11 +10,12 @@
    Copyright 2017-2018 Abel 'Akronix' Serrano Juste <akronix5@gmail.com>
 """
 
-import pandas as pd
 import numpy as np
 import math
 import inequality_coefficients as ineq
-import datetime
+
+from wikichron.utils import retention
+from .monthly_aggregates import get_monthly_aggregates, NS_MAIN, NS_ARTICLE_TALK, NS_USER_TALK
 
 # CONSTANTS
 MINIMAL_USERS_GINI = 20
@@ -27,22 +28,16 @@ MINIMAL_USERS_RATIO_10_90 = 10
 
 
 def calculate_index_all_months(data):
-    monthly_data = data.groupby(pd.Grouper(key='timestamp', freq='MS'))
-    index = monthly_data.size().index
-    return index
+    return get_monthly_aggregates(data).index
 
 # Pages
 
 
 def pages_new(data, index):
-    # We use the fact that data is sorted first by page_title and them by revision_id
-    # If we drop publicates we will get the first revision for each page_title, which
-    #  corresponds with the date it was created.
-    pages = data.drop_duplicates('page_id')
-    series = pages.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    # We use the fact that data is sorted by timestamp, so the first revision
+    #  of each page corresponds with the date it was created.
+    aggregates = get_monthly_aggregates(data)
+    return aggregates.to_series(aggregates.new_pages.sum(axis=(1, 2)), index)
 
 
 def pages_accum(data, index):
@@ -50,12 +45,8 @@ def pages_accum(data, index):
 
 
 def pages_main_new(data, index):
-    pages = data.drop_duplicates('page_id')
-    main_pages = pages[pages['page_ns'] == 0]
-    series = main_pages.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    aggregates = get_monthly_aggregates(data)
+    return aggregates.to_series(aggregates.new_pages[:, NS_MAIN].sum(axis=1), index)
 
 
 def pages_main_accum(data, index):
@@ -63,32 +54,32 @@ def pages_main_accum(data, index):
 
 
 def pages_edited(data, index):
-    monthly_data = data.groupby([pd.Grouper(key='timestamp', freq='MS')])
-    series = monthly_data.apply(lambda x: len(x.page_id.unique()))
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    aggregates = get_monthly_aggregates(data)
+    return aggregates.to_series(aggregates.pages_edited.sum(axis=(1, 2)), index)
 
 
 def main_edited(data, index):
-    main_pages = data[data['page_ns'] == 0]
-    monthly_data = main_pages.groupby([pd.Grouper(key='timestamp', freq='MS')])
-    series = monthly_data.apply(lambda x: len(x.page_id.unique()))
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    aggregates = get_monthly_aggregates(data)
+    return aggregates.to_series(aggregates.pages_edited[:, NS_MAIN].sum(axis=1), index)
 
 ########################################################################
 
 # Editions
 
+##### Helper functions #####
+
+
+def edits_in_namespace(data, index, namespace):
+    aggregates = get_monthly_aggregates(data)
+    return aggregates.to_series(aggregates.edits[:, namespace].sum(axis=1), index)
+
+
+##### callable edits metrics #####
+
 
 def edits(data, index):
-    monthly_data = data.groupby(pd.Grouper(key='timestamp', freq='MS'))
-    series = monthly_data.size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    aggregates = get_monthly_aggregates(data)
+    return aggregates.to_series(aggregates.edits.sum(axis=(1, 2)), index)
 
 
 def edits_accum(data, index):
@@ -96,8 +87,7 @@ def edits_accum(data, index):
 
 
 def edits_main_content(data, index):
-    edits_main_data = data[data['page_ns'] == 0]
-    return (edits(edits_main_data, index))
+    return edits_in_namespace(data, index, NS_MAIN)
 
 
 def edits_main_content_accum(data, index):
@@ -105,13 +95,11 @@ def edits_main_content_accum(data, index):
 
 
 def edits_article_talk(data, index):
-    edits_talk_data = data[data['page_ns'] == 1]
-    return (edits(edits_talk_data, index))
+    return edits_in_namespace(data, index, NS_ARTICLE_TALK)
 
 
 def edits_user_talk(data, index):
-    edits_talk_data = data[data['page_ns'] == 3]
-    return (edits(edits_talk_data, index))
+    return edits_in_namespace(data, index, NS_USER_TALK)
 
 ########################################################################
 
@@ -120,27 +108,17 @@ def edits_user_talk(data, index):
 ##### Helper functions #####
 
 
-def users_active_more_than_x_editions(data, index, x):
-    monthly_edits = data.groupby([pd.Grouper(key='timestamp', freq='MS'), 'contributor_id']).size()
-    monthly_edits_filtered = monthly_edits[monthly_edits > x].to_frame(name='pages_edited').reset_index()
-    if monthly_edits_filtered.empty:
-        series = pd.Series()
-    else:
-        series = monthly_edits_filtered.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+def users_active_more_than_x_editions(data, index, x, anonymous=None):
+    aggregates = get_monthly_aggregates(data)
+    return aggregates.to_series(aggregates.active_users(x + 1, anonymous), index)
 
 
 ##### callable users metrics #####
 
 
 def users_new(data, index):
-    users = data.drop_duplicates('contributor_id')
-    series = users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    aggregates = get_monthly_aggregates(data)
+    return aggregates.to_series(aggregates.new_users.sum(axis=(1, 2)), index)
 
 
 def users_accum(data, index):
@@ -148,12 +126,8 @@ def users_accum(data, index):
 
 
 def users_new_anonymous(data, index):
-    users = data.drop_duplicates('contributor_id')
-    anonymous_users = users[users['contributor_name'] == 'Anonymous']
-    series = anonymous_users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    aggregates = get_monthly_aggregates(data)
+    return aggregates.to_series(aggregates.new_users[:, :, 1].sum(axis=1), index)
 
 
 def users_anonymous_accum(data, index):
@@ -161,12 +135,8 @@ def users_anonymous_accum(data, index):
 
 
 def users_new_registered(data, index):
-    users = data.drop_duplicates('contributor_id')
-    non_anonymous_users = users[users['contributor_name'] != 'Anonymous']
-    series = non_anonymous_users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    aggregates = get_monthly_aggregates(data)
+    return aggregates.to_series(aggregates.new_users[:, :, 0].sum(axis=1), index)
 
 
 def users_registered_accum(data, index):
@@ -179,15 +149,12 @@ def users_active(data, index):
 
 # this metric is the same as the users_active, but getting rid of anonymous users
 def users_registered_active(data, index):
-    # get rid of anonymous users and procceed as it was done in the previous metric.
-    user_registered = data[data['contributor_name'] != 'Anonymous']
-    return users_active(user_registered, index)
+    return users_active_more_than_x_editions(data, index, 0, anonymous=False)
 
 
 # this metric is the complementary to users_registered_active: now, we get rid of registered users and focus on anonymous users.
 def users_anonymous_active(data, index):
-    user_anonymous = data[data['contributor_name'] == 'Anonymous']
-    return users_active(user_anonymous, index)
+    return users_active_more_than_x_editions(data, index, 0, anonymous=True)
 
 
 # this metric gets, per month, those users who have contributed to the wiki in more than 4 editions.
@@ -213,11 +180,8 @@ def users_active_more_than_99_editions(data, index):
 
 
 def anonymous_edits(data, index):
-    series = data[data['contributor_name'] == 'Anonymous']
-    series = series.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    aggregates = get_monthly_aggregates(data)
+    return aggregates.to_series(aggregates.edits[:, :, 1].sum(axis=1), index)
 
 
 ##### callable ditribution metrics #####
@@ -267,65 +231,14 @@ def percentage_edits_by_anonymous_accum(data, index):
 
 # Retention Metrics
 
-###### Helper Functions ######
-
-def filter_anonymous(data):
-    series = data[data['contributor_name'] != 'Anonymous']
-    return series
-
 ##### callable users metrics #####
 
 def returning_new_editors(data, index):
-    data.reset_index(drop=True, inplace=True)
-    # remove anonymous users
-    registered_users = filter_anonymous(data)
-    # add up 7 days to the date on which each user registered
-    seven_days_after_registration = registered_users.groupby(['contributor_id']).agg({'timestamp':'first'}).apply(lambda x: x+datetime.timedelta(days=7)).reset_index()
-    # change the name to the timestamp column
-    seven_days_after_registration = seven_days_after_registration.rename(columns = {'timestamp':'seven_days_after'})
-    # merge two dataframes by contributor_id
-    registered_users = pd.merge(registered_users, seven_days_after_registration, on ='contributor_id')
-    # edits of each user within 7 days of being registered
-    registered_users = registered_users[registered_users['timestamp'] <= registered_users['seven_days_after']]
-    # to order by date
-    registered_users = registered_users.sort_values(['timestamp'])
-    # get the timestamp and contributor_id and group by contributor_id
-    timestamp_and_contributor_id = registered_users[['timestamp', 'contributor_id']].groupby(['contributor_id'])
-    # displace the timestamp a position
-    displace_timestamp = timestamp_and_contributor_id.apply(lambda x: x.shift())
-    registered_users['displace_timestamp'] = displace_timestamp['timestamp']
-    # compare the origin timestamp with the displace_timestamp
-    registered_users['comp'] = (registered_users.timestamp-registered_users.displace_timestamp)
-    # convert to seconds and replace the NAT for 61 because the NAT indicate the first edition
-    registered_users['comp'] = registered_users['comp'].apply(lambda y: y.total_seconds()/60).fillna(61)
-    # take the edit sessions
-    edits_sessions = registered_users[(registered_users['comp']>60) ]
-    num_edits_sessions = edits_sessions.groupby([pd.Grouper(key='timestamp', freq='MS'), 'contributor_id']).size()
-    # users with at least two editions
-    returning_users = num_edits_sessions[num_edits_sessions >1].to_frame('returning_users').reset_index()
-    # minimum month in which each user has made two editions
-    returning_new_users = returning_users.groupby(['contributor_id'])['timestamp'].min().reset_index()
-    returning_new_users = returning_new_users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        returning_new_users = returning_new_users.reindex(index, fill_value=0)
-    return returning_new_users
+    return retention.returning_new_editors(data, index)
 
 
 def surviving_new_editors(data, index):
-    data.reset_index(drop=True, inplace=True)
-    registered_users = filter_anonymous(data)
-    # add up 30 days to the date on which each user registered
-    thirty_days_after_registration = registered_users.groupby(['contributor_id']).agg({'timestamp':'first'}).apply(lambda x: x+datetime.timedelta(days=30)).reset_index()
-    thirty_days_after_registration=thirty_days_after_registration.rename(columns = {'timestamp':'thirty_days_after'})
-    registered_users = pd.merge(registered_users, thirty_days_after_registration, on ='contributor_id')
-    registered_users['survival period'] = registered_users['thirty_days_after'].apply(lambda x: x+datetime.timedelta(days=30))
-    survival_users = registered_users[(registered_users['timestamp'] >= registered_users['thirty_days_after']) & (registered_users['timestamp'] <= registered_users['survival period'])]
-    survival_users = survival_users.groupby([pd.Grouper(key='timestamp', freq='MS'), 'contributor_id']).size().to_frame('num_editions_in_survival_period').reset_index()
-    survival_new_users = survival_users.groupby(['contributor_id'])['timestamp'].max().reset_index()
-    survival_new_users = survival_new_users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        survival_new_users = survival_new_users.reindex(index, fill_value=0)
-    return survival_new_users
+    return retention.surviving_new_editors(data, index)
 
 
 ########################################################################
@@ -342,83 +255,71 @@ def contributions_per_author(data):
     return data.groupby('contributor_id').size()
 
 
+def gini_corrected_of_sorted(values):
+    """
+    Same as ineq.gini_corrected(values, len(values)), but in linear time
+    for values already sorted in ascending order.
+    """
+    n = len(values)
+    if n < 2:
+        return np.NaN
+    sum_numerator = np.dot(np.arange(n, 0, -1, dtype=np.int64), values)
+    sum_denominator = values.sum()
+    if sum_denominator == 0:
+        return np.NaN
+    g_coeff = n + 1 - 2*(sum_numerator/sum_denominator)
+    g_coeff *= (1.0 / (n - 1))
+    return g_coeff
+
+
 def calc_ratio_percentile_max(data, index, percentile, minimal_users):
     return calc_ratio_percentile(data, index, 1, percentile, minimal_users)
 
 
 def calc_ratio_percentile(data, index, top_percentile, percentile, minimal_users):
 
-    # Note that contributions is an *unsorted* list of contributions per author
+    # Note that contributions is a list of contributions per author
+    #  sorted in ascending order
     def ratio_max_percentile_for_period(contributions, percentage):
 
         position = int(n_users * percentage)
 
-        # get top users until user who corresponds to percentil n
-        top_users = contributions.nlargest(position)
-
         # get top user and percentil n user
-        p_max = top_users[top_percentile-1]
-        percentile = top_users[-1]
+        p_max = contributions[n_users - top_percentile]
+        percentile = contributions[n_users - position]
 
         # calculate ratio between percentiles
         return p_max / percentile
 
     percentage = percentile * 0.01
-    i = 0
-    monthly_data = data.groupby(pd.Grouper(key='timestamp', freq='MS'))
-    result = pd.Series(index=monthly_data.size().index)
-    indices = result.index
-    accum_data = pd.DataFrame()
-    for name, group in monthly_data:
-        # Accumulate data so far
-        accum_data = accum_data.append(group)
-
-        # Get contributions per contributor
-        contributions = contributions_per_author(accum_data)
-
+    aggregates = get_monthly_aggregates(data)
+    result = []
+    for contributions in aggregates.accumulated_contributions():
         n_users = len(contributions)
 
         # Skip when the wiki has too few users
         if n_users < minimal_users:
-            result[indices[i]] = np.NaN
+            result.append(np.NaN)
         else:
-            result[indices[i]] = ratio_max_percentile_for_period(contributions, percentage)
-        i = i + 1
+            result.append(ratio_max_percentile_for_period(contributions, percentage))
 
-    return result
+    return aggregates.to_series(result, index, fill_value=np.NaN)
 
 ##### callable ditribution metrics #####
 
 
 def gini_accum(data, index):
-
-    #~ data = raw_data.set_index([raw_data['timestamp'].dt.to_period('M'), raw_data.index])
-    monthly_data = data.groupby(pd.Grouper(key='timestamp', freq='MS'))
-    if index is not None:
-        gini_accum_df = pd.Series(index=index)
-    else:
-        gini_accum_df = pd.Series(index=monthly_data.size().index)
-    indices = gini_accum_df.index
-    i = 0
-    accum_data = pd.DataFrame()
-    for name, group in monthly_data:
-        # Accumulate data so far
-        accum_data = accum_data.append(group)
-
-        # Get contributions per contributor, sort them
-        #   and make it a list to call to gini_coeff()
-        values = contributions_per_author(accum_data) \
-                .tolist()
-
-        n_users = len(values)
+    aggregates = get_monthly_aggregates(data)
+    result = []
+    for contributions in aggregates.accumulated_contributions():
+        n_users = len(contributions)
 
         if (n_users) < MINIMAL_USERS_GINI:
-            gini_accum_df[indices[i]] = np.NaN
+            result.append(np.NaN)
         else:
-            gini_accum_df[indices[i]] = ineq.gini_corrected(values, n_users)
-        i = i + 1
+            result.append(gini_corrected_of_sorted(contributions))
 
-    return gini_accum_df
+    return aggregates.to_series(result, index, fill_value=np.NaN)
 
 
 def ratio_percentiles_max_5(data, index):
@@ -447,25 +348,15 @@ def ratio_percentiles_10_20(data, index):
 
 
 def ratio_10_90(data, index):
-    i = 0
-    monthly_data = data.groupby(pd.Grouper(key='timestamp', freq='MS'))
-    result = pd.Series(index=monthly_data.size().index)
-    indices = result.index
-    accum_data = pd.DataFrame()
-    for name, group in monthly_data:
-        # Get contributions per contributor, sort them
-        #   and make it a Python list
-        accum_data = accum_data.append(group)
-        contributions = contributions_per_author(accum_data)
-
+    aggregates = get_monthly_aggregates(data)
+    result = []
+    for contributions in aggregates.accumulated_contributions():
         n_users = len(contributions)
 
         # Skip when the wiki has too few users
         if n_users < MINIMAL_USERS_RATIO_10_90:
-            result[indices[i]] = np.NaN
+            result.append(np.NaN)
         else:
-            result[indices[i]] = ineq.ratio_top10_rest(contributions)
-        i = i + 1
-
-    return result
+            result.append(ineq.ratio_top_rest(contributions, 10))
 
+    return aggregates.to_series(result, index, fill_value=np.NaN)
@@ -10,7 +10,6 @@
    Copyright 2017-2018 Abel 'Akronix' Serrano Juste <akronix5@gmail.com>
 """
 # Python built-in imports
-import flask
 import glob
 import os
 import json
@@ -19,8 +18,6 @@ import time
 from warnings import warn
 from urllib.parse import parse_qs, urljoin
 from codecs import decode
-from io import BytesIO
-import zipfile
 
 # Dash framework imports
 import dash
@@ -38,6 +35,7 @@ from flask import request, current_app
 import pandas as pd
 
 # Local imports:
+from wikichron.utils import zip_stream
 from .utils import get_mode_config
 from .metrics import interface as interface
 from . import cache
@@ -234,55 +232,37 @@ def start_download_data_server(app, download_pathname):
 
         (wikis, metrics) = extract_wikis_and_metrics_from_selection_dict(selection)
 
-        data_aux = data_controller.load_and_compute_data(wikis, metrics)
-        #data = main.loaded_data
-        # output in-memory zip file
-        in_memory_zip = BytesIO()
-        zipfile_ob = zipfile.ZipFile(in_memory_zip, mode='w',
-                                    compression=zipfile.ZIP_DEFLATED)
-
-        data = []
-        for metric_idx in range(len(data_aux)):
-            data.append(data_aux[metric_idx].get_data())
-        for metric, metric_name in zip(data, metrics):
-            # These two following lines are equivalent to the other next 3 lines
-            #   but they are, probably, more difficult to understand and
-            #  to maintain, although probably more pandas-ish:
-            #~ metrics_data_for_this_wiki = [metric[wiki_idx] for metric in data ]
-            #~ wiki_df = pd.concat(metrics_data_for_this_wiki, axis=1)
-
-            metric_df = pd.DataFrame()
-            if type(metric[-1]) == str and metric[-1] == 'Line':
-                metric_df = metric[0]
-            elif type(metric[-1]) == str and metric[-1] == 'Heatmap':
-                metric_df['timestamp'] = metric[0]
-                for i in range(0, len(metric[2]), 10):
-                    metric_df[i] = metric[2][i]
-                metric_df = metric_df.set_index('timestamp')
-            else:
-                for submetric in metric:
-                    # assign the name of the metric as the name of the column for its data:
-                    #if type(submetric) != str and type(submetric) != 'pandas.core.indexes.datetimes.DatetimeIndex' and type(submetric) != list:
-                    #if type(metric[-1]) == str and metric[-1] == 'Heatmap' and type(submetric) != str:
-                   #     metric_df = submetric
-                    #elif type(submetric) != str:
-                    metric_df[submetric.name] = submetric
-            print(metric_df)
-            csv_str = metric_df.to_csv()
-            # append dataframe csv to zip file with name of the wiki:
-            zipfile_ob.writestr('{}.csv'.format(metric_name.text), csv_str)
-
-        # testing zip format and integrity
-        error = zipfile_ob.testzip()
-        if error is None:
-            zipfile_ob.close()
-            in_memory_zip.seek(0) # move ByteIO cursor to the start
-            return flask.send_file(in_memory_zip, as_attachment=True,
-                        attachment_filename='{}.zip'.format(wikis[0]['name']),
-                        mimetype='application/zip')
-        else:
-            zipfile_ob.close()
-            raise Exeption('There was an error compressing the data in a zip file: {}'.format(error))
+        file_format = selection.get('format', ['csv'])[0]
+        if file_format not in zip_stream.FORMATS:
+            return 'Unknown download format: {}'.format(file_format)
+        if file_format == 'parquet' and not zip_stream.is_parquet_available():
+            return 'Parquet downloads are not available!'
+
+        token = data_controller.compute_selection(wikis, metrics)
+        data_aux = data_controller.get_selection_data(token, wikis, metrics)
+
+        # For each metric, create a DataFrame with its data, which is
+        #   streamed to the output zip file while the DataFrame of the next
+        #   metric is not yet built.
+        def metrics_dataframes():
+            for metric_data, metric_name in zip(data_aux, metrics):
+                metric = metric_data.get_data()
+                metric_df = pd.DataFrame()
+                if type(metric[-1]) == str and metric[-1] == 'Line':
+                    metric_df = metric[0]
+                elif type(metric[-1]) == str and metric[-1] == 'Heatmap':
+                    metric_df['timestamp'] = metric[0]
+                    for i in range(0, len(metric[2]), 10):
+                        metric_df[i] = metric[2][i]
+                    metric_df = metric_df.set_index('timestamp')
+                else:
+                    for submetric in metric:
+                        # assign the name of the metric as the name of the column for its data:
+                        metric_df[submetric.name] = submetric
+                yield (metric_name.text, metric_df)
+
+        return zip_stream.send_zip(zip_stream.dataframe_files(metrics_dataframes(), file_format),
+                                    '{}.zip'.format(wikis[0]['name']))
 
     return
 
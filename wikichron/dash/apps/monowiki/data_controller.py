@@ -12,12 +12,9 @@ WikiChron code.
 """
 
 # Built-in imports
-import pandas as pd
 import os
-import numpy as np
 import time
 from datetime import datetime
-from warnings import warn
 import json
 import functools
 
@@ -28,7 +25,9 @@ data_dir = os.getenv('WIKICHRON_DATA_DIR', 'data')
 TIME_DIV = 60 * 60 * 24 * 30
 
 # Local imports:
-from .metrics.interface import compute_data
+from wikichron.utils.data_store import get_data_store
+from wikichron.utils import metric_cache
+from .metrics.interface import calculate_metrics_on_dataframe
 
 ### CACHED FUNCTIONS ###
 
@@ -36,36 +35,29 @@ def set_cache(cache):
 
     # we need to declare as *global* all the cached functions we want to be
     #  available to be used from outside of this file.
-    global read_data
+    global load_metrics_data
     global load_and_compute_data
     global generate_and_store_time_axis
     global calculate_index_all_months
 
-    @cache.memoize()
-    def read_data(wiki):
-        df = get_dataframe_from_csv(wiki['data'])
-        prepare_data(df)
-        df = clean_up_bot_activity(df, wiki)
-        return df
-
-
     # returns data[metric][wiki]
-    @cache.memoize(timeout=3600)
-    def load_and_compute_data(wikis, metrics):
-
-        # load data from csvs:
-        time_start_loading_csvs = time.perf_counter()
-        wikis_df = read_data(wikis[0])
-        time_end_loading_csvs = time.perf_counter() - time_start_loading_csvs
-        print(' * [Timing] Loading csvs : {} seconds'.format(time_end_loading_csvs) )
-
-        # compute metric data:
+    def load_metrics_data(wikis, metrics):
+        """
+        Every (wiki, metric) pair is cached on its own, so only the ones
+        not in the cache are computed (see metric_cache.load_cells())
+        """
         print(' * [Info] Starting calculations....')
         time_start_calculations = time.perf_counter()
-        metric_object_list = compute_data(wikis_df, metrics)
+        data = metric_cache.load_cells(cache, 'monowiki', wikis[:1], metrics, read_data,
+                                calculate_metrics_on_dataframe)
         time_end_calculations = time.perf_counter() - time_start_calculations
         print(' * [Timing] Calculations : {} seconds'.format(time_end_calculations) )
-        return metric_object_list
+        return data
+
+
+    # returns the metrics, with their data computed on the wiki
+    def load_and_compute_data(wikis, metrics):
+        return set_metrics_data(metrics, load_metrics_data(wikis, metrics))
 
 
     @cache.memoize()
@@ -82,63 +74,54 @@ def set_cache(cache):
         return time_axis
 
 
-### OTHER DATA-RELATED FUNCTIONS ###
+### SELECTION RESULTS ###
 
-def get_available_wikis():
-    wikis_json_file = open(os.path.join(data_dir, 'wikis.json'))
-    wikis = json.load(wikis_json_file)
-    return wikis
+def compute_selection(wikis, metrics):
+    """
+    Computes the data of a selection of wikis and metrics and returns its
+    token, which get_selection_data() gets it back with
+    """
+    token = metric_cache.get_selection_token('monowiki', wikis[:1], metrics)
+    get_selection_data(token, wikis, metrics)
+    return token
 
 
-def remove_bots_activity(df, bots_ids):
+# returns the metrics, with their data computed on the wiki
+def get_selection_data(token, wikis, metrics):
     """
-       Filter out bots activity from pandas dataframe.
-
-       df -- data to be filtered. It'll be modified in place
-       bots_ids -- numpy array with the userid for every bot
-       Return a dataframe derived from the original but with all the
-          editions made by bot users removed
+    The data of the selection with token, from the results of this
+    process, or else loaded again (see metric_cache.get_selection_result()).
+    The token comes from the browser, so the data is only looked up by it
+    if it's the token of wikis and metrics, and computed otherwise.
     """
-    bots = np.array(bots_ids)
-    return df[~df['contributor_id'].isin(bots)]
+    compute = lambda: load_metrics_data(wikis, metrics)
+    if token != metric_cache.get_selection_token('monowiki', wikis[:1], metrics):
+        data = compute()
+    else:
+        data = metric_cache.get_selection_result(token, compute)
+    return set_metrics_data(metrics, data)
 
 
-def prepare_data(df):
-    """
-       Prepare data in the correct input format for the metric
-       calculation functions.
+def set_metrics_data(metrics, data):
+    for metric, metric_data in zip(metrics, data):
+        metric.set_data(metric_data[0])
+    return metrics
 
-       df -- data to be prepared.
-       Modifies inplace the input data as well as returns that data
-       in the appropiate format for further calling of metric functions.
+
+### OTHER DATA-RELATED FUNCTIONS ###
+
+def read_data(wiki):
     """
-    return df.sort_values(by='timestamp', inplace=True)
-
-
-def get_dataframe_from_csv(csv):
-    """ Read and parse a csv and return the corresponding pandas dataframe"""
-
-    print('Loading csv for ' + csv)
-    time_start_loading_one_csv = time.perf_counter()
-    df = pd.read_csv(os.path.join(data_dir, csv),
-                    delimiter=',', quotechar='|',
-                    index_col=False)
-    df['timestamp']=pd.to_datetime(df['timestamp'],format='%Y-%m-%dT%H:%M:%SZ')
-    print('!!Loaded csv for ' + csv)
-    time_end_loading_one_csv = time.perf_counter() - time_start_loading_one_csv
-    print(' * [Timing] Loading {} : {} seconds'
-                    .format(csv, time_end_loading_one_csv))
-    df.index.name = csv
-    return df
-
-
-def clean_up_bot_activity(df, wiki):
-    if 'bots' in wiki:
-        botsids = [bot['id'] for bot in wiki['bots']]
-        return remove_bots_activity(df, botsids)
-    else:
-        warn("Warning: Missing information of bots ids. Note that graphs can be polluted of non-human activity.")
-    return df
+       Returns the data of the wiki, sorted by timestamp and without bots
+       activity, from the data store shared by all the apps.
+    """
+    return get_data_store().get(wiki)
+
+
+def get_available_wikis():
+    wikis_json_file = open(os.path.join(data_dir, 'wikis.json'))
+    wikis = json.load(wikis_json_file)
+    return wikis
 
 
 def get_first_entry(wiki):
@@ -359,9 +359,10 @@ def bind_callbacks(app):
         print('--> Retrieving and computing data')
         print( '\t for the following wikis: {}'.format( wikis_names ))
         print( '\tof the following metrics: {}'.format( metric_names ))
-        data = data_controller.load_and_compute_data(wikis, metrics)
+        # the data of the selection is kept server-side, under this token
+        token = data_controller.compute_selection(wikis, metrics)
         print('<-- Done retrieving and computing data!')
-        return True
+        return token
 
 
     @app.callback(
@@ -381,6 +382,7 @@ def bind_callbacks(app):
         selection = json.loads(selection_json)
         wikis = selection['wikis']
         metrics = extract_metrics_objs_from_metrics_codes(selection['metrics'])
+        metrics = data_controller.get_selection_data(signal, wikis, metrics)
 
         # get time axis of the oldest one and use it as base numbers for the slider:
         time_axis_index = data_controller.generate_and_store_time_axis([ metric for metric in metrics ],
@@ -420,11 +422,12 @@ def bind_callbacks(app):
         State('dates-slider', 'value'),
         State('time-axis-selection', 'value'),
         State('initial-selection', 'children'),
-        State('time-axis', 'children')]
+        State('time-axis', 'children'),
+        State('signal-data', 'children')]
     )
     def update_graphs(ready,
             selected_wikis, selected_metrics, selected_timerange,
-            selected_timeaxis, selection_json, time_axis_json):
+            selected_timeaxis, selection_json, time_axis_json, token):
 
         if not ready: # waiting for all parameters to be ready
             return;
@@ -434,7 +437,7 @@ def bind_callbacks(app):
         wikis = selection['wikis']
         metrics = extract_metrics_objs_from_metrics_codes(selection['metrics'])
 
-        data = data_controller.load_and_compute_data(wikis, metrics)
+        data = data_controller.get_selection_data(token, wikis, metrics)
 
         if debug:
             print('Updating graphs. Selection: [{}, {}, {}, {}]'.format(selected_wikis, selected_metrics, selected_timerange, selected_timeaxis))
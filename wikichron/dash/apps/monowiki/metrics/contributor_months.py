@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   contributor_months.py
+
+   Descp: Table with one row per registered contributor and month in which
+      that contributor edited the wiki, along with some columns derived from
+      the activity of the contributor until that month.
+
+      It's built once per wiki and shared by all the monowiki metrics about
+      users by tenure, by the date of their last edit and by experience,
+      instead of grouping the data by contributor and month in every one.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import pandas as pd
+import numpy as np
+
+from wikichron.utils.data_store import get_derived
+
+
+class ContributorMonths:
+    """
+       Attributes:
+       index -- months of the wiki, from its first to its last one.
+       month -- position in index of the month of every row of table.
+       table -- pd DataFrame sorted by contributor and month, with columns:
+          contributor_id
+          timestamp -- first day of the month.
+          medits -- edits of the contributor in the month.
+          nEdits -- edits of the contributor until the month (included).
+          nEdits_until_previous_month -- edits of the contributor until the
+             previous month, or -1 in the first month of the contributor.
+          tenure -- months since the first month of the contributor.
+          months_since_previous -- months since the previous month in which
+             the contributor edited, or 0 in its first month.
+          first_month -- whether it's the first month of the contributor.
+          streak -- number of consecutive months, until this one, in which
+             the contributor edited.
+    """
+
+    def __init__(self, data):
+        months = data['timestamp'].values.astype('datetime64[M]')
+        if len(data):
+            first_month = months.min()
+            n_months = int((months.max() - first_month).astype(np.int64)) + 1
+        else:
+            first_month = np.datetime64('1970-01', 'M')
+            n_months = 0
+        self.index = pd.date_range(first_month, periods=n_months,
+                                    freq='MS', name='timestamp')
+
+        registered = (data['contributor_name'] != 'Anonymous').values
+        month = (months[registered] - first_month).astype(np.int64)
+        contributors, contributor = np.unique(data['contributor_id'].values[registered],
+                                                return_inverse=True)
+
+        # one entry per (contributor, month), sorted by contributor and month
+        contributor_month, medits = np.unique(contributor * max(n_months, 1) + month,
+                                                return_counts=True)
+        contributor = contributor_month // max(n_months, 1)
+        self.month = contributor_month % max(n_months, 1)
+
+        is_first_month = np.zeros(len(contributor), dtype=bool)
+        is_first_month[:1] = True
+        is_first_month[1:] = contributor[1:] != contributor[:-1]
+        # position of the first row of the contributor of every row
+        contributor_start = np.flatnonzero(is_first_month)[np.cumsum(is_first_month) - 1]
+
+        edits_until = np.cumsum(medits)
+        nEdits = edits_until - (edits_until - medits)[contributor_start]
+        nEdits_until_previous_month = np.where(is_first_month, -1, nEdits - medits)
+        months_since_previous = np.zeros(len(contributor), dtype=np.int64)
+        months_since_previous[1:] = np.diff(self.month)
+        months_since_previous[is_first_month] = 0
+
+        # a streak starts in the first month of every contributor and after
+        #  every month without edits
+        positions = np.arange(len(contributor))
+        streak_start = np.maximum.accumulate(
+                np.where(is_first_month | (months_since_previous != 1), positions, 0))
+        streak = positions - streak_start + 1
+
+        self.table = pd.DataFrame({
+            'contributor_id': contributors[contributor],
+            'timestamp': self.index[self.month],
+            'medits': medits,
+            'nEdits': nEdits,
+            'nEdits_until_previous_month': nEdits_until_previous_month,
+            'tenure': self.month - self.month[contributor_start],
+            'months_since_previous': months_since_previous,
+            'first_month': is_first_month,
+            'streak': streak,
+        }, columns=['contributor_id', 'timestamp', 'medits', 'nEdits',
+                    'nEdits_until_previous_month', 'tenure',
+                    'months_since_previous', 'first_month', 'streak'])
+
+
+    @property
+    def nbytes(self):
+        return self.month.nbytes + int(self.table.memory_usage(index=True).sum())
+
+
+    def _to_series(self, values, index):
+        series = pd.Series(values, index=self.index)
+        if index is not None and not index.equals(self.index):
+            series = series.reindex(index, fill_value=0)
+        return series
+
+
+    def users_per_month(self, condition, index):
+        """ Number of rows fulfilling condition per month """
+        return self._to_series(np.bincount(self.month[np.asarray(condition)],
+                                            minlength=len(self.index)), index)
+
+
+    def edits_per_month(self, condition, index):
+        """ Sum of medits of the rows fulfilling condition per month """
+        condition = np.asarray(condition)
+        return self._to_series(np.bincount(self.month[condition],
+                                            weights=self.table['medits'].values[condition],
+                                            minlength=len(self.index)), index)
+
+
+def get_contributor_months(data):
+    """ Returns the ContributorMonths of the registered users in data, built once per wiki """
+    return get_derived(data, 'monowiki_contributor_months', ContributorMonths)
+
+
+def get_contributor_months_only_mains(data):
+    """ Same as get_contributor_months(), but only for the edits in main pages """
+    return get_derived(data, 'monowiki_contributor_months_only_mains',
+                        lambda df: ContributorMonths(df[df['page_ns'] == 0]))
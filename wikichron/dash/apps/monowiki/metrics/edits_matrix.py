@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   edits_matrix.py
+
+   Descp: (contributors x months) matrices with the number of edits of every
+      contributor in every month of a wiki.
+
+      They are built once per wiki with scipy.sparse and then shared by all
+      the monowiki metrics needing the number of edits of every user until
+      each month, instead of grouping the data again per contributor.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import pandas as pd
+import numpy as np
+from scipy import sparse
+
+from wikichron.utils.data_store import get_derived
+
+
+class EditsMatrix:
+    """
+       Monthly edits of every contributor of a wiki.
+
+       Attributes:
+       index -- months of the wiki, from its first to its last one.
+       contributors -- ids of the contributors, sorted, one per row.
+       monthly -- sparse matrix with the edits of every contributor (row)
+          in every month (column).
+       registered -- positions (rows) of the contributors with at least
+          one edit not done anonymously, sorted.
+       registered_monthly -- sparse matrix with the non-anonymous edits of
+          every registered contributor, one row per position in registered.
+       registered_cumulative -- dense matrix with the number of
+          non-anonymous edits done by every registered contributor until
+          each month (included), one row per position in registered.
+    """
+
+    def __init__(self, data):
+        months = data['timestamp'].values.astype('datetime64[M]')
+        if len(data):
+            first_month = months.min()
+            n_months = int((months.max() - first_month).astype(np.int64)) + 1
+            self.index = pd.date_range(first_month, periods=n_months,
+                                        freq='MS', name='timestamp')
+        else:
+            first_month = np.datetime64('1970-01', 'M')
+            n_months = 0
+            self.index = pd.DatetimeIndex([], freq='MS', name='timestamp')
+        month = (months - first_month).astype(np.int64)
+
+        self.contributors, contributor = np.unique(data['contributor_id'].values,
+                                                    return_inverse=True)
+        shape = (len(self.contributors), n_months)
+        self.monthly = count_matrix(contributor, month, shape)
+
+        registered_rows = (data['contributor_name'] != 'Anonymous').values
+        self.registered = np.unique(contributor[registered_rows])
+        registered_monthly = count_matrix(contributor[registered_rows],
+                                            month[registered_rows], shape)
+        self.registered_monthly = registered_monthly[self.registered]
+        self.registered_cumulative = cumulative(self.registered_monthly)
+
+
+    @property
+    def nbytes(self):
+        return (self.contributors.nbytes + self.registered.nbytes
+                + sparse_nbytes(self.monthly)
+                + sparse_nbytes(self.registered_monthly)
+                + self.registered_cumulative.nbytes)
+
+
+def count_matrix(rows, columns, shape):
+    """ Sparse matrix with the number of times each (row, column) pair appears """
+    ones = np.ones(len(rows), dtype=np.int64)
+    return sparse.coo_matrix((ones, (rows, columns)), shape=shape).tocsr()
+
+
+def sparse_nbytes(matrix):
+    return matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+
+
+def cumulative(monthly):
+    """ Dense cumulative sum along the months of a sparse monthly matrix """
+    return np.cumsum(monthly.toarray(), axis=1)
+
+
+def get_edits_matrix(data):
+    """ Returns the EditsMatrix of data, built once per wiki """
+    return get_derived(data, 'monowiki_edits_matrix', EditsMatrix)
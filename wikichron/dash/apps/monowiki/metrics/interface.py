@@ -44,21 +44,26 @@ Return a dictionary where every key is a MetricCategory object and every value
     return _metrics_by_category
 
 
-def compute_metrics_on_dataframe(metrics, df):
+def calculate_metrics_on_dataframe(metrics, df):
     """
         Get the requested metrics computed on a dataframe in relative dates.
 
         metrics -- list of metric objects
         df -- Dataframe to compute and calculate the metrics on.
-        Return a list of panda series corresponding to the provided metrics.
+        Return a list with the data of every metric, as given by its calculate().
     """
     index = calculate_index_all_months(df) #TOIMPROVE
-    #metrics_data = []
-    for metric in metrics:
-        metric_series = metric.calculate(df, index)
+    return [metric.calculate(df, index) for metric in metrics]
+
+
+def compute_metrics_on_dataframe(metrics, df):
+    """
+        Same as calculate_metrics_on_dataframe(), but the data is set in
+        every metric object, and the metric objects are returned.
+    """
+    for metric, metric_series in zip(metrics, calculate_metrics_on_dataframe(metrics, df)):
         metric.set_data(metric_series)
         #~ metric_series.name = '{}<>{}'.format(df.index.name,metric.code) #TOFIX for monowiki metrics
-        #metrics_data.append(metric_series)
     return metrics
 
 
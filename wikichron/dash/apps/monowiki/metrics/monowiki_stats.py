@@ -14,9 +14,11 @@ import pandas as pd
 import numpy as np
 import math
 import datetime as d
-from dateutil.relativedelta import relativedelta
 import time
 
+from .edits_matrix import get_edits_matrix
+from .contributor_months import get_contributor_months, get_contributor_months_only_mains
+
 
 def calculate_index_all_months(data):
     monthly_data = data.groupby(pd.Grouper(key='timestamp', freq='MS'))
@@ -41,7 +43,13 @@ def get_accum_number_of_edits_until_each_month(data, index):
     Returns a pd DataFrame with the suitable shape for calculating the metrics:
     one row contains the contributor_id, timestamp and nEdits -- cumulative number of edits done until the given timestamp
     '''
-    df = data.groupby(['contributor_id']).apply(lambda x: x.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('nEdits').reindex(index, fill_value=0).cumsum()).reset_index()
+    edits_matrix = get_edits_matrix(data)
+    df = pd.DataFrame(edits_matrix.monthly.toarray(),
+                        index=pd.Index(edits_matrix.contributors, name='contributor_id'),
+                        columns=edits_matrix.index)
+    if index is not None:
+        df = df.reindex(columns=index, fill_value=0)
+    df = df.cumsum(axis=1).stack().to_frame('nEdits').reset_index()
     return df
 
 
@@ -106,7 +114,7 @@ def generate_list_of_dataframes(list_of_series, list_of_names):
 #### Helper users active ####
 
 def users_active_more_than_x_editions(data, index, x):
-    monthly_edits = data.groupby([pd.Grouper(key='timestamp', freq='MS'), 'contributor_name']).size()
+    monthly_edits = data.groupby([pd.Grouper(key='timestamp', freq='MS'), 'contributor_name'], observed=True).size()
     monthly_edits_filtered = monthly_edits[monthly_edits > x].to_frame(name='pages_edited').reset_index()
     series = monthly_edits_filtered.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
     if index is not None:
@@ -116,44 +124,36 @@ def users_active_more_than_x_editions(data, index, x):
 
 #### Helper metric 2 ####
 
-def add_x_months(data, months):
-    return data['timestamp'].apply(lambda x: x + relativedelta(months = +months))
-
-
-def displace_x_months_per_user(data, months):
-    return data.shift(months)
-
-
-def current_streak_x_or_y_months_in_a_row(mothly, index, z, y, edits):
-
-    mothly['add_months'] = add_x_months(mothly, z)
-    lista = ['contributor_id']
-    lista.append('add_months')
-    if y > 0:
-      mothly['add_y_months'] = add_x_months(mothly, y)
-      lista.append('add_y_months')
-    group_users = mothly[lista].groupby(['contributor_id'])
-    displace_z_month = displace_x_months_per_user(group_users['add_months'], z)
-    mothly['displace']= displace_z_month
+def current_streak_between_x_and_y_months(contributor_months, index, x, y, edits):
+    '''
+    Monthly number of users (or their edits, if edits == 1) whose current
+    streak of consecutive months editing is between x and y months
+    (both included), or at least x months if y == 0.
+    '''
+    streak = contributor_months.table['streak']
     if y > 0:
-      displace_y_month = displace_x_months_per_user(group_users['add_y_months'], y)
-      mothly['displace_y_month']= displace_y_month
-      current_streak = mothly[(mothly['displace'] == mothly['timestamp']) & (mothly['displace_y_month'] != mothly['timestamp'])]
-    elif z == 1:
-      current_streak = mothly[mothly['displace'] != mothly['timestamp']]
-    elif z == 6:
-      current_streak = mothly[mothly['displace'] == mothly['timestamp']]
+        condition = (streak >= x) & (streak <= y)
+    else:
+        condition = streak >= x
 
     if edits == 0:
-      series = current_streak.groupby(pd.Grouper(key = 'timestamp', freq = 'MS')).size()
+        series = contributor_months.users_per_month(condition, index)
     elif edits == 1:
-      series = current_streak.groupby(pd.Grouper(key = 'timestamp', freq = 'MS'))['size'].sum()
-
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
+        series = contributor_months.edits_per_month(condition, index)
     return series
 
 
+def calculate_current_streak(contributor_months, index, edits):
+    this_month = current_streak_between_x_and_y_months(contributor_months, index, 1, 1, edits)
+    two_three_months = current_streak_between_x_and_y_months(contributor_months, index, 2, 3, edits)
+    four_six_months = current_streak_between_x_and_y_months(contributor_months, index, 4, 6, edits)
+    more_six = current_streak_between_x_and_y_months(contributor_months, index, 7, 0, edits)
+
+    set_category_name([this_month, two_three_months, four_six_months, more_six], ['1 month editing', 'Btw. 2 and 3 consecutive months', 'Btw. 4 and 6 consecutive months', 'More than 6 consecutive months'])
+
+    return [this_month, two_three_months, four_six_months, more_six, 1]
+
+
 def edition_concrete(data, index, pagType):
     filterData = data[data['page_ns'] == pagType]
     series = filterData.groupby([pd.Grouper(key ='timestamp', freq='MS')]).size()
@@ -294,43 +294,19 @@ def users_reincident(data, index):
 ############################ METRIC 2 #################################################################################################
 
 def current_streak(data, index):
-    data = filter_anonymous(data)
-
-    mothly = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('size').reset_index()
-
-    this_month = current_streak_x_or_y_months_in_a_row(mothly, index, 1, 0, 0)
-    two_three_months = current_streak_x_or_y_months_in_a_row(mothly, index, 1, 3, 0)
-    four_six_months = current_streak_x_or_y_months_in_a_row(mothly, index, 3, 6, 0)
-    more_six = current_streak_x_or_y_months_in_a_row(mothly, index, 6, 0, 0)
-
-    set_category_name([this_month, two_three_months, four_six_months, more_six], ['1 month editing', 'Btw. 2 and 3 consecutive months', 'Btw. 4 and 6 consecutive months', 'More than 6 consecutive months'])
-
-    return [this_month, two_three_months, four_six_months, more_six, 1]
+    return calculate_current_streak(get_contributor_months(data), index, 0)
 
 
 def current_streak_only_mains(data, index):
-    data = data[data['page_ns']==0]
-    return current_streak(data, index)
+    return calculate_current_streak(get_contributor_months_only_mains(data), index, 0)
 
 
 def edits_by_current_streak(data, index):
-    data = filter_anonymous(data)
-
-    mothly = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('size').reset_index()
-
-    this_month = current_streak_x_or_y_months_in_a_row(mothly, index, 1, 0, 1)
-    two_three_months = current_streak_x_or_y_months_in_a_row(mothly, index, 1, 3, 1)
-    four_six_months = current_streak_x_or_y_months_in_a_row(mothly, index, 3, 6, 1)
-    more_six = current_streak_x_or_y_months_in_a_row(mothly, index, 6, 0, 1)
-
-    set_category_name([this_month, two_three_months, four_six_months, more_six], ['1 month editing', 'Btw. 2 and 3 consecutive months', 'Btw. 4 and 6 consecutive months', 'More than 6 consecutive months'])
-
-    return [this_month, two_three_months, four_six_months, more_six, 1]
+    return calculate_current_streak(get_contributor_months(data), index, 1)
 
 
 def edits_by_current_streak_only_mains(data, index):
-    data = data[data['page_ns']==0]
-    return edits_by_current_streak(data, index)
+    return calculate_current_streak(get_contributor_months_only_mains(data), index, 1)
 
 
 def edition_on_type_pages(data, index):
@@ -353,18 +329,14 @@ def edition_on_type_pages(data, index):
 def users_first_edit(data, index):
     '''Calculate the monthly number of users whose first edit was between 1 and 3, 4 and 6, 6 and 12, and more than 12 months ago
     '''
-    data = filter_anonymous(data)
-    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
-
-    mins = format_data.groupby('contributor_id')['timestamp'].transform('min')
-    format_data['months'] = format_data['timestamp'].sub(mins).div(pd.Timedelta(1, 'M')).round().astype(int)
+    contributor_months = get_contributor_months(data)
+    tenure = contributor_months.table['tenure']
 
-    this_month = users_new(data, index)
-
-    one_three = pd.Series(format_data[(format_data['months'] >= 1) & (format_data['months'] <= 3)].groupby(['timestamp']).size(), index).fillna(0)
-    four_six = pd.Series(format_data[(format_data['months'] >= 4) & (format_data['months'] <= 6)].groupby(['timestamp']).size(), index).fillna(0)
-    six_twelve = pd.Series(format_data[(format_data['months'] >= 7) & (format_data['months'] <= 12)].groupby(['timestamp']).size(), index).fillna(0)
-    more_twelve = pd.Series(format_data[format_data['months'] >= 13].groupby(['timestamp']).size(), index).fillna(0)
+    this_month = contributor_months.users_per_month(contributor_months.table['first_month'], index)
+    one_three = contributor_months.users_per_month((tenure >= 1) & (tenure <= 3), index)
+    four_six = contributor_months.users_per_month((tenure >= 4) & (tenure <= 6), index)
+    six_twelve = contributor_months.users_per_month((tenure >= 7) & (tenure <= 12), index)
+    more_twelve = contributor_months.users_per_month(tenure >= 13, index)
 
     this_month.name = 'New users'
     one_three.name = 'Btw. 1 and 3 months ago'
@@ -379,19 +351,15 @@ def users_first_edit_abs(data, index):
     '''
     Calculate the monthly percentage of users whose first edit was between 1 and 3, 4 and 6, 6 and 12, and more than 12 months ago
     '''
-    data = filter_anonymous(data)
-    monthly_total_users = data.groupby([pd.Grouper(key='timestamp', freq='MS'), 'contributor_id']).size().reset_index()
-    monthly_total_users = monthly_total_users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
-    
-    mins = format_data.groupby('contributor_id')['timestamp'].transform('min')
-    format_data['months'] = format_data['timestamp'].sub(mins).div(pd.Timedelta(1, 'M')).round().astype(int)
-    
-    this_month = (users_new(data, index) / monthly_total_users) * 100
-    one_three = ((pd.Series(format_data[(format_data['months'] >= 1) & (format_data['months'] <= 3)].groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users) * 100
-    four_six = ((pd.Series(format_data[(format_data['months'] >= 4) & (format_data['months'] <= 6)].groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users) * 100
-    six_twelve = ((pd.Series(format_data[(format_data['months'] >= 7) & (format_data['months'] <= 12)].groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users) * 100
-    more_twelve = ((pd.Series(format_data[format_data['months'] >= 13].groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users) * 100
+    contributor_months = get_contributor_months(data)
+    monthly_total_users = contributor_months.users_per_month(contributor_months.table['medits'] > 0, index)
+    tenure = contributor_months.table['tenure']
+
+    this_month = (contributor_months.users_per_month(contributor_months.table['first_month'], index) / monthly_total_users) * 100
+    one_three = (contributor_months.users_per_month((tenure >= 1) & (tenure <= 3), index) / monthly_total_users) * 100
+    four_six = (contributor_months.users_per_month((tenure >= 4) & (tenure <= 6), index) / monthly_total_users) * 100
+    six_twelve = (contributor_months.users_per_month((tenure >= 7) & (tenure <= 12), index) / monthly_total_users) * 100
+    more_twelve = (contributor_months.users_per_month(tenure >= 13, index) / monthly_total_users) * 100
 
     this_month.name = 'New users'
     one_three.name = 'Btw. 1 and 3 months ago'
@@ -407,15 +375,14 @@ def users_last_edit(data, index):
     '''
     Get the monthly number of users whose last edit was less than 1, between 2 and 3, 4 and 6, and more than 6 months ago
     '''
-    data = filter_anonymous(data)
-    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
-    format_data['months'] = format_data.groupby('contributor_id')['timestamp'].diff().div(pd.Timedelta(days=30.44), fill_value=0).round().astype(int)
+    contributor_months = get_contributor_months(data)
+    months = contributor_months.table['months_since_previous']
 
-    new_users = users_new(data, index)
-    one_month = pd.Series((format_data[format_data['months'] == 1]).groupby(['timestamp']).size(), index).fillna(0)
-    two_three_months = pd.Series((format_data[(format_data['months'] == 2) | (format_data['months'] == 3)]).groupby(['timestamp']).size(), index).fillna(0)
-    four_six_months = pd.Series((format_data[(format_data['months'] >= 4) & (format_data['months'] <= 6)]).groupby(['timestamp']).size(), index).fillna(0)
-    more_six_months = pd.Series((format_data[format_data['months'] > 6]).groupby(['timestamp']).size(), index).fillna(0)
+    new_users = contributor_months.users_per_month(contributor_months.table['first_month'], index)
+    one_month = contributor_months.users_per_month(months == 1, index)
+    two_three_months = contributor_months.users_per_month((months == 2) | (months == 3), index)
+    four_six_months = contributor_months.users_per_month((months >= 4) & (months <= 6), index)
+    more_six_months = contributor_months.users_per_month(months > 6, index)
 
     new_users.name = 'New users'
     one_month.name = '1 month ago'
@@ -429,17 +396,15 @@ def users_last_edit_abs(data, index):
     '''
     Get the monthly percentage of users whose last edit was less than 1, between 2 and 3, 4 and 6, and more than 6 months ago
     '''
-    data = filter_anonymous(data)
-    monthly_total_users = data.groupby([pd.Grouper(key='timestamp', freq='MS'), 'contributor_id']).size().reset_index()
-    monthly_total_users = monthly_total_users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
-    format_data['months'] = format_data.groupby('contributor_id')['timestamp'].diff().div(pd.Timedelta(days=30.44), fill_value=0).round().astype(int)
+    contributor_months = get_contributor_months(data)
+    monthly_total_users = contributor_months.users_per_month(contributor_months.table['medits'] > 0, index)
+    months = contributor_months.table['months_since_previous']
 
-    new_users = (users_new(data, index) / monthly_total_users) * 100
-    one_month = ((pd.Series((format_data[format_data['months'] == 1]).groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users)*100
-    two_three_months = ((pd.Series((format_data[(format_data['months'] == 2) | (format_data['months'] == 3)]).groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users)*100
-    four_six_months = ((pd.Series((format_data[(format_data['months'] >= 4) & (format_data['months'] <= 6)]).groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users)*100
-    more_six_months = ((pd.Series((format_data[format_data['months'] > 6]).groupby(['timestamp']).size(), index).fillna(0)) / monthly_total_users)*100
+    new_users = (contributor_months.users_per_month(contributor_months.table['first_month'], index) / monthly_total_users) * 100
+    one_month = (contributor_months.users_per_month(months == 1, index) / monthly_total_users)*100
+    two_three_months = (contributor_months.users_per_month((months == 2) | (months == 3), index) / monthly_total_users)*100
+    four_six_months = (contributor_months.users_per_month((months >= 4) & (months <= 6), index) / monthly_total_users)*100
+    more_six_months = (contributor_months.users_per_month(months > 6, index) / monthly_total_users)*100
 
     new_users.name = 'New users'
     one_month.name = '1 month ago'
@@ -455,16 +420,14 @@ def users_number_of_edits(data, index):
     '''
     Get the monthly number of users that belong to each category, in the Active editors by experience metric.
     '''
-    data = filter_anonymous(data)
-    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
-    format_data['nEdits'] = (format_data[['medits', 'contributor_id']].groupby(['contributor_id']))['medits'].cumsum()
-    format_data['nEdits_until_previous_month'] = (format_data[['nEdits','contributor_id']].groupby(['contributor_id']))['nEdits'].shift().fillna(-1)
+    contributor_months = get_contributor_months(data)
+    format_data = contributor_months.table
 
-    new_users = users_new(data, index)
-    one_four = pd.Series(format_data[generate_condition_users_by_number_of_edits(format_data, 1,4)].groupby(['timestamp']).size(), index).fillna(0)
-    between_5_24 = pd.Series(format_data[generate_condition_users_by_number_of_edits(format_data,5,24)].groupby(['timestamp']).size(), index).fillna(0)
-    between_25_99 = pd.Series(format_data[generate_condition_users_by_number_of_edits(format_data,25,99)].groupby(['timestamp']).size(), index).fillna(0)
-    highEq_100 = pd.Series(format_data[generate_condition_users_by_number_of_edits(format_data,100,0)].groupby(['timestamp']).size(), index).fillna(0)
+    new_users = contributor_months.users_per_month(format_data['first_month'], index)
+    one_four = contributor_months.users_per_month(generate_condition_users_by_number_of_edits(format_data, 1,4), index)
+    between_5_24 = contributor_months.users_per_month(generate_condition_users_by_number_of_edits(format_data,5,24), index)
+    between_25_99 = contributor_months.users_per_month(generate_condition_users_by_number_of_edits(format_data,25,99), index)
+    highEq_100 = contributor_months.users_per_month(generate_condition_users_by_number_of_edits(format_data,100,0), index)
 
 
     new_users.name = 'New users'
@@ -600,22 +563,14 @@ def number_of_edits_by_experience_abs(data, index):
     '''
     Get the monthly number of edits by each user category in the Active editors by experience metric
     '''
-    data = filter_anonymous(data)
-    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
-    format_data['nEdits'] = (format_data[['medits', 'contributor_id']].groupby(['contributor_id']))['medits'].cumsum()
-    format_data['nEdits_until_previous_month'] = (format_data[['nEdits','contributor_id']].groupby(['contributor_id']))['nEdits'].shift().fillna(-1)
-
-    new_users = format_data[generate_condition_users_by_number_of_edits(format_data, 0,0)]
-    one_four = format_data[generate_condition_users_by_number_of_edits(format_data, 1,4)]
-    between_5_24 = format_data[generate_condition_users_by_number_of_edits(format_data, 5,24)]
-    between_25_99 = format_data[generate_condition_users_by_number_of_edits(format_data, 25,99)]
-    highEq_100 = format_data[generate_condition_users_by_number_of_edits(format_data, 100,0)]
+    contributor_months = get_contributor_months(data)
+    format_data = contributor_months.table
 
-    new_users = new_users.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
-    one_four = one_four.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
-    between_5_24 = between_5_24.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
-    between_25_99 = between_25_99.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
-    highEq_100 = highEq_100.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    new_users = contributor_months.edits_per_month(generate_condition_users_by_number_of_edits(format_data, 0,0), index)
+    one_four = contributor_months.edits_per_month(generate_condition_users_by_number_of_edits(format_data, 1,4), index)
+    between_5_24 = contributor_months.edits_per_month(generate_condition_users_by_number_of_edits(format_data, 5,24), index)
+    between_25_99 = contributor_months.edits_per_month(generate_condition_users_by_number_of_edits(format_data, 25,99), index)
+    highEq_100 = contributor_months.edits_per_month(generate_condition_users_by_number_of_edits(format_data, 100,0), index)
 
     new_users.name = "New users"
     one_four.name = "Btw. 1 and 4 edits"
@@ -632,11 +587,8 @@ def number_of_edits_by_experience_rel(data, index):
     '''
     categories = number_of_edits_by_experience_abs(data, index)
 
-    data = filter_anonymous(data)
-    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
-    format_data['nEdits'] = (format_data[['medits', 'contributor_id']].groupby(['contributor_id']))['medits'].cumsum()
-    format_data['nEdits_until_previous_month'] = (format_data[['nEdits','contributor_id']].groupby(['contributor_id']))['nEdits'].shift().fillna(-1)
-    monthly_total_edits = format_data.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    contributor_months = get_contributor_months(data)
+    monthly_total_edits = contributor_months.edits_per_month(contributor_months.table['medits'] > 0, index)
 
     edits_new_users = ((categories[0] / monthly_total_edits)*100).fillna(0)
     edits_beginners = ((categories[1] / monthly_total_edits)*100).fillna(0)
@@ -658,23 +610,14 @@ def number_of_edits_by_tenure(data, index):
     '''
     Get the monthly number of edits by each user category in the Users by tenure metric
     '''
-    data = filter_anonymous(data)
-    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
-
-    mins = format_data.groupby('contributor_id')['timestamp'].transform('min')
-    format_data['months'] = format_data['timestamp'].sub(mins).div(pd.Timedelta(1, 'M')).round().astype(int)
-
-    new_users = format_data[format_data['months'] == 0]
-    one_three = format_data[(format_data['months'] >= 1) & (format_data['months'] <= 3)]
-    four_six = format_data[(format_data['months'] >= 4) & (format_data['months'] <= 6)]
-    six_twelve = format_data[(format_data['months'] >= 7) & (format_data['months'] <= 12)]
-    more_twelve = format_data[format_data['months'] >= 13]
+    contributor_months = get_contributor_months(data)
+    tenure = contributor_months.table['tenure']
 
-    new_users = new_users.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
-    one_three = one_three.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
-    four_six = four_six.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
-    six_twelve = six_twelve.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
-    more_twelve = more_twelve.groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    new_users = contributor_months.edits_per_month(tenure == 0, index)
+    one_three = contributor_months.edits_per_month((tenure >= 1) & (tenure <= 3), index)
+    four_six = contributor_months.edits_per_month((tenure >= 4) & (tenure <= 6), index)
+    six_twelve = contributor_months.edits_per_month((tenure >= 7) & (tenure <= 12), index)
+    more_twelve = contributor_months.edits_per_month(tenure >= 13, index)
 
 
     new_users.name = 'New users'
@@ -692,9 +635,8 @@ def number_of_edits_by_tenure_abs(data, index):
     '''
     categories = number_of_edits_by_tenure(data, index)
 
-    data = filter_anonymous(data)
-    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
-    monthly_total_edits = format_data.groupby(['timestamp'])['medits'].sum()
+    contributor_months = get_contributor_months(data)
+    monthly_total_edits = contributor_months.edits_per_month(contributor_months.table['medits'] > 0, index)
 
     new_users = (categories[0]/monthly_total_edits)*100
     one_three = (categories[1]/monthly_total_edits)*100
@@ -716,15 +658,14 @@ def number_of_edits_by_last_edit(data, index):
     '''
     Get the monthly number of edits by each user category in the Users by the date of the last edit metric
     '''
-    data = filter_anonymous(data)
-    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
-    format_data['months'] = format_data.groupby('contributor_id')['timestamp'].diff().div(pd.Timedelta(days=30.44), fill_value=0).round().astype(int)
+    contributor_months = get_contributor_months(data)
+    months = contributor_months.table['months_since_previous']
 
-    new_users = (format_data[format_data['months'] == 0]).groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
-    one_month = (format_data[format_data['months'] == 1]).groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
-    two_three_months = (format_data[(format_data['months'] == 2) | (format_data['months'] == 3)]).groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
-    four_six_months = (format_data[(format_data['months'] >= 4) & (format_data['months'] <= 6)]).groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
-    more_six_months = (format_data[format_data['months'] > 6]).groupby(['timestamp'])['medits'].sum().reindex(index).fillna(0)
+    new_users = contributor_months.edits_per_month(months == 0, index)
+    one_month = contributor_months.edits_per_month(months == 1, index)
+    two_three_months = contributor_months.edits_per_month((months == 2) | (months == 3), index)
+    four_six_months = contributor_months.edits_per_month((months >= 4) & (months <= 6), index)
+    more_six_months = contributor_months.edits_per_month(months > 6, index)
 
     new_users.name = 'New users'
     one_month.name = '1 month ago'
@@ -740,9 +681,8 @@ def number_of_edits_by_last_edit_abs(data, index):
     Get the monthly proportion of edits done by each user category in the Users by the date of the last edit metric
     '''
     categories = number_of_edits_by_last_edit(data, index)
-    data = filter_anonymous(data)
-    format_data = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('medits').reset_index()
-    monthly_total_edits = format_data.groupby(['timestamp'])['medits'].sum()
+    contributor_months = get_contributor_months(data)
+    monthly_total_edits = contributor_months.edits_per_month(contributor_months.table['medits'] > 0, index)
 
     new_users = (categories[0] / monthly_total_edits) * 100
     one_month = (categories[1] / monthly_total_edits) * 100
@@ -766,44 +706,35 @@ def contributor_pctg_per_contributions_pctg(data, index):
     Calculate which % of contributors has contributed
     in a 50%, 80%, 90% and 99% of the total wiki edits until each month.
     """
-    data = filter_anonymous(data)
-    format_data =data.groupby(['contributor_id']).apply(lambda x: x.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('nEdits_cumulative').reindex(index, fill_value=0).cumsum()).reset_index()
-    format_data['monthly_total_edits'] = format_data.groupby('timestamp')['nEdits_cumulative'].transform('sum')
-
-    format_data['edits%'] = (format_data['nEdits_cumulative'] / format_data['monthly_total_edits']) * 100
-    format_data = format_data.sort_values(['timestamp', 'edits%'], ascending=[True, False])
-    format_data['edits%accum'] = format_data.groupby('timestamp')['edits%'].cumsum()
-    format_data = format_data[format_data['edits%'] > 0]
-    monthly_total_users = format_data.groupby('timestamp').size().reindex(index).fillna(0)
-    monthly_total_users = monthly_total_users[monthly_total_users >= 10].reindex(index)
-
-    p = [1 for j in range(1, len(format_data.index)+1)]
-    format_data['count'] = p
-    format_data['count_acum'] = format_data.groupby('timestamp')['count'].cumsum()
-
-    category_50 = (format_data[format_data['edits%accum'] >= 50]).groupby('timestamp').head(1)
-    category_50 = category_50.set_index(category_50['timestamp']).reindex(index).fillna(0)['count_acum']
-    category_50= (((category_50 / monthly_total_users)*100)).fillna(0)
-
-    category_80 = (format_data[(format_data['edits%accum'] >=80)]).groupby('timestamp').head(1)
-    category_80 = category_80.set_index(category_80['timestamp']).reindex(index).fillna(0)['count_acum']
-    category_80 = (((category_80 / monthly_total_users)*100)).fillna(0)
-
-    category_90 = (format_data[(format_data['edits%accum'] >=90)]).groupby('timestamp').head(1)
-    category_90 = category_90.set_index(category_90['timestamp']).reindex(index).fillna(0)['count_acum']
-    category_90 = (((category_90 / monthly_total_users)*100)).fillna(0)
-
-    category_99 = (format_data[(format_data['edits%accum'] >=99)]).groupby('timestamp').head(1)
-    category_99 = category_99.set_index(category_99['timestamp']).reindex(index).fillna(0)['count_acum']
-    category_99 = (((category_99 / monthly_total_users)*100)).fillna(0)
+    edits_matrix = get_edits_matrix(data)
+    if index is None or index.equals(edits_matrix.index):
+        index = edits_matrix.index
+        nEdits_cumulative = edits_matrix.registered_cumulative
+    else:
+        monthly = pd.DataFrame(edits_matrix.registered_monthly.toarray(),
+                                columns=edits_matrix.index)
+        nEdits_cumulative = np.cumsum(monthly.reindex(columns=index, fill_value=0).values, axis=1)
 
+    # contributions of every user sorted in descending order per month
+    nEdits_cumulative = -np.sort(-nEdits_cumulative, axis=0)
+    monthly_total_edits = nEdits_cumulative.sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        edits_pctg_accum = np.cumsum((nEdits_cumulative / monthly_total_edits) * 100, axis=0)
 
-    category_50.name = "50% of edits"
-    category_80.name = "80% of edits"
-    category_90.name = "90% of edits"
-    category_99.name = "99% of edits"
+    monthly_total_users = pd.Series((nEdits_cumulative > 0).sum(axis=0), index=index)
+    monthly_total_users = monthly_total_users[monthly_total_users >= 10].reindex(index)
 
-    return[category_50, category_80, category_90, category_99]
+    categories = []
+    for pctg in [50, 80, 90, 99]:
+        reached = edits_pctg_accum >= pctg
+        # number of top users needed to reach pctg of edits, 0 if never reached
+        n_users = np.where(reached.any(axis=0), reached.argmax(axis=0) + 1, 0)
+        category = pd.Series(n_users, index=index)
+        category = (((category / monthly_total_users)*100)).fillna(0)
+        category.name = "{}% of edits".format(pctg)
+        categories.append(category)
+
+    return categories
 
 
 def contributor_pctg_per_contributions_pctg_per_month(data, index):
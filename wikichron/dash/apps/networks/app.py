@@ -324,6 +324,7 @@ def start_download_data_server(app, download_pathname):
 
         network = data_controller.get_network(wikis[0], network_code,
                 lower_bound, upper_bound)
+        network.calculate_metrics()
 
         tmp = TempFS()
 
@@ -376,6 +377,7 @@ def _init_global_vars():
     global available_wikis_dict;
 
     available_networks = interface.get_available_networks()
+    interface.set_precooked_dir(data_controller.precooked_net_dir)
     available_wikis = data_controller.get_available_wikis()
     available_wikis_dict = {wiki['domain']: wiki for wiki in available_wikis}
 
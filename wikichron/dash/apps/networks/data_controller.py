@@ -14,13 +14,12 @@ WikiChron code.
 # Built-in imports
 import pandas as pd
 import os
-import numpy as np
 import time
 from datetime import datetime
-from warnings import warn
 import json
 
 # Local imports:
+from wikichron.utils.data_store import get_data_store
 from .networks import interface
 
 # get csv data location (data/ by default)
@@ -35,16 +34,8 @@ def set_cache(cache):
 
     # we need to declare as *global* all the cached functions we want to be
     #  available to be used from outside of this file.
-    global read_data
     global get_network
-
-    @cache.memoize()
-    def read_data(wiki):
-        df = get_dataframe_from_csv(wiki['data'])
-        prepare_data(df)
-        df = clean_up_bot_activity(df, wiki)
-        return df
-
+    global get_network_metric
 
     @cache.memoize(timeout=3600)
     def get_network(wiki, network_code, lower_bound = '', upper_bound = ''):
@@ -71,8 +62,47 @@ def set_cache(cache):
         return network
 
 
+    @cache.memoize(timeout=3600)
+    def get_network_metric(wiki, network_code, metric, lower_bound = '', upper_bound = ''):
+        """
+        Parameters
+            - wiki, network_code, lower_bound, upper_bound: as in get_network()
+            - metric: key of a node metric or network stat of the network.
+        Return: The values of the metric and of the ones calculated along
+            with it (see BaseNetwork.get_metric_values()).
+        """
+        network = get_network(wiki, network_code, lower_bound, upper_bound)
+        time_start_calculations = time.perf_counter()
+        values = network.get_metric_values(metric)
+        time_end_calculations = time.perf_counter() - time_start_calculations
+        print(' * [Timing] Calculating {} : {} seconds'.format(metric, time_end_calculations))
+        return values
+
+
 ### OTHER DATA-RELATED FUNCTIONS ###
 
+def get_network_with_metrics(wiki, network_code, lower_bound = '', upper_bound = '',
+    metrics = []):
+    """
+       Returns the network (see get_network()) along with the given metrics,
+       which are calculated only once per wiki, network and time window.
+    """
+    network = get_network(wiki, network_code, lower_bound, upper_bound)
+    for metric in metrics:
+        if not network.has_metric(metric):
+            network.set_metric_values(get_network_metric(wiki, network_code,
+                                        metric, lower_bound, upper_bound))
+    return network
+
+
+def read_data(wiki):
+    """
+       Returns the data of the wiki, sorted by timestamp and without bots
+       activity, from the data store shared by all the apps.
+    """
+    return get_data_store().get(wiki)
+
+
 def get_available_wikis():
     wikis_json_file = open(os.path.join(data_dir, 'wikis.json'))
     wikis = json.load(wikis_json_file)
@@ -87,57 +117,6 @@ def get_last_entry(wiki):
     return wiki['last_edit']['date']
 
 
-def remove_bots_activity(df, bots_ids):
-    """
-       Filter out bots activity from pandas dataframe.
-
-       df -- data to be filtered. It'll be modified in place
-       bots_ids -- numpy array with the userid for every bot
-       Return a dataframe derived from the original but with all the
-          editions made by bot users removed
-    """
-    bots = np.array(bots_ids)
-    return df[~df['contributor_id'].isin(bots)]
-
-
-def prepare_data(df):
-    """
-       Prepare data in the correct input format for the metric
-       calculation functions.
-
-       df -- data to be prepared.
-       Modifies inplace the input data as well as returns that data
-       in the appropiate format for further calling of metric functions.
-    """
-    return df.sort_values(by='timestamp', inplace=True)
-
-
-def get_dataframe_from_csv(csv):
-    """ Read and parse a csv and return the corresponding pandas dataframe"""
-
-    print('Loading csv for ' + csv)
-    time_start_loading_one_csv = time.perf_counter()
-    df = pd.read_csv(os.path.join(data_dir, csv),
-                    delimiter=',', quotechar='|',
-                    index_col=False)
-    df['timestamp']=pd.to_datetime(df['timestamp'],format='%Y-%m-%dT%H:%M:%SZ')
-    print('!!Loaded csv for ' + csv)
-    time_end_loading_one_csv = time.perf_counter() - time_start_loading_one_csv
-    print(' * [Timing] Loading {} : {} seconds'
-                    .format(csv, time_end_loading_one_csv))
-    df.index.name = csv
-    return df
-
-
-def clean_up_bot_activity(df, wiki):
-    if 'bots' in wiki:
-        botsids = [bot['id'] for bot in wiki['bots']]
-        return remove_bots_activity(df, botsids)
-    else:
-        warn("Warning: Missing information of bots ids. Note that graphs can be polluted of non-human activity.")
-    return df
-
-
 def get_bot_names(wiki: dict) -> set:
     wikis_json_file = open(os.path.join(data_dir, 'wikis.json'))
     wikis = json.load(wikis_json_file)
@@ -78,12 +78,17 @@ def bind_callbacks(app):
 
     @app.callback(
         Output('network-ready', 'value'),
-        [Input('dates-slider', 'value')],
+        [Input('dates-slider', 'value'),
+        Input('dd-color-metric', 'value'),
+        Input('dd-size-metric', 'value'),
+        Input('tg-show-clusters', 'on')],
         [State('initial-selection', 'children'),
         State('dates-index', 'children'),
-        State('dates-index-end', 'children')]
+        State('dates-index-end', 'children'),
+        State('network-ready', 'value')]
     )
-    def update_network(slider, selection_json, time_index_beg, time_index_end):
+    def update_network(slider, dd_color, dd_size, clus_switch, selection_json,
+        time_index_beg, time_index_end, cy_network):
         if not slider:
             raise PreventUpdate()
 
@@ -95,11 +100,26 @@ def bind_callbacks(app):
         wiki = selection['wikis'][0]
         network_code = selection['network']
 
+        # only the metrics shown are calculated along with the network
+        node_metrics = net_factory.get_node_metrics(network_code)
+        metrics = [node_metrics[dd]['key'] for dd in (dd_color, dd_size) if dd]
+        if clus_switch:
+            metrics.append('cluster_color')
+
+        # if only the metrics changed, check whether they are already there
+        trigger = dash.callback_context
+        trigger = trigger.triggered[0]['prop_id'].split('.')[0]
+        if trigger != 'dates-slider' and cy_network:
+            nodes = cy_network['nodes']
+            if not cy_network['plotted_nodes'] or all(metric in nodes for metric in metrics):
+                raise PreventUpdate()
+
         if debug:
             print(f'Updating network with values:\
             \n\t- wiki: {wiki["url"]}\
             \n\t- network: {network_code}\
-            \n\t- slider: ({slider[0]},{slider[1]})')
+            \n\t- slider: ({slider[0]},{slider[1]})\
+            \n\t- metrics: {metrics}')
 
         print(' * [Info] Building the network....')
         time_start_calculations = time.perf_counter()
@@ -107,8 +127,8 @@ def bind_callbacks(app):
         lower_bound = time_index_beg[slider[0]]
         upper_bound = time_index_end[slider[1]]
 
-        network = data_controller.get_network(wiki, network_code,
-                                            lower_bound, upper_bound)
+        network = data_controller.get_network_with_metrics(wiki, network_code,
+                                            lower_bound, upper_bound, metrics)
 
         time_end_calculations = time.perf_counter() - time_start_calculations
         print(f' * [Timing] Network ready in {time_end_calculations} seconds')
@@ -192,10 +212,10 @@ def bind_callbacks(app):
     def add_network_elements(cy_network, _1, _2):
         if not cy_network:
             raise PreventUpdate()
-        if 'network' not in cy_network:
+        if 'nodes' not in cy_network:
             raise PreventUpdate()
 
-        return [1, cy_network['network']]
+        return [1, BaseNetwork.to_cytoscape_elements(cy_network)]
 
 
     @app.callback(
@@ -432,26 +452,57 @@ def bind_callbacks(app):
     @app.callback(
         Output('net-stats', 'children'),
         [Input('network-ready', 'value')],
-        [State('initial-selection', 'children')]
+        [State('dates-slider', 'value'),
+        State('initial-selection', 'children'),
+        State('dates-index', 'children'),
+        State('dates-index-end', 'children'),
+        State('dd-color-metric', 'value'),
+        State('dd-size-metric', 'value'),
+        State('dd-local-metric', 'value')]
     )
-    def update_network_stats(cy_network, selection_json):
-        if not cy_network:
+    def update_network_stats(cy_network, slider, selection_json, time_index_beg,
+        time_index_end, dd_color, dd_size, dd_local):
+        if not cy_network or not slider:
             raise PreventUpdate()
 
         selection = json.loads(selection_json)
+        wiki = selection['wikis'][0]
         network_code = selection['network']
 
+        time_index_beg = json.loads(time_index_beg)
+        time_index_end = json.loads(time_index_end)
+
+        lower_bound = time_index_beg[slider[0]]
+        upper_bound = time_index_end[slider[1]]
+
+        # the stats are calculated now, once the network has been plotted,
+        #  but the ones depending on expensive node metrics (betweenness...)
+        #  only if those metrics are shown, so they are already calculated
+        node_metrics = net_factory.get_node_metrics(network_code)
+        shown_metrics = [node_metrics[dd]['key'] for dd in (dd_color, dd_size) if dd]
+        if dd_local:
+            shown_metrics.append(net_factory.get_metrics_to_plot(network_code)[dd_local])
+
         stats = net_factory.get_network_stats(network_code)
+        stats_to_calculate = net_factory.get_stats_to_calculate(network_code, shown_metrics)
+        network = data_controller.get_network_with_metrics(wiki, network_code,
+                        lower_bound, upper_bound, stats_to_calculate)
+        net_stats = {attr: network.graph[attr] for attr in network.graph.attributes()}
+
         child = []
         i = 0
         group = []
         for k, val in stats.items():
-            if val not in cy_network:
+            if val not in stats_to_calculate:
+                value = html.P('-', title='Select the metric it depends on to calculate it')
+            elif val in net_stats:
+                value = html.P(net_stats[val])
+            else:
                 continue
 
             group.append(html.Div(children=[
                 html.P(f'{k}:'),
-                html.P(cy_network[val])
+                value
             ]))
 
             i += 1
@@ -461,6 +512,13 @@ def bind_callbacks(app):
         if group:
             child.append(html.Div(children=group))
 
+        # let the user know if the network plotted has been pruned
+        if cy_network['plotted_nodes'] < cy_network['num_nodes']\
+            or cy_network['plotted_edges'] < cy_network['num_edges']:
+            child.insert(0, html.P(f'Showing {cy_network["plotted_nodes"]} of '
+                f'{cy_network["num_nodes"]} nodes and {cy_network["plotted_edges"]} '
+                f'of {cy_network["num_edges"]} edges, the ones with the highest weight'))
+
         return child
 
 
@@ -494,8 +552,9 @@ def bind_callbacks(app):
             lower_bound = time_index_beg[slider[0]]
             upper_bound = time_index_end[slider[1]]
 
-            network = data_controller.get_network(wiki, network_code,
-                                                  lower_bound, upper_bound)
+            metric_key = net_factory.get_metrics_to_plot(network_code)[metric]
+            network = data_controller.get_network_with_metrics(wiki, network_code,
+                                        lower_bound, upper_bound, [metric_key])
 
             df = network.get_metric_dataframe(metric)
 
@@ -565,9 +624,12 @@ def bind_callbacks(app):
         Input('dates-slider', 'value')],
         [State('initial-selection', 'children'),
         State('cytoscape', 'tapNode'),
-        State('old-state-node', 'value')]
+        State('old-state-node', 'value'),
+        State('dates-index', 'children'),
+        State('dates-index-end', 'children')]
     )
-    def update_node_info(user_info, _, selection_json, node, old_click):
+    def update_node_info(user_info, slider, selection_json, node, old_click,
+        time_index_beg, time_index_end):
         if not user_info:
             raise PreventUpdate()
 
@@ -575,11 +637,24 @@ def bind_callbacks(app):
             return NO_DATA_NODE_STATS_HEADER, NO_DATA_NODE_STATS_BODY, old_click
 
         selection = json.loads(selection_json)
+        wiki = selection['wikis'][0]
         network_code = selection['network']
         dict_header = net_factory.get_node_name(network_code)
         dic_info = net_factory.get_user_info(network_code)
         dic_metrics = net_factory.get_metrics_to_show(network_code)
 
+        # metrics not plotted yet are calculated now
+        missing = [key for key in list(dic_info.values()) + list(dic_metrics.values())
+                    if key not in user_info]
+        if missing and slider:
+            time_index_beg = json.loads(time_index_beg)
+            time_index_end = json.loads(time_index_end)
+            network = data_controller.get_network_with_metrics(wiki, network_code,
+                            time_index_beg[slider[0]], time_index_end[slider[1]], missing)
+            if int(user_info['name']) < network.graph.vcount():
+                user_info = dict(network.graph.vs[int(user_info['name'])].attributes(),
+                                **user_info)
+
         header_key = list(dict_header.keys())[0]
         header = f'{header_key}: {user_info[dict_header[header_key]]}'
 
@@ -12,6 +12,7 @@
 
 from .models import available_networks as _available_networks
 from .models.networks_generator import factory_network as _factory_network
+from .models import windows as _windows
 
 
 def get_available_networks():
@@ -21,3 +22,21 @@ def get_available_networks():
 
 def factory_network(selected_network_code, wiki):
     return _factory_network(selected_network_code, wiki)
+
+
+def set_precooked_dir(precooked_dir):
+    """ Set the directory the precooked networks data is read from and written to """
+    _windows.precooked_dir = precooked_dir
+
+
+def write_precooked_network(network_code, wiki, df):
+    """
+    Builds the windows data of a network for df, the full data of wiki,
+    and writes it in the precooked directory.
+    Returns the path of the file written, or None if the network has none.
+    """
+    network = _factory_network(network_code, wiki['name'])
+    network_windows = network.build_windows(df)
+    if network_windows is None:
+        return None
+    return _windows.write_precooked(network_windows, df, network_code)
@@ -5,16 +5,47 @@
 """
 
 import abc
-from datetime import datetime
+import os
+import time
 import pandas as pd
 from igraph import Graph, ClusterColoringPalette, VertexClustering,\
-    WEAK
+    WEAK, ALL
 from colormap.colors import rgb2hex
-from math import log1p as log
 import inequality_coefficients as ineq
 import numpy as np
 
 from .fix_dendrogram import fix_dendrogram
+from .first_edits import get_first_edits
+
+# Networks with more nodes or edges than these get their betweenness and
+#  closeness approximated (see calculate_betweenness() and calculate_closeness())
+APPROX_MAX_NODES = int(os.getenv('WIKICHRON_NETWORKS_APPROX_NODES', 2000))
+APPROX_MAX_EDGES = int(os.getenv('WIKICHRON_NETWORKS_APPROX_EDGES', 50000))
+# Max length of the paths considered by the approximated betweenness, in
+#  number of edges of median weight (see calculate_betweenness())
+BETWEENNESS_CUTOFF = float(os.getenv('WIKICHRON_NETWORKS_BETWEENNESS_CUTOFF', 4))
+# Number of sampled nodes the approximated closeness is estimated from
+CLOSENESS_SAMPLES = int(os.getenv('WIKICHRON_NETWORKS_CLOSENESS_SAMPLES', 256))
+# Max number of nodes and edges sent to be plotted, 0 (default) for no limit.
+#  Bigger networks are pruned to the nodes and edges with the highest weight
+#  (see prune_to_plot()), which is noted in the network stats
+PLOT_MAX_NODES = int(os.getenv('WIKICHRON_NETWORKS_PLOT_MAX_NODES', 0))
+PLOT_MAX_EDGES = int(os.getenv('WIKICHRON_NETWORKS_PLOT_MAX_EDGES', 0))
+# Community detection algorithm, one of COMMUNITY_ALGORITHMS or 'auto' (by
+#  the size of the network). It can be set per network type in
+#  WIKICHRON_NETWORKS_COMMUNITIES_<NETWORK CODE>, see get_community_algorithm()
+COMMUNITY_ALGORITHM = os.getenv('WIKICHRON_NETWORKS_COMMUNITIES', 'walktrap')
+# 'auto' uses walktrap for networks up to these nodes and edges, and a
+#  faster algorithm (leiden if available, else multilevel) for bigger ones
+WALKTRAP_MAX_NODES = int(os.getenv('WIKICHRON_NETWORKS_WALKTRAP_NODES', 1000))
+WALKTRAP_MAX_EDGES = int(os.getenv('WIKICHRON_NETWORKS_WALKTRAP_EDGES', 20000))
+# Method which detects the communities of the network with every algorithm
+COMMUNITY_ALGORITHMS = {
+    'walktrap': 'find_communities_walktrap',
+    'multilevel': 'find_communities_multilevel',
+    'label_propagation': 'find_communities_label_propagation',
+    'leiden': 'find_communities_leiden',
+}
 
 
 class BaseNetwork(metaclass=abc.ABCMeta):
@@ -75,6 +106,7 @@ class BaseNetwork(metaclass=abc.ABCMeta):
         'Edges': 'num_edges',
         'Connected comp.': 'components',
         'Clusters': 'n_communities',
+        'Modularity': 'modularity',
         'Density': 'density',
         'Assortativity': 'assortativity_degree',
         'Gini of betwee.': 'gini_betweenness',
@@ -84,6 +116,49 @@ class BaseNetwork(metaclass=abc.ABCMeta):
         'Gini of out-deg.': 'gini_outdegree'
     }
 
+    # Method which calculates every node metric and network stat (keys of
+    # vertex and graph attrs). They are only calculated when first needed.
+    METRIC_CALCULATORS = {
+        'page_rank': 'calculate_page_rank',
+        'betweenness': 'calculate_betweenness',
+        'approximate_betweenness': 'calculate_betweenness',
+        'gini_betweenness': 'calculate_gini_betweenness',
+        'degree': 'calculate_degree',
+        'indegree': 'calculate_degree',
+        'outdegree': 'calculate_degree',
+        'gini_degree': 'calculate_gini_degree',
+        'gini_indegree': 'calculate_gini_degree',
+        'gini_outdegree': 'calculate_gini_degree',
+        'assortativity_degree': 'calculate_assortativity_degree',
+        'cluster': 'calculate_communities',
+        'cluster_color': 'calculate_communities',
+        'n_communities': 'calculate_communities',
+        'modularity': 'calculate_communities',
+        'communities_algorithm': 'calculate_communities',
+        'communities_time': 'calculate_communities',
+        'density': 'calculate_density',
+        'components': 'calculate_components',
+        'closeness': 'calculate_closeness',
+        'approximate_closeness': 'calculate_closeness',
+        'gini_closeness': 'calculate_gini_closeness',
+        'gini_article_edits': 'calculate_gini_article_edits',
+        'gini_talk_edits': 'calculate_gini_talk_edits',
+        'gini_user_talks': 'calculate_gini_user_talk_edits'
+    }
+
+    # Metrics which have to be calculated before others
+    METRIC_DEPENDENCIES = {
+        'gini_betweenness': ['betweenness'],
+        'gini_degree': ['degree', 'indegree', 'outdegree'],
+        'gini_indegree': ['indegree', 'outdegree'],
+        'gini_outdegree': ['indegree', 'outdegree'],
+        'gini_closeness': ['closeness']
+    }
+
+    # Network stats which need expensive node metrics: they are only
+    # calculated when those metrics are shown (see get_stats_to_calculate())
+    DEFERRED_STATS = {'gini_betweenness', 'gini_closeness'}
+
 
     def __init__(self, is_directed = False, graph = {}, alias = ''):
         if not graph:
@@ -106,6 +181,30 @@ class BaseNetwork(metaclass=abc.ABCMeta):
         pass
 
 
+    def build_windows(self, df: pd.DataFrame):
+        """
+        Returns the windows data (see windows.py) of the network for df,
+        the full data of a wiki, or None if the network has none
+        """
+        return None
+
+
+    def generate_from_windows(self, df: pd.DataFrame, lower_bound: str,
+        upper_bound: str) -> bool:
+        """
+        Fill the igraph attribute with the network between lower_bound and
+        upper_bound from its per-wiki windows data (see windows.py), which
+        is built only once for the whole wiki.
+
+        Parameters:
+            -df: the full data of a wiki, as build_network() gets it
+
+        Return: False if the network has no windows data or it isn't
+            available for df, and then generate_from_pandas() must be used.
+        """
+        return False
+
+
     @abc.abstractmethod
     def get_metric_dataframe(self, metric: str) -> pd.DataFrame:
         """
@@ -193,72 +292,114 @@ class BaseNetwork(metaclass=abc.ABCMeta):
         self.graph['num_edges'] = self.graph.ecount()
 
 
+    def prune_to_plot(self) -> (np.ndarray, np.ndarray):
+        """
+        Chooses the nodes and edges to plot: if there are more than
+        PLOT_MAX_NODES nodes, the ones with the highest total weight (or
+        degree) of their edges, and then, if there are more than
+        PLOT_MAX_EDGES edges between them, the ones with the highest weight.
+
+        Return:
+            The indexes of the nodes and of the edges to plot, sorted
+        """
+        nodes = np.arange(self.graph.vcount())
+        edges = np.arange(self.graph.ecount())
+        weight = 'weight' if 'weight' in self.graph.es.attributes() else None
+
+        if PLOT_MAX_NODES and len(nodes) > PLOT_MAX_NODES:
+            strength = np.asarray(self.graph.strength(weights=weight), dtype=float)
+            nodes = np.sort(np.argsort(-strength, kind='mergesort')[:PLOT_MAX_NODES])
+            kept = np.zeros(self.graph.vcount(), dtype=bool)
+            kept[nodes] = True
+            ends = np.asarray(self.graph.get_edgelist(), dtype=np.int64).reshape(-1, 2)
+            edges = edges[kept[ends[:, 0]] & kept[ends[:, 1]]]
+
+        if PLOT_MAX_EDGES and len(edges) > PLOT_MAX_EDGES:
+            weights = np.asarray(self.graph.es[weight], dtype=float)[edges]\
+                if weight else np.ones(len(edges))
+            edges = np.sort(edges[np.argsort(-weights, kind='mergesort')[:PLOT_MAX_EDGES]])
+
+        return (nodes, edges)
+
+
     def to_cytoscape_dict(self) -> dict:
         """
-        Transform a network to cytoscape dict
+        Transform a network to a compact cytoscape dict
 
         Return:
-            A dict with the cytoscape structure, graph attrs are keys, 
-            and the cyto. elements are in the key 'network'
+            A dict with the cytoscape structure, graph attrs are keys,
+            and the attrs of the nodes and edges to plot (see
+            prune_to_plot()) are in the keys 'nodes' and 'edges', as a list
+            of values per attr. See to_cytoscape_elements() to get the
+            cyto. elements.
         """
         di_net = {}
-        network = []
         metrics_to_plot = [val for key, val in self.NODE_METRICS_TO_PLOT.items()]
         metrics_to_plot = metrics_to_plot + [val for key, val in self.EDGE_METRICS_TO_PLOT.items()]
         log_keys = {metric['key'] for metric in metrics_to_plot if 'log' in metric.keys()}
+        to_log = lambda values: (np.log1p(np.asarray(values, dtype=float)) * 100).astype(int).tolist()
+        nodes, edges = self.prune_to_plot()
 
-        # node attrs
-        for node in self.graph.vs:
-            data = {'data': {}}
-            for attr in self.graph.vs.attributes():
-                val = node[attr]
-                if attr in log_keys:
-                    data['data'][f'{attr}_log'] = int(log(val)*100)
-
-                data['data'][attr] = val
-
-            network.append(data)
-
-        # edge attrs
-        for edge in self.graph.es:
-            data = {'data': {}}
-            for attr in self.graph.es.attributes():
-                val = edge[attr]
-                if attr == 'id':
+        def to_columns(sequence, positions, skip = ()):
+            columns = {}
+            for attr in sequence.attributes():
+                if attr in skip:
                     continue
+                values = np.asarray(sequence[attr], dtype=object)[positions].tolist()
                 if attr in log_keys:
-                    data['data'][f'{attr}_log'] = int(log(val)*100)
+                    columns[f'{attr}_log'] = to_log(values)
+                columns[attr] = values
+            return columns
 
-                data['data'][attr] = val
-            network.append(data)
+        # node and edge attrs
+        di_net['nodes'] = to_columns(self.graph.vs, nodes)
+        di_net['edges'] = to_columns(self.graph.es, edges, skip={'id'})
+        di_net['plotted_nodes'] = len(nodes)
+        di_net['plotted_edges'] = len(edges)
 
         # graph attrs
         for attr in self.graph.attributes():
             di_net[attr] = self.graph[attr]
 
-        # add max min metrics to plot
-        _max = 0
-        _min = 0
+        # add max min metrics to plot, of the whole network
         for metric in metrics_to_plot:
-            if metric['key'] in self.graph.vs.attributes() and len(self.graph.vs[metric['key']]):
-                _max = max(self.graph.vs[metric['key']])
-                _min = min(self.graph.vs[metric['key']])
-            elif metric['key'] in self.graph.es.attributes() and len(self.graph.es[metric['key']]):
-                _max = max(self.graph.es[metric['key']])
-                _min = min(self.graph.es[metric['key']])
+            values = []
+            if metric['key'] in self.graph.vs.attributes():
+                values = self.graph.vs[metric['key']]
+            elif metric['key'] in self.graph.es.attributes():
+                values = self.graph.es[metric['key']]
+
+            _max = 0
+            _min = 0
+            if len(values):
+                values = np.asarray(values)
+                _max = np.nanmax(values).item()
+                _min = np.nanmin(values).item()
 
             if 'log' in metric.keys():
-                _max = int(log(_max)*100)
-                _min = int(log(_min)*100)
+                _max, _min = to_log([_max, _min])
 
             di_net[metric['max']] = _max
             di_net[metric['min']] = _min
 
-
-        di_net['network'] = network
         return di_net
 
 
+    @staticmethod
+    def to_cytoscape_elements(cy_network: dict) -> list:
+        """
+        Returns the cytoscape elements of a network dict from
+        to_cytoscape_dict(): one {'data': attrs} per node and per edge
+        """
+        elements = []
+        for key in ('nodes', 'edges'):
+            columns = cy_network[key]
+            attrs = list(columns.keys())
+            elements.extend({'data': dict(zip(attrs, values))}
+                            for values in zip(*columns.values()))
+        return elements
+
+
     def write_gml(self, file: str):
         """
         Writes a gml file
@@ -280,16 +421,39 @@ class BaseNetwork(metaclass=abc.ABCMeta):
             self.graph.vs['page_rank'] = list(map(lambda x: float(f"{x:.4f}"), p_r))
 
 
-    def calculate_betweenness(self):
+    def is_approximated(self) -> bool:
+        """
+        Whether the network is so big that its betweenness and closeness
+        are approximated
+        """
+        return self.graph.vcount() > APPROX_MAX_NODES\
+            or self.graph.ecount() > APPROX_MAX_EDGES
+
+
+    def calculate_betweenness(self, approximate = None):
         """
-        Calculates the network betweenness
+        Calculates the network betweenness.
+        If approximate (by default, if the network is too big) only paths up
+        to BETWEENNESS_CUTOFF long are considered, which is flagged in the
+        graph attr approximate_betweenness.
+        As igraph applies the cutoff to the sum of the weights of the path,
+        it's scaled by the median edge weight, so it stands for paths of
+        around BETWEENNESS_CUTOFF edges whatever the weights of the network
         """
         if not 'betweenness' in self.graph.vs.attributes():
+            if approximate is None:
+                approximate = self.is_approximated()
             weight = 'weight' if 'weight' in self.graph.es.attributes() else None
+            cutoff = None
+            if approximate:
+                cutoff = BETWEENNESS_CUTOFF
+                if weight and self.graph.ecount():
+                    cutoff *= float(np.median(self.graph.es[weight]))
             bet = self.graph.betweenness(directed=self.graph.is_directed(), 
-                weights = weight)
+                cutoff = cutoff, weights = weight)
 
             self.graph.vs['betweenness'] = list(map(lambda x: float(f"{x:.4f}"), bet))
+            self.graph['approximate_betweenness'] = approximate
 
 
     def calculate_gini_betweenness(self):
@@ -334,22 +498,94 @@ class BaseNetwork(metaclass=abc.ABCMeta):
             self.graph['gini_degree'] = value
 
 
-    def calculate_communities(self):
+    @classmethod
+    def get_community_algorithm(cls) -> str:
         """
-        Calculates communities and assigns a color per community
+        Community detection algorithm set for this network type, or else
+        for all of them
+        """
+        return os.getenv(f'WIKICHRON_NETWORKS_COMMUNITIES_{cls.CODE.upper()}',
+                        COMMUNITY_ALGORITHM)
+
+
+    def choose_community_algorithm(self, algorithm = None) -> str:
+        """
+        Resolves algorithm (by default, the one set for this network type)
+        to one of COMMUNITY_ALGORITHMS available in the installed igraph
+        """
+        if algorithm is None:
+            algorithm = self.get_community_algorithm()
+        leiden = 'leiden' if hasattr(Graph, 'community_leiden') else 'multilevel'
+        if algorithm == 'auto':
+            small = self.graph.vcount() <= WALKTRAP_MAX_NODES\
+                and self.graph.ecount() <= WALKTRAP_MAX_EDGES
+            algorithm = 'walktrap' if small else leiden
+        elif algorithm == 'leiden':
+            algorithm = leiden
+
+        if algorithm not in COMMUNITY_ALGORITHMS:
+            raise ValueError(f'Unknown community detection algorithm: {algorithm}')
+        return algorithm
+
+
+    def get_undirected_graph(self) -> Graph:
+        """
+        The graph itself or, if directed, an undirected copy of it where
+        the weights of the edges between the same nodes are summed up
+        """
+        if not self.graph.is_directed():
+            return self.graph
+        combine = {'weight': 'sum'} if 'weight' in self.graph.es.attributes() else None
+        return self.graph.as_undirected(combine_edges=combine)
+
+
+    def find_communities_walktrap(self, weight) -> list:
+        # igraph bug: https://github.com/igraph/python-igraph/issues/17
+        try:
+            v_d = self.graph.community_walktrap(weights=weight, steps=6)
+            mod = v_d.as_clustering()
+        except:
+            fix_dendrogram(self.graph, v_d)
+            mod = v_d.as_clustering()
+        return mod.membership
+
+
+    def find_communities_multilevel(self, weight) -> list:
+        return self.get_undirected_graph().community_multilevel(weights=weight).membership
+
+
+    def find_communities_label_propagation(self, weight) -> list:
+        return self.get_undirected_graph().community_label_propagation(weights=weight).membership
+
+
+    def find_communities_leiden(self, weight) -> list:
+        return self.get_undirected_graph().community_leiden(
+            objective_function='modularity', weights=weight).membership
+
+
+    def calculate_communities(self, algorithm = None):
+        """
+        Calculates communities and assigns a color per community.
+        The algorithm used (see choose_community_algorithm()), the
+        modularity of the communities and the seconds it took to find them
+        are kept in graph attrs
         """
         if not 'n_communities' in self.graph.attributes():
             weight = 'weight' if 'weight' in self.graph.es.attributes() else None
-            # igraph bug: https://github.com/igraph/python-igraph/issues/17
-            try:
-                v_d = self.graph.community_walktrap(weights=weight, steps=6)
-                mod = v_d.as_clustering()
-            except:
-                fix_dendrogram(self.graph, v_d)
-                mod = v_d.as_clustering()
+            algorithm = self.choose_community_algorithm(algorithm)
+
+            time_start = time.perf_counter()
+            membership = getattr(self, COMMUNITY_ALGORITHMS[algorithm])(weight)
+            elapsed = time.perf_counter() - time_start
+            mod = VertexClustering(self.graph, membership)
 
             self.graph.vs['cluster'] = mod.membership
             self.graph['n_communities'] = len(mod)
+            modularity = self.graph.modularity(mod.membership, weights=weight)\
+                if self.graph.ecount() else np.nan
+            self.graph['modularity'] = f"{modularity:.2f}"
+            self.graph['communities_algorithm'] = algorithm
+            self.graph['communities_time'] = elapsed
             pal = ClusterColoringPalette(len(mod))
             self.graph.vs['cluster_color'] = list(map(lambda x: rgb2hex(x[0],x[1],x[2],\
                 normalised=True), pal.get_many(mod.membership)))
@@ -382,20 +618,55 @@ class BaseNetwork(metaclass=abc.ABCMeta):
             self.graph['components'] = len(components.subgraphs())
 
     
-    def calculate_closeness(self):
+    def calculate_closeness(self, approximate = None):
+        """
+        Calculates the network closeness.
+        If approximate (by default, if the network is too big) it's
+        estimated from CLOSENESS_SAMPLES nodes (see estimate_closeness()),
+        which is flagged in the graph attr approximate_closeness
+        """
         if 'closeness' not in self.graph.vs.attributes() and 'weight'\
             in self.graph.es.attributes():
 
+            if approximate is None:
+                approximate = self.is_approximated()
             rounder = lambda x: float(f"{x:.4f}")
-            closeness = self.graph.closeness(weights='weight')
+            if approximate:
+                closeness = self.estimate_closeness(CLOSENESS_SAMPLES)
+            else:
+                closeness = self.graph.closeness(weights='weight')
             closeness = list(map(rounder, closeness))
             self.graph.vs['closeness'] = closeness
+            self.graph['approximate_closeness'] = approximate
 
 
-    def calculate_gini_closeness(self):
-        if 'closeness' in self.graph.vs.attributes() and 'gini_closeness'\
-            not in self.graph.attributes():
+    def estimate_closeness(self, n_samples: int) -> list:
+        """
+        Estimates the closeness of every node from its distances to
+        n_samples random nodes (Eppstein and Wang), instead of to all of
+        them. As igraph does, unconnected nodes are at the number of nodes
+        of distance.
+        """
+        n_nodes = self.graph.vcount()
+        sources = np.random.RandomState(0).choice(n_nodes,
+                        size=min(n_samples, n_nodes), replace=False)
+        distances = np.array(self.graph.shortest_paths(source=sources.tolist(),
+                        weights='weight', mode=ALL), dtype=float).reshape(len(sources), n_nodes)
+        distances[np.isinf(distances)] = n_nodes
+
+        # the distance from every source to itself doesn't count
+        n_distances = np.full(n_nodes, len(sources), dtype=float)
+        n_distances[sources] -= 1
+        sum_distances = distances.sum(axis=0)
+        closeness = np.zeros(n_nodes)
+        np.divide(n_distances, sum_distances, out=closeness, where=sum_distances > 0)
+        return closeness.tolist()
 
+
+    def calculate_gini_closeness(self):
+        if 'gini_closeness' in self.graph.attributes():
+            return
+        if 'closeness' in self.graph.vs.attributes() and self.graph.vcount():
             gini = ineq.gini_corrected(self.graph.vs['closeness'])
             if gini is not np.nan:
                 self.graph['gini_closeness'] = f"{gini:.2f}"
@@ -404,9 +675,9 @@ class BaseNetwork(metaclass=abc.ABCMeta):
 
     
     def calculate_gini_article_edits(self):
-        if 'article_edits' in self.graph.vs.attributes() and 'gini_article_edits'\
-            not in self.graph.attributes():
-
+        if 'gini_article_edits' in self.graph.attributes():
+            return
+        if 'article_edits' in self.graph.vs.attributes() and self.graph.vcount():
             gini = ineq.gini_corrected(self.graph.vs['article_edits'])
             if gini is not np.nan:
                 self.graph['gini_article_edits'] = f"{gini:.2f}"
@@ -415,9 +686,9 @@ class BaseNetwork(metaclass=abc.ABCMeta):
 
 
     def calculate_gini_talk_edits(self):
-        if 'talk_edits' in self.graph.vs.attributes() and 'gini_talk_edits'\
-            not in self.graph.attributes():
-
+        if 'gini_talk_edits' in self.graph.attributes():
+            return
+        if 'talk_edits' in self.graph.vs.attributes() and self.graph.vcount():
             gini = ineq.gini_corrected(self.graph.vs['talk_edits'])
             if gini is not np.nan:
                 self.graph['gini_talk_edits'] = f"{gini:.2f}"
@@ -426,9 +697,9 @@ class BaseNetwork(metaclass=abc.ABCMeta):
 
 
     def calculate_gini_user_talk_edits(self):
-        if 'user_talks' in self.graph.vs.attributes() and 'gini_user_talks'\
-            not in self.graph.attributes():
-
+        if 'gini_user_talks' in self.graph.attributes():
+            return
+        if 'user_talks' in self.graph.vs.attributes() and self.graph.vcount():
             gini = ineq.gini_corrected(self.graph.vs['user_talks'])
             if gini is not np.nan:
                 self.graph['gini_user_talks'] = f"{gini:.2f}"
@@ -438,7 +709,7 @@ class BaseNetwork(metaclass=abc.ABCMeta):
 
     def calculate_metrics(self):
         """
-        A method which calculate the available metrics 
+        A method which calculate all the available metrics at once
         """
         self.calculate_page_rank()
         self.calculate_betweenness()
@@ -456,6 +727,81 @@ class BaseNetwork(metaclass=abc.ABCMeta):
         self.calculate_gini_user_talk_edits()
 
 
+    def has_metric(self, key: str) -> bool:
+        return key in self.graph.vs.attributes() or key in self.graph.attributes()
+
+
+    def get_metric_keys(self, key: str) -> set:
+        """
+        Returns the keys of all the attrs calculated along with the metric
+        key, i.e. by its calculator and by the ones of its dependencies
+        """
+        calculators = set()
+        pending = [key]
+        while pending:
+            metric = pending.pop()
+            if metric in self.METRIC_CALCULATORS:
+                calculators.add(self.METRIC_CALCULATORS[metric])
+                pending.extend(self.METRIC_DEPENDENCIES.get(metric, []))
+
+        return {metric for metric, calculator in self.METRIC_CALCULATORS.items()
+                if calculator in calculators}
+
+
+    @classmethod
+    def get_stats_to_calculate(cls, metrics: list) -> list:
+        """
+        Returns the keys of the network stats to calculate when the node
+        metrics given are shown: all of them but the DEFERRED_STATS
+        depending on node metrics which are not shown.
+        """
+        calculators = {cls.METRIC_CALCULATORS.get(metric) for metric in metrics}
+        stats = []
+        for stat in cls.get_network_stats().values():
+            if stat in cls.DEFERRED_STATS and not all(
+                cls.METRIC_CALCULATORS[dependency] in calculators
+                for dependency in cls.METRIC_DEPENDENCIES[stat]):
+                continue
+            stats.append(stat)
+        return stats
+
+
+    def calculate_metric(self, key: str):
+        """
+        Calculates the node metric or network stat with that key, after the
+        ones it depends on, unless it's already there
+        """
+        if key not in self.METRIC_CALCULATORS or self.has_metric(key):
+            return
+
+        for dependency in self.METRIC_DEPENDENCIES.get(key, []):
+            self.calculate_metric(dependency)
+        getattr(self, self.METRIC_CALCULATORS[key])()
+
+
+    def get_metric_values(self, key: str) -> dict:
+        """
+        Calculates the metric key (if needed) and returns the values of all
+        the attrs calculated along with it, so they can be cached apart from
+        the network and added to other copies with set_metric_values()
+        """
+        self.calculate_metric(key)
+        values = {'vertex': {}, 'graph': {}}
+        for metric in self.get_metric_keys(key):
+            if metric in self.graph.vs.attributes():
+                values['vertex'][metric] = self.graph.vs[metric]
+            elif metric in self.graph.attributes():
+                values['graph'][metric] = self.graph[metric]
+        return values
+
+
+    def set_metric_values(self, values: dict):
+        for metric, value in values['vertex'].items():
+            self.graph.vs[metric] = value
+        for metric, value in values['graph'].items():
+            self.graph[metric] = value
+
+
     def get_degree_distribution(self) -> (list, list):
         """
         Returns the degree distribution:
@@ -486,12 +832,14 @@ class BaseNetwork(metaclass=abc.ABCMeta):
 
     def build_network(self, df: pd.DataFrame, lower_bound: str, upper_bound: str):
         """
-        This method is used to generate the network and its metrics and attrs
+        This method is used to generate the network and its attrs.
+        Metrics are calculated later on, when they are needed (see
+        calculate_metric() and calculate_metrics())
         """
         dff = self.filter_by_time(df, lower_bound, upper_bound)
         dff = self.filter_anonymous(dff)
-        self.generate_from_pandas(dff)
-        self.calculate_metrics()
+        if not self.generate_from_windows(df, lower_bound, upper_bound):
+            self.generate_from_pandas(dff)
         self.calculate_abs_longevity(df)
         self.add_others(dff)
         self.add_graph_attrs()
@@ -502,8 +850,11 @@ class BaseNetwork(metaclass=abc.ABCMeta):
 
         dff = df
         if lower_bound and upper_bound:
-            dff = dff[lower_bound <= dff['timestamp']]
-            dff = dff[dff['timestamp'] <= upper_bound]
+            # df is ordered by timestamp, so the window is a slice of it
+            timestamps = dff['timestamp'].values
+            start = timestamps.searchsorted(pd.Timestamp(lower_bound).to_datetime64(), side='left')
+            end = timestamps.searchsorted(pd.Timestamp(upper_bound).to_datetime64(), side='right')
+            dff = dff.iloc[start:max(start, end)]
 
         return dff
 
@@ -567,49 +918,50 @@ class BaseNetwork(metaclass=abc.ABCMeta):
         key = 'edits'
         if type_e == 'talk':
             dff = self.remove_non_talk_data(df)
-            key = f'{type_e}_{key}'
         elif type_e == 'article':
             dff = self.remove_non_article_data(df)
-            key = f'{type_e}_{key}'
         elif type_e == 'user_talk':
-            raise Exception(f'type: {type_e} is not implemented yet')
+            dff = self.remove_non_user_talk_data(df)
         else:
             raise Exception(f'type: {type_e} is not defined')
+        key = f'{type_e}_{key}'
 
-        mapper = {self.graph.vs[i]['label']: i for i in range(self.graph.vcount())}
-        edits = [0 for i in range(self.graph.vcount())]
-        pages = [set() for _ in range(self.graph.vcount())]
-        for _, row in dff.iterrows():
-            if row['contributor_name'] in mapper.keys():
-                edits[mapper[row['contributor_name']]] += 1
-                pages[mapper[row['contributor_name']]].add(int(row['page_id']))
+        # vertex of every edit, by label (the last vertex of repeated labels)
+        labels = pd.Series(np.arange(self.graph.vcount()), index=self.graph.vs['label'])
+        labels = labels[~labels.index.duplicated(keep='last')]
+        vertex = labels.index.get_indexer(dff['contributor_name'].values)
+        in_graph = vertex >= 0
+        vertex = labels.values[vertex[in_graph]]
 
-        sizer = lambda x: len(x)
-        pages = list(map(sizer, pages))
-        self.graph.vs[f"{type_e}s"] = pages
-        self.graph.vs[key] = edits
+        edits = np.bincount(vertex, minlength=self.graph.vcount())
+        pages = pd.Series(dff['page_id'].values[in_graph]).groupby(vertex).nunique()\
+            .reindex(np.arange(self.graph.vcount()), fill_value=0)
+        self.graph.vs[f"{type_e}s"] = pages.values.tolist()
+        self.graph.vs[key] = edits.tolist()
 
 
     def calculate_abs_longevity(self, df: pd.DataFrame):
         """
         Calculates the birth of all the vertex without filter_by_time 
         """
-        inverter = lambda x: 1/x*1000
-        max_date = 0
-        for node in self.graph.vs:
-            dff = df[node['label'] == df['contributor_name']]
-            if not dff.empty:
-                row = dff.iloc[0]
-                node['birth'] = datetime.strftime(row['timestamp'], "%d/%b/%Y")
-                node['birth_value'] = int(datetime.strptime(
-                    str(row['timestamp']), "%Y-%m-%d %H:%M:%S").strftime('%s'))
-
-                # this is a weak solution to avoid users with no activity
-                if max_date < node['birth_value']:
-                    max_date = node['birth_value']
-            else:
-                node['birth'] = 'Not available'
-                node['birth_value'] = max_date
-        
-        if 'birth_value' in self.graph.vs.attributes():
-            self.graph.vs['birth_value'] = list(map(inverter, self.graph.vs['birth_value']))
\ No newline at end of file
+        if 'label' not in self.graph.vs.attributes():
+            return
+
+        first_edits = get_first_edits(df)
+        positions = first_edits.get_positions(self.graph.vs['label'])
+        found = positions >= 0
+
+        birth = np.full(len(positions), 'Not available', dtype=object)
+        birth[found] = pd.DatetimeIndex(first_edits.timestamp[positions[found]])\
+            .strftime("%d/%b/%Y")
+        # this is a weak solution to avoid users with no activity: they get
+        #  the latest birth of the previous vertices
+        birth_value = np.zeros(len(positions), dtype=np.int64)
+        birth_value[found] = first_edits.epoch[positions[found]]
+        if len(positions):
+            birth_value = np.where(found, birth_value, np.maximum.accumulate(birth_value))
+
+        inverted = np.zeros(len(positions))
+        np.divide(1, birth_value, out=inverted, where=birth_value > 0)
+        self.graph.vs['birth'] = birth.tolist()
+        self.graph.vs['birth_value'] = (inverted * 1000).tolist()
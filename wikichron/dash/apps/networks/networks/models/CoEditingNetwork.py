@@ -7,7 +7,10 @@
 """
 
 import pandas as pd
+
 from .BaseNetwork import BaseNetwork
+from . import graph_builder
+from . import windows
 
 
 class CoEditingNetwork(BaseNetwork):
@@ -82,67 +85,35 @@ class CoEditingNetwork(BaseNetwork):
 
 
     def generate_from_pandas(self, df):
-        user_per_page = {}
-        mapper_v = {}
-        mapper_e = {}
-        count = 0
         dff = self.remove_non_article_data(df)
-
-        for _, r in dff.iterrows():
-            # Nodes
-            if not int(r['contributor_id']) in mapper_v:
-                self.graph.add_vertex(count)
-                mapper_v[int(r['contributor_id'])] = count
-                self.graph.vs[count]['id'] = int(r['contributor_id'])
-                self.graph.vs[count]['label'] = r['contributor_name']
-                self.graph.vs[count]['article_edits'] = 0
-                self.graph.vs[count]['articles'] = {int(r['page_id'])}
-                count += 1
-
-            self.graph.vs[mapper_v[int(r['contributor_id'])]]['article_edits'] += 1
-            self.graph.vs[mapper_v[int(r['contributor_id'])]]['articles'].add(int(r['page_id']))
-
-            # A page gets serveral contributors
-            if not int(r['page_id']) in user_per_page:
-                user_per_page[int(r['page_id'])] = {int(r['contributor_id'])}
-            else:
-                if int(r['contributor_id']) not in user_per_page[int(r['page_id'])]:
-                    user_per_page[int(r['page_id'])].add(int(r['contributor_id']))
-
-        count = 0
-        # Edges
-        for _, p in user_per_page.items():
-            for u1 in p:
-                for u2 in p:
-                    if u1 == u2:
-                        continue
-                    k_edge = (u1 << 32) + u2
-                    k_edge_2 = (u2 << 32) + u1
-                    if k_edge in mapper_e:
-                        self.graph.es[mapper_e[k_edge]]['weight'] += 1
-                        continue
-                    elif k_edge_2 in mapper_e:
-                        #self.graph.es[mapper_e[k_edge_2]]['weight'] += 1
-                        continue
-
-                    self.graph.add_edge(mapper_v[u1], mapper_v[u2])
-                    mapper_e[k_edge] = count
-                    count += 1
-                    self.graph.es[mapper_e[k_edge]]['weight'] = 1
-                    self.graph.es[mapper_e[k_edge]]['id'] = k_edge
-                    self.graph.es[mapper_e[k_edge]]['source'] = u1
-                    self.graph.es[mapper_e[k_edge]]['target'] = u2
-
-        # total pages per user
-        if 'articles' in self.graph.vs.attributes():
-            articles = [len(node['articles']) for node in self.graph.vs]
-            self.graph.vs['articles'] = articles
+        self.graph, n_articles = graph_builder.build_co_edition_graph(dff,
+                        self.graph.is_directed(), 'article_edits', 'articles')
 
         # total pages
-        self.graph['wiki_articles'] = len(user_per_page)
+        self.graph['wiki_articles'] = n_articles
         self.graph['wiki_article_edits'] = len(dff.index)
 
 
+    def build_windows(self, df):
+        dff = self.filter_anonymous(self.remove_non_article_data(df))
+        return windows.CoEditionWindows.from_dataframe(dff)
+
+
+    def generate_from_windows(self, df, lower_bound, upper_bound):
+        net_windows = windows.get_windows(df, self.CODE, self.build_windows)
+        if net_windows is None:
+            return False
+
+        start, end = net_windows.get_bounds(lower_bound, upper_bound)
+        self.graph, n_pages = net_windows.get_graph(start, end,
+                        self.graph.is_directed(), 'article_edits', 'articles')
+
+        # total pages
+        self.graph['wiki_articles'] = n_pages
+        self.graph['wiki_article_edits'] = end - start
+        return True
+
+
     def get_metric_dataframe(self, metric):
         metrics = CoEditingNetwork.get_metrics_to_plot()
 
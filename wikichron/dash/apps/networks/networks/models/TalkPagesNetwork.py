@@ -11,6 +11,8 @@
 import pandas as pd
 
 from .BaseNetwork import BaseNetwork
+from . import graph_builder
+from . import windows
 
 
 class TalkPagesNetwork(BaseNetwork):
@@ -87,68 +89,35 @@ class TalkPagesNetwork(BaseNetwork):
 
     
     def generate_from_pandas(self, df):
-        user_per_page = {}
-        mapper_v = {}
-        mapper_e = {}
-        count = 0
-
         dff = self.remove_non_talk_data(df)
-
-        for _, r in dff.iterrows():
-            # Nodes
-            if not int(r['contributor_id']) in mapper_v:
-                self.graph.add_vertex(count)
-                mapper_v[int(r['contributor_id'])] = count
-                self.graph.vs[count]['id'] = int(r['contributor_id'])
-                self.graph.vs[count]['label'] = r['contributor_name']
-                self.graph.vs[count]['talk_edits'] = 0
-                self.graph.vs[count]['talks'] = {int(r['page_id'])}
-                count += 1
-
-            self.graph.vs[mapper_v[int(r['contributor_id'])]]['talk_edits'] += 1
-            self.graph.vs[mapper_v[int(r['contributor_id'])]]['talks'].add(int(r['page_id']))
-
-            # A page gets serveral contributors
-            if not int(r['page_id']) in user_per_page:
-                user_per_page[int(r['page_id'])] = {int(r['contributor_id'])}
-            else:
-                if int(r['contributor_id']) not in user_per_page[r['page_id']]:
-                    user_per_page[r['page_id']].add(int(r['contributor_id']))
-
-        count = 0
-        # Edges
-        for _, p in user_per_page.items():
-            for u1 in p:
-                for u2 in p:
-                    if u1 == u2:
-                        continue
-                    k_edge = (u1 << 32) + u2
-                    k_edge_2 = (u2 << 32) + u1
-                    if k_edge in mapper_e:
-                        self.graph.es[mapper_e[k_edge]]['weight'] += 1
-                        continue
-                    elif k_edge_2 in mapper_e:
-                        #self.graph.es[mapper_e[k_edge_2]]['weight'] += 1
-                        continue
-
-                    self.graph.add_edge(mapper_v[u1], mapper_v[u2])
-                    mapper_e[k_edge] = count
-                    count += 1
-                    self.graph.es[mapper_e[k_edge]]['weight'] = 1
-                    self.graph.es[mapper_e[k_edge]]['id'] = k_edge
-                    self.graph.es[mapper_e[k_edge]]['source'] = u1
-                    self.graph.es[mapper_e[k_edge]]['target'] = u2
-
-        # total pages per user 
-        if 'talks' in self.graph.vs.attributes():
-            talks = [len(node['talks']) for node in self.graph.vs]
-            self.graph.vs['talks'] = talks
+        self.graph, n_talks = graph_builder.build_co_edition_graph(dff,
+                        self.graph.is_directed(), 'talk_edits', 'talks')
 
         # total pages
-        self.graph['wiki_talks'] = len(user_per_page)
+        self.graph['wiki_talks'] = n_talks
         self.graph['wiki_talk_edits'] = len(dff.index)
     
 
+    def build_windows(self, df):
+        dff = self.filter_anonymous(self.remove_non_talk_data(df))
+        return windows.CoEditionWindows.from_dataframe(dff)
+
+
+    def generate_from_windows(self, df, lower_bound, upper_bound):
+        net_windows = windows.get_windows(df, self.CODE, self.build_windows)
+        if net_windows is None:
+            return False
+
+        start, end = net_windows.get_bounds(lower_bound, upper_bound)
+        self.graph, n_pages = net_windows.get_graph(start, end,
+                        self.graph.is_directed(), 'talk_edits', 'talks')
+
+        # total pages
+        self.graph['wiki_talks'] = n_pages
+        self.graph['wiki_talk_edits'] = end - start
+        return True
+
+
     def get_metric_dataframe(self, metric):
         metrics = TalkPagesNetwork.get_metrics_to_plot()
 
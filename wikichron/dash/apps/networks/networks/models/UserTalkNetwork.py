@@ -9,9 +9,11 @@
 """
 
 import pandas as pd
-import re
+import numpy as np
 
 from .BaseNetwork import BaseNetwork
+from . import graph_builder
+from . import windows
 from ...data_controller import get_bot_names
 
 class UserTalkNetwork(BaseNetwork):
@@ -97,90 +99,123 @@ class UserTalkNetwork(BaseNetwork):
         super().__init__(is_directed, graph, alias)
 
 
-    def generate_from_pandas(self, df):
-        user_per_page = {}
-        mapper_v = {}
-        count_v = 0
-        count_e = 0
-
+    def get_user_talk_columns(self, dff) -> dict:
+        """
+        Returns the columns (np arrays) which the network is generated from,
+        with one value per edit in dff (user talk pages data):
+            * name, id: name and id of the contributor
+            * page_id: id of the user talk page
+            * owner: name of the user the page belongs to
+            * keep: whether the edit is taken into account
+        """
         bots_name = get_bot_names(self.alias)
-        dff = self.remove_non_user_talk_data(df)
 
-        for _, r in dff.iterrows():
-            ################ Filter ################
+        ################ Filter ################
+        # computed only once per different page title
+        def get_page_owner(titles):
             # remove "User Page:"
-            page_t = re.sub('^.+:', '', r['page_title'])
+            titles = titles.str.replace('^.+:', '', regex=True)
             # remove everyhing after slash
-            page_t = re.sub('[\/].*', '', page_t)
-            # filter anonymous user talk page for ipv4 or ipv6 (i.e it contains "." or ":")
-            if re.search('\.|\:', page_t):
-                continue
-            # filter bots pages
-            if page_t in bots_name:
-                continue
-            ########################################
-
-            # Nodes
-            if not r['contributor_name'] in mapper_v:
-                self.graph.add_vertex(count_v)
-                mapper_v[r['contributor_name']] = count_v
-                self.graph.vs[count_v]['id'] = int(r['contributor_id'])
-                self.graph.vs[count_v]['label'] = r['contributor_name']
-                self.graph.vs[count_v]['own_u_edits'] = 0
-                self.graph.vs[count_v]['user_talks'] = {int(r['page_id'])}
-                count_v += 1
-
-            # count diferent pages
-            self.graph.vs[mapper_v[r['contributor_name']]]['user_talks'].add(int(r['page_id']))
-
-            if page_t == r['contributor_name']:
-                self.graph.vs[mapper_v[page_t]]['own_u_edits'] += 1
-            else:
-                # A page gets serveral contributors
-                if not page_t in user_per_page:
-                    user_per_page[page_t] = {r['contributor_name']: 1}
-                else:
-                    if r['contributor_name'] in user_per_page[page_t]:
-                        user_per_page[page_t][r['contributor_name']] += 1
-                    else:
-                        user_per_page[page_t][r['contributor_name']] = 1
+            return titles.str.replace('[\/].*', '', regex=True)
+
+        owners = graph_builder.transform_unique(dff['page_title'].values, get_page_owner)
+        # filter anonymous user talk page for ipv4 or ipv6 (i.e it contains "." or ":")
+        # and bots pages
+        owners_s = pd.Series(owners)
+        keep = ~(owners_s.str.contains('\.|\:', regex=True)
+                | owners_s.isin(list(bots_name))).values
+        ########################################
+
+        return {
+            'name': np.asarray(dff['contributor_name'].values, dtype=object),
+            'id': np.asarray(dff['contributor_id'].values),
+            'page_id': np.asarray(dff['page_id'].values),
+            'owner': owners,
+            'keep': keep
+        }
+
+
+    def generate_from_columns(self, columns, n_edits):
+        """
+        Fill the igraph attribute from the columns returned by
+        get_user_talk_columns() for n_edits edits
+        """
+        keep = columns['keep']
+        page_t = columns['owner'][keep]
+        user_names = columns['name'][keep]
+        user_ids = columns['id'][keep]
+        page_ids = columns['page_id'][keep]
+
+        # Nodes, in order of first edit
+        user_codes, names = graph_builder.factorize(user_names)
+        n_users = len(names)
+        ids = user_ids[graph_builder.first_positions(user_codes)].astype(np.int64)
+        own_page = page_t == user_names
+        own_u_edits = np.bincount(user_codes[own_page], minlength=n_users)
+        # count diferent pages
+        page_codes, distinct_pages = graph_builder.factorize(page_ids)
+        user_talks = graph_builder.incidence_matrix(user_codes, page_codes,
+                        (n_users, len(distinct_pages))).getnnz(axis=1)
+
+        # A page gets serveral contributors, weighted by their edits on it
+        owner_codes, owners = graph_builder.factorize(page_t[~own_page])
+        pages, users, weights = graph_builder.count_pairs(owner_codes,
+                                    user_codes[~own_page], max(n_users, 1))
+
+        # it could be that an user has no edits but someone edits in its user-talk
+        owner_vertex = pd.Index(names).get_indexer(owners)
+        no_vertex = owner_vertex < 0
+        n_extra = int(no_vertex.sum())
+        owner_vertex[no_vertex] = n_users + np.arange(n_extra)
+        max_id = ids.max() + 1 if n_users else 1
+
+        vertex_attrs = {
+            'name': np.arange(n_users + n_extra),
+            'id': np.r_[ids, max_id + np.arange(n_extra, dtype=np.int64)],
+            'label': np.r_[names, owners[no_vertex]],
+            'own_u_edits': np.r_[own_u_edits, np.zeros(n_extra, dtype=np.int64)],
+            # total pages per user
+            'user_talks': np.r_[user_talks, np.zeros(n_extra, dtype=np.int64)],
+        }
 
         # Edges
-        if self.graph.vcount():
-            max_id = max(self.graph.vs['id']) + 1
-        else:
-            max_id = 1
-
-        for page_name, p_dict in user_per_page.items():
-            for user, edits in p_dict.items():
-                # it could be that an user has no edits but someone edits in its user-talk
-                if page_name not in mapper_v:
-                    self.graph.add_vertex(count_v)
-                    mapper_v[page_name] = count_v
-                    self.graph.vs[count_v]['id'] = max_id
-                    max_id += 1
-                    self.graph.vs[count_v]['label'] = page_name
-                    self.graph.vs[count_v]['own_u_edits'] = 0
-                    self.graph.vs[count_v]['user_talks'] = set()
-                    count_v += 1
-
-                self.graph.add_edge(mapper_v[user], mapper_v[page_name])
-                source = self.graph.vs[mapper_v[user]]['id']
-                target = self.graph.vs[mapper_v[page_name]]['id']
-                edge_id = (source << 32) + target
-                self.graph.es[count_e]['id'] = edge_id
-                self.graph.es[count_e]['weight'] = edits
-                self.graph.es[count_e]['source'] = source
-                self.graph.es[count_e]['target'] = target
-                count_e += 1
-
-        # total pages per user
-        if 'user_talks' in self.graph.vs.attributes():
-            user_talks = [len(node['user_talks']) for node in self.graph.vs]
-            self.graph.vs['user_talks'] = user_talks
+        sources = users
+        targets = owner_vertex[pages]
+        source_ids = vertex_attrs['id'][sources]
+        target_ids = vertex_attrs['id'][targets]
+        edge_attrs = {
+            'id': graph_builder.edge_ids(source_ids, target_ids),
+            'weight': weights,
+            'source': source_ids,
+            'target': target_ids,
+        }
+
+        self.graph = graph_builder.build_graph(n_users + n_extra, sources, targets,
+                        self.graph.is_directed(), vertex_attrs, edge_attrs)
 
         # total pages
-        self.graph['wiki_user_talk_edits'] = len(dff.index)
+        self.graph['wiki_user_talk_edits'] = n_edits
+
+
+    def generate_from_pandas(self, df):
+        dff = self.remove_non_user_talk_data(df)
+        self.generate_from_columns(self.get_user_talk_columns(dff), len(dff.index))
+
+
+    def build_windows(self, df):
+        dff = self.remove_non_user_talk_data(self.filter_anonymous(df))
+        return windows.RowWindows(dff['timestamp'].values,
+                                    self.get_user_talk_columns(dff))
+
+
+    def generate_from_windows(self, df, lower_bound, upper_bound):
+        net_windows = windows.get_windows(df, self.CODE, self.build_windows)
+        if net_windows is None:
+            return False
+
+        start, end = net_windows.get_bounds(lower_bound, upper_bound)
+        self.generate_from_columns(net_windows.get_rows(start, end), end - start)
+        return True
 
 
     def get_metric_dataframe(self, metric):
@@ -0,0 +1,53 @@
+"""
+   first_edits.py
+
+   Descp: Lookup table with the first edit of every contributor of a wiki,
+      which the tenure (birth) of the nodes of every network is filled
+      from, instead of searching the data of the wiki for every node.
+
+      It's built once per wiki and stored along with the wiki data in the
+      data store.
+
+   Created on: 18/10/2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import numpy as np
+import pandas as pd
+
+from wikichron.utils.data_store import get_derived
+from . import graph_builder
+
+
+class FirstEdits:
+    """
+    Attributes:
+        names -- pd Index of the distinct contributor names.
+        timestamp -- timestamp of the first edit of every name.
+        epoch -- same as timestamp, in seconds since the epoch (np.int64).
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        codes, names = graph_builder.factorize(df['contributor_name'].values)
+        first_rows = graph_builder.first_positions(codes)
+        # missing names are coded as -1
+        first_rows = first_rows[codes[first_rows] >= 0]
+        self.names = pd.Index(names[codes[first_rows]])
+        self.timestamp = df['timestamp'].values[first_rows].astype('datetime64[ns]')
+        self.epoch = self.timestamp.astype(np.int64) // 10**9
+
+
+    @property
+    def nbytes(self):
+        return int(self.names.nbytes) + self.timestamp.nbytes + self.epoch.nbytes
+
+
+    def get_positions(self, names) -> np.ndarray:
+        """ Position of every name in the table, or -1 if it never edited """
+        return self.names.get_indexer(pd.Index(np.asarray(names, dtype=object)))
+
+
+def get_first_edits(df: pd.DataFrame) -> FirstEdits:
+    """ Returns the FirstEdits of df, built once per wiki """
+    return get_derived(df, 'networks_first_edits', FirstEdits)
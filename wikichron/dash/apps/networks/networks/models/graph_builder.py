@@ -0,0 +1,171 @@
+"""
+   graph_builder.py
+
+   Descp: Helpers to build the igraph of a network in bulk from a pandas
+      dataframe: ids are factorized in order of first appearance, edges and
+      their weights are computed with vectorized operations and the graph
+      is created with all its vertices, edges and attributes in one call.
+
+   Created on: 18/10/2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from igraph import Graph
+
+
+def factorize(values):
+    """
+    Returns the code of every value and the distinct values,
+    numbered in order of first appearance
+    """
+    codes, uniques = pd.factorize(values, sort=False)
+    return (codes, np.asarray(uniques))
+
+
+def transform_unique(values, transform):
+    """
+    Applies transform, a function over a pd Series, only once per distinct
+    value (e.g. page titles), and returns the transformed value of every
+    element of values as a np array.
+    """
+    codes, uniques = pd.factorize(values, sort=False)
+    return np.asarray(transform(pd.Series(np.asarray(uniques, dtype=object))))[codes]
+
+
+def first_positions(codes):
+    """ Returns the position where each code appears first, sorted by code """
+    _, positions = np.unique(codes, return_index=True)
+    return positions
+
+
+def count_matrix(rows, columns, shape):
+    """ Sparse matrix with the number of times each (row, column) pair appears """
+    ones = np.ones(len(rows), dtype=np.int64)
+    return sparse.coo_matrix((ones, (rows, columns)), shape=shape).tocsr()
+
+
+def incidence_matrix(rows, columns, shape):
+    """ Sparse binary matrix with a 1 in every (row, column) pair given """
+    return to_incidence(count_matrix(rows, columns, shape))
+
+
+def to_incidence(counts):
+    """ Sparse binary matrix with a 1 in every non zero cell of counts """
+    matrix = counts.copy()
+    matrix.eliminate_zeros()
+    matrix.data[:] = 1
+    return matrix
+
+
+def co_occurrence_edges(users_pages):
+    """
+    Undirected edges between every pair of users who edited the same page,
+    weighted by the number of different pages both of them edited.
+    It's computed as B * B^T over the (users x pages) incidence matrix B.
+
+    Returns the sources, targets and weights of the edges, where sources
+    are always lower than targets, sorted by (source, target).
+    """
+    co_edits = sparse.triu(users_pages.dot(users_pages.T), k=1).tocsr()
+    co_edits.sort_indices()
+    co_edits = co_edits.tocoo()
+    return (co_edits.row.astype(np.int64), co_edits.col.astype(np.int64),
+            co_edits.data.astype(np.int64))
+
+
+def count_pairs(first_codes, second_codes, n_second):
+    """
+    Counts how many times every distinct (first, second) pair of codes
+    appears. Returns the first codes, the second codes and the counts of
+    the distinct pairs, sorted by first code and, within the same first
+    code, in order of first appearance.
+    """
+    pair_codes, pairs = pd.factorize(np.asarray(first_codes, dtype=np.int64) * n_second
+                                        + np.asarray(second_codes, dtype=np.int64), sort=False)
+    counts = np.bincount(pair_codes, minlength=len(pairs))
+    pairs = np.asarray(pairs, dtype=np.int64)
+    order = np.argsort(pairs // n_second, kind='mergesort')
+    pairs = pairs[order]
+    return (pairs // n_second, pairs % n_second, counts[order])
+
+
+def edge_ids(source_ids, target_ids):
+    """ Ids of the edges as in the rest of networks: (source << 32) + target """
+    return (np.asarray(source_ids, dtype=np.int64) << 32) + np.asarray(target_ids, dtype=np.int64)
+
+
+def to_list(values):
+    """ Python list of values, so igraph attributes hold built-in types """
+    return values.tolist() if isinstance(values, np.ndarray) else list(values)
+
+
+def build_graph(n, sources, targets, directed, vertex_attrs, edge_attrs):
+    """
+    Creates an igraph Graph with n vertices and the given edges, along
+    with the vertex and edge attributes given as dicts of arrays.
+    Attributes are only set when there are vertices (edges) to hold them.
+    """
+    edges = list(zip(to_list(sources), to_list(targets)))
+    return Graph(n=n, edges=edges, directed=directed,
+        vertex_attrs={k: to_list(v) for k, v in vertex_attrs.items()} if n else {},
+        edge_attrs={k: to_list(v) for k, v in edge_attrs.items()} if edges else {})
+
+
+def co_edition_graph(counts, user_ids, labels, directed, edits_key, pages_key):
+    """
+    Creates the graph where nodes are users and there is an edge between
+    every pair of users who edited the same page, weighted by the number
+    of pages both of them edited.
+
+    counts -- sparse (users x pages) matrix with the edits of every user
+        on every page, one row per node.
+    user_ids, labels -- id and name of every node.
+
+    Vertex attrs: name, id, label, edits_key (number of edits) and
+        pages_key (number of edited pages).
+    Edge attrs: weight, id, source and target.
+
+    Returns the graph and the number of edited pages.
+    """
+    n_users = counts.shape[0]
+    user_ids = np.asarray(user_ids, dtype=np.int64)
+    users_pages = to_incidence(counts)
+
+    vertex_attrs = {
+        'name': np.arange(n_users),
+        'id': user_ids,
+        'label': labels,
+        edits_key: np.asarray(counts.sum(axis=1), dtype=np.int64).ravel(),
+        # total pages per user
+        pages_key: users_pages.getnnz(axis=1),
+    }
+
+    # Edges, weighted by the number of pages both users edited
+    sources, targets, weights = co_occurrence_edges(users_pages)
+    edge_attrs = {
+        'weight': weights,
+        'id': edge_ids(user_ids[sources], user_ids[targets]),
+        'source': user_ids[sources],
+        'target': user_ids[targets],
+    }
+
+    graph = build_graph(n_users, sources, targets, directed, vertex_attrs, edge_attrs)
+    return (graph, int(np.count_nonzero(users_pages.getnnz(axis=0))))
+
+
+def build_co_edition_graph(df, directed, edits_key, pages_key):
+    """
+    Creates the co-edition graph (see co_edition_graph()) of the users in
+    df, where nodes are in order of first edit.
+
+    Returns the graph and the number of pages in df.
+    """
+    user_codes, user_ids = factorize(df['contributor_id'].values)
+    page_codes, page_ids = factorize(df['page_id'].values)
+    counts = count_matrix(user_codes, page_codes, (len(user_ids), len(page_ids)))
+    labels = np.asarray(df['contributor_name'].values)[first_positions(user_codes)]
+    return co_edition_graph(counts, user_ids, labels, directed, edits_key, pages_key)
@@ -116,4 +116,14 @@ def get_network_stats(network_code: str) -> dict:
     elif network_code == UserTalkNetwork.CODE:
         return UserTalkNetwork.get_network_stats()
     else:
-        raise Exception("Something went bad. Missing network type selection.")
\ No newline at end of file
+        raise Exception("Something went bad. Missing network type selection.")
+
+def get_stats_to_calculate(network_code: str, metrics: list) -> list:
+    if network_code == CoEditingNetwork.CODE:
+        return CoEditingNetwork.get_stats_to_calculate(metrics)
+    elif network_code == TalkPagesNetwork.CODE:
+        return TalkPagesNetwork.get_stats_to_calculate(metrics)
+    elif network_code == UserTalkNetwork.CODE:
+        return UserTalkNetwork.get_stats_to_calculate(metrics)
+    else:
+        raise Exception("Something went bad. Missing network type selection.")
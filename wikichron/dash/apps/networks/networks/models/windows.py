@@ -0,0 +1,296 @@
+"""
+   windows.py
+
+   Descp: Per-wiki data which the network of every time window of the dates
+      slider is built from, so moving the slider doesn't filter and scan all
+      the revisions of the wiki again.
+
+      Co-edition networks keep the edits of every user on every page at a
+      few checkpoints, as cumulative sparse (users x pages) matrices: the
+      matrix of any window is the difference of two of them plus the edits
+      of the rows of the window out of them.
+
+      They are built once per wiki and network, and stored along with the
+      wiki data in the data store. They can also be precooked offline (see
+      precook_data.py) in npz files under precooked_dir, checkpoints
+      included, which are loaded instead of building them when they match
+      the data of the wiki: same csv file (size and a hash of its content)
+      and bots, so they can be precooked on another host.
+
+   Created on: 18/10/2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from wikichron.utils.data_store import get_derived, is_stored, get_stored_fingerprint
+from . import graph_builder
+
+# Directory of the precooked windows data, None to not use them
+precooked_dir = None
+PRECOOKED_VERSION = 4
+
+# Number of cumulative edits matrices kept by co-edition windows. More of
+# them make windows faster to build, at the cost of memory (each one is up
+# to the size of the matrix of the whole wiki)
+CHECKPOINTS = int(os.getenv('WIKICHRON_NETWORKS_WINDOWS_CHECKPOINTS', 8))
+
+
+def to_datetime64(bound):
+    return pd.Timestamp(bound).to_datetime64()
+
+
+def to_storable(array):
+    """ Object arrays (i.e. names) are stored as unicode arrays """
+    return array.astype(str) if array.dtype == object else array
+
+
+def from_storable(array):
+    return array.astype(object) if array.dtype.kind == 'U' else array
+
+
+class RowWindows:
+    """
+    Columns (np arrays) of the rows of a network for the whole wiki,
+    sorted by timestamp, so the rows of any time window are a slice of them.
+    """
+
+    def __init__(self, timestamps, columns):
+        self.timestamp = np.asarray(timestamps).astype('datetime64[ns]')
+        self.columns = columns
+
+
+    def get_bounds(self, lower_bound = '', upper_bound = ''):
+        """
+        Returns the first row and the row after the last one between
+        lower_bound and upper_bound (both included), like filter_by_time()
+        does: if any of them is missing, all the rows are in the window.
+        """
+        if not (lower_bound and upper_bound):
+            return (0, len(self.timestamp))
+        start = np.searchsorted(self.timestamp, to_datetime64(lower_bound), side='left')
+        end = np.searchsorted(self.timestamp, to_datetime64(upper_bound), side='right')
+        return (int(start), int(max(start, end)))
+
+
+    def get_rows(self, start, end):
+        return {key: column[start:end] for key, column in self.columns.items()}
+
+
+    def to_arrays(self) -> dict:
+        """ Returns the np arrays to store, see from_arrays() """
+        arrays = {'timestamp': self.timestamp}
+        for key, column in self.columns.items():
+            arrays[f'column_{key}'] = to_storable(column)
+        return arrays
+
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        columns = {key[len('column_'):]: from_storable(array)
+                    for key, array in arrays.items() if key.startswith('column_')}
+        return cls(arrays['timestamp'], columns)
+
+
+    @property
+    def nbytes(self):
+        return self.timestamp.nbytes + sum(column.nbytes for column in self.columns.values())
+
+
+class CoEditionWindows(RowWindows):
+    """
+    Edits of every user on every page, for co-edition networks.
+
+    Attributes (besides the ones of RowWindows):
+        user_ids, names -- distinct contributor ids and names, which the
+            'user' and 'name' columns are codes of.
+        checkpoint_bounds -- CHECKPOINTS + 1 rows, evenly spaced from the
+            first row to the number of rows.
+        checkpoints -- checkpoints[k] is the sparse (users x pages) matrix
+            with the edits of the rows before checkpoint_bounds[k].
+        user_rows -- rows of every user, encoded as user * n_rows + row and
+            sorted, to find the first edit of each user within a window.
+    """
+
+    def __init__(self, timestamps, columns, user_ids, names, n_pages,
+                checkpoint_bounds = None, checkpoints = None, user_rows = None):
+        """ The checkpoints and user_rows are computed, unless given (see from_arrays()) """
+        super().__init__(timestamps, columns)
+        self.user_ids = user_ids
+        self.names = names
+        self.shape = (len(user_ids), n_pages)
+        user = columns['user']
+        n_rows = len(user)
+
+        if checkpoints is None:
+            checkpoint_bounds = np.unique(
+                np.linspace(0, n_rows, CHECKPOINTS + 1).astype(np.int64))
+            checkpoints = [self.count(0, 0)]
+            for start, end in zip(checkpoint_bounds[:-1], checkpoint_bounds[1:]):
+                checkpoints.append(checkpoints[-1] + self.count(start, end))
+        self.checkpoint_bounds = checkpoint_bounds
+        self.checkpoints = checkpoints
+
+        if user_rows is None:
+            by_user = np.argsort(user, kind='mergesort')
+            user_rows = user[by_user].astype(np.int64) * max(n_rows, 1) + by_user
+        self.user_rows = user_rows
+
+
+    @classmethod
+    def from_dataframe(cls, df):
+        user, user_ids = graph_builder.factorize(df['contributor_id'].values)
+        page, page_ids = graph_builder.factorize(df['page_id'].values)
+        name, names = graph_builder.factorize(df['contributor_name'].values)
+        return cls(df['timestamp'].values, {'user': user, 'page': page, 'name': name},
+                    user_ids, names, len(page_ids))
+
+
+    def to_arrays(self) -> dict:
+        """ Checkpoints are stored as the arrays of their CSR matrices """
+        arrays = super().to_arrays()
+        arrays.update({
+            'user_ids': self.user_ids,
+            'names': to_storable(self.names),
+            'n_pages': np.array(self.shape[1]),
+            'checkpoint_bounds': self.checkpoint_bounds,
+            'user_rows': self.user_rows,
+        })
+        for k, matrix in enumerate(self.checkpoints):
+            arrays.update({f'checkpoint_{k}_data': matrix.data,
+                        f'checkpoint_{k}_indices': matrix.indices,
+                        f'checkpoint_{k}_indptr': matrix.indptr})
+        return arrays
+
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        rows = RowWindows.from_arrays(arrays)
+        shape = (len(arrays['user_ids']), int(arrays['n_pages']))
+        checkpoints = [sparse.csr_matrix((arrays[f'checkpoint_{k}_data'],
+                                        arrays[f'checkpoint_{k}_indices'],
+                                        arrays[f'checkpoint_{k}_indptr']), shape=shape)
+                        for k in range(len(arrays['checkpoint_bounds']))]
+        return cls(rows.timestamp, rows.columns, arrays['user_ids'],
+                    from_storable(arrays['names']), shape[1],
+                    arrays['checkpoint_bounds'], checkpoints, arrays['user_rows'])
+
+
+    @property
+    def nbytes(self):
+        return (super().nbytes + self.user_ids.nbytes + self.names.nbytes
+                + self.checkpoint_bounds.nbytes + self.user_rows.nbytes
+                + sum(matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+                        for matrix in self.checkpoints))
+
+
+    def count(self, start, end):
+        """ Sparse (users x pages) matrix with the edits of rows [start, end) """
+        return graph_builder.count_matrix(self.columns['user'][start:end],
+                                        self.columns['page'][start:end], self.shape)
+
+
+    def get_counts(self, start, end):
+        """
+        Same as count(), but from the difference of the checkpoints within
+        the rows plus the edits of the rows out of them
+        """
+        first = np.searchsorted(self.checkpoint_bounds, start, side='left')
+        last = np.searchsorted(self.checkpoint_bounds, end, side='right') - 1
+        if first >= last:
+            return self.count(start, end)
+
+        return (self.checkpoints[last] - self.checkpoints[first]
+                + self.count(start, self.checkpoint_bounds[first])
+                + self.count(self.checkpoint_bounds[last], end))
+
+
+    def get_graph(self, start, end, directed, edits_key, pages_key):
+        """
+        Returns the co-edition graph of rows [start, end), see
+        graph_builder.co_edition_graph(), and the number of edited pages
+        """
+        counts = self.get_counts(start, end)
+        counts.eliminate_zeros()
+        users = np.flatnonzero(counts.getnnz(axis=1))
+
+        # nodes are in order of first edit within the window
+        offsets = users.astype(np.int64) * max(len(self.timestamp), 1)
+        first_rows = self.user_rows[np.searchsorted(self.user_rows, offsets + start)] - offsets
+        order = np.argsort(first_rows, kind='mergesort')
+        users = users[order]
+        labels = self.names[self.columns['name'][first_rows[order]]]
+
+        return graph_builder.co_edition_graph(counts[users], self.user_ids[users],
+                            labels, directed, edits_key, pages_key)
+
+
+WINDOWS_CLASSES = {cls.__name__: cls for cls in (RowWindows, CoEditionWindows)}
+
+
+def get_precooked_path(wiki_data, network_code):
+    """ Path of the precooked windows of the wiki with csv file wiki_data """
+    return os.path.join(precooked_dir, f'{os.path.splitext(wiki_data)[0]}_{network_code}.npz')
+
+
+def write_precooked(windows, df, network_code):
+    """
+    Writes windows, built from df (the full data of a stored wiki), in
+    precooked_dir and returns the path of the file written
+    """
+    fingerprint = get_stored_fingerprint(df)
+    if fingerprint is None:
+        raise ValueError(f'{df.index.name} is not the full data of a stored wiki')
+    path = get_precooked_path(df.index.name, network_code)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # not compressed: decompressing them takes as long as building them again
+    np.savez(path,
+        version=np.array(PRECOOKED_VERSION),
+        windows_class=np.array(type(windows).__name__),
+        wiki_fingerprint=np.array(fingerprint),
+        **windows.to_arrays())
+    return path
+
+
+def load_precooked(df, network_code):
+    """
+    Returns the precooked windows of a network for df (the full data of a
+    stored wiki), or None if there are none or they were built from other
+    data than df (see WikiDataStore.get_fingerprint()).
+    """
+    if not precooked_dir:
+        return None
+    path = get_precooked_path(df.index.name, network_code)
+    if not os.path.isfile(path):
+        return None
+
+    with np.load(path) as npz:
+        arrays = dict(npz)
+    if int(arrays.pop('version')) != PRECOOKED_VERSION\
+        or str(arrays.pop('wiki_fingerprint', '')) != get_stored_fingerprint(df):
+        print(f' * [Info] Outdated precooked network data: {path}')
+        return None
+
+    windows_class = WINDOWS_CLASSES[str(arrays.pop('windows_class'))]
+    return windows_class.from_arrays(arrays)
+
+
+def get_windows(df, network_code, builder):
+    """
+    Returns the windows data of a network for df, loaded from its
+    precooked file or else built by builder(df), once per wiki.
+    Returns None if df is not the full data of a stored wiki.
+    """
+    if not is_stored(df):
+        return None
+
+    def load_or_build(df):
+        windows = load_precooked(df, network_code)
+        return windows if windows is not None else builder(df)
+
+    return get_derived(df, f'networks_windows_{network_code}', load_or_build)
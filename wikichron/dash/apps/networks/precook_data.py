@@ -1,14 +1,25 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """
-   generate_wiki_network.py
-
-   Descp: This script generates a network per wiki csv. It get them from ../data
-    and creates a bin|gml network in precooked_data/networks
+   precook_data.py
+
+   Descp: This script precooks the networks data of every wiki in wikis.json
+    and every available network which the network of any time window is
+    built from (see networks/models/windows.py): the rows of the network
+    sorted by time and, for co-edition networks, the cumulative edits
+    matrices at a few checkpoints.
+    They are written as npz files in PRECOOKED_NETWORK_DIR
+    (precooked_data/networks by default), where get_network() loads them
+    from when they match the current data of the wiki (same size and hash
+    of its csv file, and same bots), so they can be precooked on another
+    host.
+
+    Usage:
+        python -m wikichron.dash.apps.networks.precook_data [wiki ...]
 
     Parameters:
-        -bin or nothing: to write a bin network
-        -gml: to write a gml network
+        -wiki: csv filenames or domains of the wikis to precook.
+            All the wikis in wikis.json if none is given.
 
    Created on: 17-dic-2018
 
@@ -19,71 +30,43 @@
 
 
 import os
-from os.path import join
 import sys
-import pandas as pd
-import json
 import time
 
-import lib.interface as lib
-from lib.networks.types.CoEditingNetwork import CoEditingNetwork
+from .networks import interface
+from . import data_controller
 
-if not 'WIKICHRON_DATA_DIR' in os.environ:
-    os.environ['WIKICHRON_DATA_DIR'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data')
-data_dir = os.environ['WIKICHRON_DATA_DIR']
 
 def main(*args):
-    if len(sys.argv) > 2:
-        print('Error: Invalid number of arguments')
-        return 1
-
-    write_bin = True
-    dest_path = os.path.join('precooked_data', 'networks')
-    if len(sys.argv) == 2:
-        if sys.argv[1] == '-gml':
-            write_bin = False
-            dest_path = os.path.join(dest_path, 'gml')
-        elif sys.argv[1] == '-bin':
-            write_bin = True
-            dest_path = os.path.join(dest_path, 'bin')
-        else:
-            print(f'Error: argument {sys.argv[1]} is not allowed')
+    wikis = data_controller.get_available_wikis()
+    if args:
+        wikis = [wiki for wiki in wikis if wiki['data'] in args or wiki.get('domain') in args]
+        if not wikis:
+            print(f'Error: no wiki found in wikis.json for {", ".join(args)}')
             return 1
 
-    if not os.path.isdir(data_dir):
-        print('Error: the path "{}" was not found'.format(source_path))
-        return 1
+    interface.set_precooked_dir(data_controller.precooked_net_dir)
+    print(f'Writing precooked networks data in: {data_controller.precooked_net_dir}')
 
-    if not os.path.isdir(dest_path):
-        print(f'Creating directory for first time: {dest_path}')
-        os.makedirs(dest_path)
+    for wiki in wikis:
+        if not os.path.isfile(os.path.join(data_controller.data_dir, wiki['data'])):
+            print(f"Skipping {wiki['name']}: {wiki['data']} not found")
+            continue
 
-    wikis = json.load(open(os.path.join(data_dir, 'wikis.json')))
+        df = data_controller.read_data(wiki)
+        for network_type in interface.get_available_networks():
+            print(f"Precooking {network_type.NAME} network data for {wiki['name']}")
+            time_start_precooking = time.perf_counter()
 
-    for wiki in wikis:
-        df = lib.get_dataframe_from_csv(os.path.join(data_dir, wiki['data']))
-        lib.prepare_data(df)
-        df = lib.clean_up_bot_activity(df, wiki)
-
-        net = CoEditingNetwork()
-        print(f"Generating network data for {wiki['name']}")
-        time_start_generating_network = time.perf_counter()
-
-        net.generate_from_pandas(data = df)
-        time_end_generating_network = time.perf_counter() - time_start_generating_network
-        print(' * [Timing] Generating network for {} : {} seconds'
-                .format(wiki['name'], time_end_generating_network))
-        o_f = wiki['data'][:-3]
-        if write_bin:
-            o_f = '{}{}.bin'.format(o_f, net.code)
-            net.write_pickle(fname = os.path.join(dest_path, o_f))
-        else:
-            o_f = '{}{}.gml'.format(o_f, net.code)
-            net.copy_and_write_gml(os.path.join(dest_path, o_f))
+            path = interface.write_precooked_network(network_type.CODE, wiki, df)
 
+            time_end_precooking = time.perf_counter() - time_start_precooking
+            if path:
+                print(' * [Timing] Precooking {} : {} seconds'
+                        .format(path, time_end_precooking))
 
     return 0
 
 
 if __name__ == '__main__':
-    sys.exit(main())
+    sys.exit(main(*sys.argv[1:]))
@@ -23,6 +23,7 @@ import base64
 # local imports
 import wikichron.utils.data_manager as data_manager
 import wikichron.utils.utils as utils
+from wikichron.utils.data_store import get_data_store
 
 # Imports from dash apps
 # classic
@@ -31,6 +32,10 @@ import wikichron.dash.apps.classic.metrics.interface as classic_interface
 import wikichron.dash.apps.networks.networks.interface as networks_interface
 # monowiki
 import wikichron.dash.apps.monowiki.metrics.interface as monowiki_interface
+# caches of every dash app
+import wikichron.dash.apps.classic.cache as classic_cache
+import wikichron.dash.apps.networks.cache as networks_cache
+import wikichron.dash.apps.monowiki.cache as monowiki_cache
 
 # upload config variables
 ALLOWED_EXTENSIONS = set(['csv'])
@@ -352,6 +357,35 @@ def serve_wikis_time_lifes():
     return jsonify(time_spans)
 
 
+@server_bp.route('/cacheStats.json')
+def serve_cache_stats():
+    """
+    Size of each cache tier as seen by the process serving the request:
+    the data store of this process with the wikis data and the flask caches
+    (redis in production) with the computed results of every dash app.
+    Only served if CACHE_STATS is set in the config.
+    """
+    config = current_app.config
+    if not config.get('CACHE_STATS'):
+        flask.abort(404)
+
+    results_cache = {
+        'classic': utils.get_cache_stats(classic_cache.cache),
+        'networks': utils.get_cache_stats(networks_cache.cache),
+        'monowiki': utils.get_cache_stats(monowiki_cache.cache),
+    }
+    stats = {
+        'pid': os.getpid(),
+        'data_store': get_data_store().get_stats(),
+        'results_cache': results_cache,
+    }
+    # all the apps share the same redis server, so its numbers are not per app
+    if config.get('REDIS_URL') and \
+        any(cache['type'] == 'RedisCache' for cache in results_cache.values()):
+        stats['redis_server'] = utils.get_redis_server_stats(config['REDIS_URL'])
+    return jsonify(stats)
+
+
 @server_bp.route('/classic/<path>/')
 @server_bp.route('/classic/<path>')
 def redirect_classic_to_compare(path):
@@ -0,0 +1,60 @@
+/**
+ * This script applies the view of the graphs (visible wikis and metrics,
+ * and time range), which the server writes in the hidden div #graphs-view,
+ * to the graphs already plotted. This way, the traces of the graphs are
+ * only sent once per selection, and not for every change of the
+ * dropdowns or the dates slider.
+ *
+ * Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+ */
+
+const GRAPH_CONTAINER_PREFIX = 'graph-container-';
+
+
+function get_graphs_view() {
+    const viewDiv = document.getElementById('graphs-view');
+    if (!viewDiv || !viewDiv.textContent) {
+        return null;
+    }
+    return JSON.parse(viewDiv.textContent);
+}
+
+
+function apply_graphs_view() {
+    const view = get_graphs_view();
+    if (!view) {
+        return;
+    }
+
+    const containers = document.querySelectorAll(`[id^=${GRAPH_CONTAINER_PREFIX}]`);
+    containers.forEach(function(container) {
+        const metricIdx = parseInt(container.id.slice(GRAPH_CONTAINER_PREFIX.length), 10);
+        const visible = view['metrics'].indexOf(metricIdx) !== -1;
+        const wasHidden = container.style.display === 'none';
+        container.style.display = visible ? '' : 'none';
+
+        const plot = container.querySelector('.js-plotly-plot');
+        if (!visible || !plot || !plot.data) {
+            return;
+        }
+        // plots hidden until now have to fit their container again
+        if (wasHidden) {
+            Plotly.Plots.resize(plot);
+        }
+
+        const traces = plot.data.map(function(_, wikiIdx) {
+            return view['wikis'].indexOf(wikiIdx) !== -1 ? true : 'legendonly';
+        });
+        const layout = view['range'] ? {'xaxis.range': view['range']} : {};
+        Plotly.update(plot, {'visible': traces}, layout);
+    });
+}
+
+
+/* Setting graphs view observer */
+const graphsView = document.getElementById('graphs-view');
+const graphsViewObserver = new MutationObserver(function() {
+    apply_graphs_view();
+});
+
+graphsViewObserver.observe(graphsView, {childList: true, subtree: true, characterData: true});
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   columnar_cache.py
+
+   Descp: Binary columnar cache for the wiki csv dumps.
+
+       Parsing a big csv with pandas (and then its timestamps) takes a lot of
+       time, so the first time a csv is loaded we store next to it a
+       "<csv>.columnar" file with its already typed columns. Next loads read
+       that file instead, which is just a json header followed by raw numpy
+       arrays (one 2D block per dtype, one row per column) that can be read
+       in one go or memory-mapped.
+
+       The cache is invalidated whenever the size or the modification time
+       of the source csv changes.
+
+       The same format is used to store the prepared data of every wiki
+       (sorted and without bots activity) in "<csv>.prepared.columnar".
+       These files are memory-mapped, so all the gunicorn workers share the
+       same physical memory for the data of a wiki.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from warnings import warn
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_integer_dtype, is_object_dtype
+
+# The blocks of the mapped dataframes are built with these internals of
+#  pandas, which are not public API. They are only used with the pandas
+#  versions they have been checked with (0.24 to 1.x), and dataframes are
+#  built from their columns otherwise, see _build_dataframe().
+try:
+    from pandas.core.internals import BlockManager, make_block
+except ImportError:
+    BlockManager = make_block = None
+USE_BLOCK_MANAGER = (BlockManager is not None
+                    and int(pd.__version__.split('.')[0]) < 2)
+
+CACHE_EXTENSION = '.columnar'
+PREPARED_CACHE_EXTENSION = '.prepared.columnar'
+FORMAT_VERSION = 1
+
+MAGIC = b'WCCOLUMN'
+HEADER_LEN_FORMAT = '<Q'
+ALIGNMENT = 64
+
+# dtype to use for each column (when values fit, int64 otherwise).
+# page_ns uses int16 as wikia namespaces go beyond the int8 range (500, 1200...)
+COLUMN_DTYPES = {
+    'page_id': np.int32,
+    'page_ns': np.int16,
+    'revision_id': np.int32,
+    'contributor_id': np.int32,
+    'bytes': np.int32,
+}
+
+
+def get_csv_fingerprint(csv_path):
+    stat = os.stat(csv_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def get_csv_digest(csv_path, chunk_size = 2**20):
+    """ sha1 of the content of the csv file, the same on every host """
+    digest = hashlib.sha1()
+    with open(csv_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parse_csv(csv_path):
+    """ Read and parse a wiki csv dump, the same way it has always been done """
+    df = pd.read_csv(csv_path,
+                    delimiter=',', quotechar='|',
+                    index_col=False)
+    df['timestamp']=pd.to_datetime(df['timestamp'],format='%Y-%m-%dT%H:%M:%SZ')
+    return df
+
+
+def _downcast_int(values, dtype):
+    """ Cast integer values to dtype if all of them fit in, to int64 otherwise """
+    if len(values) == 0:
+        return values.astype(dtype)
+    info = np.iinfo(dtype)
+    if values.min() >= info.min and values.max() <= info.max:
+        return values.astype(dtype)
+    else:
+        return values.astype(np.int64)
+
+
+def _encode_contributor_ids(ids):
+    """
+       Anonymous contributions have the ip address of the contributor as
+       contributor_id, so that column comes as strings from the csv whenever
+       the wiki has anonymous activity. In order to store it as integers, ip
+       addresses are replaced by negative surrogate ids (one per distinct ip),
+       which can never clash with the positive ids of registered users.
+    """
+    if is_integer_dtype(ids.dtype):
+        return ids.values
+    numeric_ids = pd.to_numeric(ids, errors='coerce')
+    non_numeric = numeric_ids.isnull().values
+    surrogates, _ = pd.factorize(ids.values[non_numeric])
+    encoded = np.empty(len(ids), dtype=np.int64)
+    encoded[~non_numeric] = numeric_ids.values[~non_numeric]
+    encoded[non_numeric] = -(surrogates + 1)
+    return encoded
+
+
+def is_categorical(dtype):
+    return isinstance(dtype, pd.CategoricalDtype)
+
+
+def parse_contributor_ids(ids):
+    """
+       Convert contributor ids given as strings (e.g. the ids of the bots in
+       wikis.json) to the integers of the contributor_id column.
+       Ids which are not integers are skipped with a warning.
+    """
+    parsed = []
+    for contributor_id in ids:
+        try:
+            parsed.append(int(contributor_id))
+        except (TypeError, ValueError):
+            warn('Skipping invalid contributor id: {}'.format(contributor_id))
+    return parsed
+
+
+def to_typed_dataframe(df):
+    """
+       Return a new dataframe with the columns of df converted to the compact
+       types stored in the cache: int32/int16 integers, datetime64 timestamps
+       and categoricals for string columns (page_title, contributor_name...).
+    """
+    columns = {}
+    for col in df.columns:
+        values = df[col]
+        if col == 'contributor_id':
+            values = _encode_contributor_ids(values)
+        else:
+            values = values.values
+        if col in COLUMN_DTYPES and is_integer_dtype(values.dtype):
+            values = _downcast_int(values, COLUMN_DTYPES[col])
+        elif is_object_dtype(values.dtype):
+            values = pd.Categorical(values)
+        columns[col] = values
+
+    typed_df = pd.DataFrame(columns, columns=df.columns, index=df.index)
+    typed_df.index.name = df.index.name
+    return typed_df
+
+
+def _group_columns_in_blocks(df):
+    """
+       Group the columns of df by their storage dtype. Codes of categorical
+       columns are grouped apart from the rest of columns.
+       Returns a list of (dtype, [column names]) in order of first appearance
+    """
+    blocks = []
+    keys = []
+    for col in df.columns:
+        values = df[col].values
+        if is_categorical(values.dtype):
+            key = (values.codes.dtype, True)
+        else:
+            key = (values.dtype, False)
+        if key in keys:
+            blocks[keys.index(key)][1].append(col)
+        else:
+            keys.append(key)
+            blocks.append((key[0], [col]))
+    return blocks
+
+
+def _column_storage_values(df, col):
+    values = df[col].values
+    if is_categorical(values.dtype):
+        return values.codes
+    else:
+        return values
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _write_columnar_file(df, path, metadata):
+    """
+       Store the (already typed) dataframe df, together with the dict
+       metadata, in the columnar file path. The file is first written to a
+       temporary file in the same directory and then renamed, so concurrent
+       readers never see a partial file.
+    """
+    blocks = _group_columns_in_blocks(df)
+    nrows = len(df)
+    default_index = df.index.equals(pd.RangeIndex(nrows))
+
+    header = {
+        'version': FORMAT_VERSION,
+        'metadata': metadata,
+        'nrows': nrows,
+        'columns': list(df.columns),
+        'categories': {col: df[col].cat.categories.tolist()
+                        for col in df.columns
+                        if is_categorical(df[col].dtype)},
+        'index': None,
+        'index_name': df.index.name,
+        'blocks': [],
+    }
+
+    # blocks offsets are relative to the start of the data section,
+    #  which begins at the first aligned position after the header.
+    offset = 0
+    for dtype, columns in blocks:
+        header['blocks'].append({'dtype': dtype.str, 'columns': columns,
+                                'offset': offset})
+        offset = _align(offset + dtype.itemsize * len(columns) * nrows)
+    if not default_index:
+        index_values = np.asarray(df.index.values, dtype=np.int64)
+        header['index'] = {'dtype': index_values.dtype.str, 'offset': offset}
+    header_bytes = json.dumps(header).encode('utf-8')
+    data_start = _get_data_start(len(header_bytes))
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                            prefix='.' + os.path.basename(path) + '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack(HEADER_LEN_FORMAT, len(header_bytes)))
+            f.write(header_bytes)
+            for (dtype, columns), block_header in zip(blocks, header['blocks']):
+                block = np.empty((len(columns), nrows), dtype=dtype)
+                for i, col in enumerate(columns):
+                    block[i] = _column_storage_values(df, col)
+                f.seek(data_start + block_header['offset'])
+                block.tofile(f)
+            if not default_index:
+                f.seek(data_start + header['index']['offset'])
+                index_values.tofile(f)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except:
+        os.remove(tmp_path)
+        raise
+    return
+
+
+def _get_data_start(header_len):
+    return _align(len(MAGIC) + struct.calcsize(HEADER_LEN_FORMAT) + header_len)
+
+
+def _read_header(f):
+    """ Returns the header of the file and the position where data starts """
+    if f.read(len(MAGIC)) != MAGIC:
+        return (None, None)
+    (header_len,) = struct.unpack(HEADER_LEN_FORMAT,
+                                f.read(struct.calcsize(HEADER_LEN_FORMAT)))
+    header = json.loads(f.read(header_len).decode('utf-8'))
+    return (header, _get_data_start(header_len))
+
+
+def _read_array(f, path, dtype, shape, offset, mmap):
+    if mmap:
+        if shape[-1] == 0: # empty files can't be mapped
+            return np.empty(shape, dtype=dtype)
+        # copy-on-write mapping: pages are shared with the other processes
+        #  mapping the same file, and writes (if any) are kept private.
+        return np.memmap(path, dtype=dtype, mode='c', offset=offset, shape=shape)
+    else:
+        f.seek(offset)
+        count = int(np.prod(shape))
+        return np.fromfile(f, dtype=dtype, count=count).reshape(shape)
+
+
+def _read_columnar_file(path, is_valid, mmap):
+    """
+       Load the dataframe stored in the columnar file path.
+
+       is_valid -- function receiving the metadata stored with the dataframe
+          which tells whether that data can be used or not.
+       mmap -- if True, the data is memory-mapped from the file instead of
+          being read. The dataframe is built directly on top of the mapped
+          blocks, so no copy of the data is made.
+
+       Returns None if the file doesn't exist or is not valid.
+    """
+    if not os.path.isfile(path):
+        return None
+
+    with open(path, 'rb') as f:
+        (header, data_start) = _read_header(f)
+        if (header is None or header['version'] != FORMAT_VERSION
+                or not is_valid(header['metadata'])):
+            return None
+
+        nrows = header['nrows']
+        columns = header['columns']
+        blocks = []
+        for block_header in header['blocks']:
+            block_columns = block_header['columns']
+            block = _read_array(f, path, np.dtype(block_header['dtype']),
+                                (len(block_columns), nrows),
+                                data_start + block_header['offset'], mmap)
+            placement = [columns.index(col) for col in block_columns]
+            blocks.append((block, block_columns, placement))
+
+        if header['index'] is not None:
+            index_values = _read_array(f, path, np.dtype(header['index']['dtype']),
+                                (nrows,), data_start + header['index']['offset'],
+                                mmap)
+            index = pd.Index(np.asarray(index_values), copy=False,
+                            name=header['index_name'])
+        else:
+            index = pd.RangeIndex(nrows, name=header['index_name'])
+
+    return _build_dataframe(blocks, columns, index, header['categories'])
+
+
+def _build_dataframe(blocks, columns, index, categories):
+    """
+       Build the dataframe of the 2D blocks read from a columnar file, as a
+       list of (block, [column names], [column positions]), on top of them.
+    """
+    if USE_BLOCK_MANAGER:
+        # Build the BlockManager of the dataframe ourselves so pandas uses
+        #  our 2D blocks as they are, instead of copying every column into
+        #  new ones.
+        mgr_blocks = []
+        for block, block_columns, placement in blocks:
+            block = np.asarray(block) # a plain view of the memmap, if any
+            if block_columns[0] in categories:
+                for i, col in enumerate(block_columns):
+                    values = pd.Categorical.from_codes(block[i], categories[col])
+                    mgr_blocks.append(make_block(values, placement=[placement[i]]))
+            else:
+                mgr_blocks.append(make_block(block, placement=placement))
+
+        mgr = BlockManager(mgr_blocks, [pd.Index(columns), index])
+        return pd.DataFrame(mgr)
+
+    # Public constructor: every column is a view of a row of its block. From
+    #  pandas 2 on, they are kept apart instead of being copied into new
+    #  2D blocks.
+    data = {}
+    for block, block_columns, _ in blocks:
+        block = np.asarray(block)
+        for i, col in enumerate(block_columns):
+            if col in categories:
+                data[col] = pd.Categorical.from_codes(block[i], categories[col])
+            else:
+                data[col] = block[i]
+    return pd.DataFrame(data, columns=columns, index=index, copy=False)
+
+
+def get_cache_path(csv_path):
+    return csv_path + CACHE_EXTENSION
+
+
+def write_cache(df, csv_path):
+    """ Store the (already typed) dataframe df as the columnar cache of csv_path """
+    metadata = {'source': get_csv_fingerprint(csv_path)}
+    _write_columnar_file(df, get_cache_path(csv_path), metadata)
+
+
+def read_cache(csv_path, mmap=False):
+    """
+       Load the columnar cache of csv_path.
+       Returns None if there is no cache or if it's outdated.
+    """
+    fingerprint = get_csv_fingerprint(csv_path)
+    return _read_columnar_file(get_cache_path(csv_path),
+                        lambda metadata: metadata['source'] == fingerprint,
+                        mmap)
+
+
+def get_prepared_cache_path(csv_path):
+    return csv_path + PREPARED_CACHE_EXTENSION
+
+
+def write_prepared_cache(df, csv_path, bots_ids):
+    """
+       Store the prepared data of the wiki in csv_path (i.e. the data
+       already sorted and without the activity of the bots in bots_ids).
+    """
+    metadata = {'source': get_csv_fingerprint(csv_path),
+                'bots_ids': _serialize_bots_ids(bots_ids)}
+    _write_columnar_file(df, get_prepared_cache_path(csv_path), metadata)
+
+
+def read_prepared_cache(csv_path, bots_ids, mmap=True):
+    """
+       Load the prepared data of the wiki in csv_path, memory-mapped by
+       default so all the processes reading it share the same memory.
+       Returns None if there is no prepared data for this version of the
+       csv and these bots.
+    """
+    fingerprint = get_csv_fingerprint(csv_path)
+    bots_ids = _serialize_bots_ids(bots_ids)
+    return _read_columnar_file(get_prepared_cache_path(csv_path),
+                        lambda metadata: metadata['source'] == fingerprint
+                                        and metadata['bots_ids'] == bots_ids,
+                        mmap)
+
+
+def _serialize_bots_ids(bots_ids):
+    if bots_ids is None:
+        return None
+    else:
+        return sorted(bots_ids)
+
+
+def load_dataframe(csv_path):
+    """
+       Return the typed dataframe for the csv in csv_path, reading it from its
+       columnar cache when available or parsing the csv and writing the cache
+       otherwise.
+    """
+    try:
+        df = read_cache(csv_path)
+    except (OSError, ValueError, KeyError) as e:
+        warn('Ignoring unreadable columnar cache for {}: {}'.format(csv_path, e))
+        df = None
+
+    if df is None:
+        df = to_typed_dataframe(parse_csv(csv_path))
+        try:
+            write_cache(df, csv_path)
+        except OSError as e:
+            warn('Could not write columnar cache for {}: {}'.format(csv_path, e))
+
+    return df
@@ -17,6 +17,8 @@ import json
 import os
 import zc.lockfile
 
+from . import columnar_cache
+
 data_dir = os.getenv('WIKICHRON_DATA_DIR', 'data')
 
 global available_wikis
@@ -93,11 +95,8 @@ def update_wikis_metadata(new_metadata):
 
 
 def load_dataframe_from_csv(csv: str):
-    df = pd.read_csv(os.path.join(data_dir, csv),
-                    delimiter=',', quotechar='|',
-                    index_col=False)
-    df['timestamp']=pd.to_datetime(df['timestamp'],format='%Y-%m-%dT%H:%M:%SZ')
-    return df
+    # this also (re)generates the columnar cache of the csv
+    return columnar_cache.load_dataframe(os.path.join(data_dir, csv))
 
 
 def get_stats(data : pd.DataFrame) -> dict:
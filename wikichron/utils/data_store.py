@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   data_store.py
+
+   Descp: Process-wide store of the wikis data shared by all the dash apps.
+
+       Each wiki is loaded (from its columnar cache), sorted by timestamp and
+       cleaned up of bots activity only once per process, and then the same
+       frame is served to the classic, monowiki and networks apps.
+       That prepared data is also written to disk and then memory-mapped, so
+       every process using a wiki shares the same physical memory.
+       Loaded wikis are kept in a LRU with a memory budget, which can be set
+       in megabytes with the env variable WIKICHRON_DATA_STORE_SIZE.
+
+       Wikis listed in the env variable WIKICHRON_PRELOAD_WIKIS (comma
+       separated domains or csv filenames, or '*' for all of them) can be
+       preloaded in every process calling preload_wikis_from_env(), e.g. in
+       a gunicorn post_worker_init hook.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import os
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from warnings import warn
+
+import numpy as np
+
+from . import columnar_cache
+from . import data_manager
+
+data_dir = os.getenv('WIKICHRON_DATA_DIR', 'data')
+DEFAULT_MAX_MBYTES = 2048
+
+
+class _StoreEntry:
+
+    def __init__(self, df, fingerprint, bots_ids, nbytes):
+        self.df = df
+        self.fingerprint = fingerprint
+        self.bots_ids = bots_ids
+        self.nbytes = nbytes
+        # sha1 of the csv, computed when first needed (see get_fingerprint())
+        self.csv_digest = None
+        # data derived from df (aggregates, lookup tables...) by name
+        self.derived = {}
+
+
+class WikiDataStore:
+    """
+       LRU store of the bot-filtered and timestamp-sorted data of the wikis.
+
+       Frames returned by get() are shallow copies of the stored ones, so
+       callers can add columns, reset indexes or sort them in place without
+       altering the frame the rest of the apps get. Modifying the values of
+       the existing columns in place is not allowed.
+    """
+
+    def __init__(self, data_dir, max_bytes):
+        self.data_dir = data_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading_locks = {}
+
+
+    def get(self, wiki):
+        """ Returns the dataframe of the wiki """
+        key = wiki['data']
+        csv_path = os.path.join(self.data_dir, key)
+        fingerprint = columnar_cache.get_csv_fingerprint(csv_path)
+        bots_ids = get_bots_ids(wiki)
+
+        with self._lock:
+            entry = self._get_valid_entry(key, fingerprint, bots_ids)
+            if entry is not None:
+                self.hits += 1
+                return entry.df.copy(deep=False)
+            loading_lock = self._loading_locks.setdefault(key, threading.Lock())
+
+        # Only one thread loads a given wiki, the rest wait for it
+        with loading_lock:
+            with self._lock:
+                entry = self._get_valid_entry(key, fingerprint, bots_ids)
+                if entry is not None:
+                    self.hits += 1
+                    return entry.df.copy(deep=False)
+                self.misses += 1
+
+            df = load_wiki_data(csv_path, bots_ids)
+            entry = _StoreEntry(df, fingerprint, bots_ids, get_dataframe_nbytes(df))
+
+            with self._lock:
+                self._entries[key] = entry
+                self._evict()
+            return entry.df.copy(deep=False)
+
+
+    def is_stored(self, df):
+        """ Whether df is the full data of a wiki in the store """
+        with self._lock:
+            entry = self._entries.get(df.index.name)
+            return entry is not None and len(entry.df) == len(df)
+
+
+    def get_fingerprint(self, df):
+        """
+           Returns the fingerprint of the data of the stored wiki df is the
+           full data of, or None if df is not one of them.
+           Unlike get_data_fingerprint(), it's made of the size and a hash of
+           the content of its csv file (hashed once per wiki), instead of its
+           modification time, so it's the same on every host with the same
+           data (e.g. to check files built elsewhere).
+        """
+        with self._lock:
+            entry = self._entries.get(df.index.name)
+            if entry is None or len(entry.df) != len(df):
+                return None
+
+        if entry.csv_digest is None:
+            csv_path = os.path.join(self.data_dir, df.index.name)
+            csv_digest = columnar_cache.get_csv_digest(csv_path)
+            # the csv may have changed since the wiki was loaded
+            if columnar_cache.get_csv_fingerprint(csv_path) != entry.fingerprint:
+                return None
+            entry.csv_digest = csv_digest
+        return '{size}-{digest}-{bots}'.format(size=entry.fingerprint['size'],
+                    digest=entry.csv_digest, bots=get_bots_digest(entry.bots_ids))
+
+
+    def get_derived(self, df, name, builder):
+        """
+           Returns builder(df), memoized along with the stored wiki df comes
+           from, so it's only built once per wiki and process.
+           If df is not the full data of a stored wiki (e.g. it has been
+           filtered), builder(df) is just computed and returned.
+
+           Derived objects exposing a `nbytes` attribute count towards the
+           memory budget of the store.
+        """
+        key = df.index.name
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or len(entry.df) != len(df):
+                entry = None
+            elif name in entry.derived:
+                return entry.derived[name]
+
+        derived = builder(df)
+        if entry is not None:
+            with self._lock:
+                if self._entries.get(key) is entry and name not in entry.derived:
+                    entry.derived[name] = derived
+                    entry.nbytes += getattr(derived, 'nbytes', 0)
+                    self._evict()
+        return derived
+
+
+    def _get_valid_entry(self, key, fingerprint, bots_ids):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.fingerprint != fingerprint or entry.bots_ids != bots_ids:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+
+    def _evict(self):
+        """ Remove least recently used wikis until the store fits in budget """
+        while len(self._entries) > 1 and self.get_nbytes() > self.max_bytes:
+            key, _ = self._entries.popitem(last=False)
+            self.evictions += 1
+            print(' * [Info] Data store: evicted {}'.format(key))
+
+
+    def get_nbytes(self):
+        return sum(entry.nbytes for entry in self._entries.values())
+
+
+    def warm_up(self, wikis):
+        """ Load in advance the data of the given wikis """
+        for wiki in wikis:
+            try:
+                self.get(wiki)
+            except OSError as e:
+                warn('Could not preload {}: {}'.format(wiki['data'], e))
+
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'wikis': list(self._entries.keys()),
+                'bytes': self.get_nbytes(),
+                'max_bytes': self.max_bytes,
+            }
+
+
+def get_bots_ids(wiki):
+    if 'bots' in wiki:
+        return tuple(columnar_cache.parse_contributor_ids(bot['id'] for bot in wiki['bots']))
+    else:
+        return None
+
+
+def get_data_fingerprint(wiki):
+    """
+       Returns a string which changes whenever the data get() returns for
+       the wiki does: its csv file is modified or its bots change.
+    """
+    csv_fingerprint = columnar_cache.get_csv_fingerprint(os.path.join(data_dir, wiki['data']))
+    return format_fingerprint(csv_fingerprint, get_bots_ids(wiki))
+
+
+def format_fingerprint(csv_fingerprint, bots_ids):
+    return '{size}-{mtime_ns}-{bots}'.format(bots=get_bots_digest(bots_ids),
+                                            **csv_fingerprint)
+
+
+def get_bots_digest(bots_ids):
+    return hashlib.md5(repr(bots_ids).encode()).hexdigest()[:8]
+
+
+def get_dataframe_nbytes(df):
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def prepare_wiki_data(csv_path, bots_ids):
+    """
+       Read the data of a wiki and prepare it in the input format expected
+       by the metric and network calculation functions: sorted by timestamp
+       and without bots activity.
+    """
+    csv = os.path.basename(csv_path)
+    df = columnar_cache.load_dataframe(csv_path)
+    df.index.name = csv
+    df.sort_values(by='timestamp', inplace=True)
+    if bots_ids is not None:
+        df = df[~df['contributor_id'].isin(np.array(bots_ids))]
+    else:
+        warn("Warning: Missing information of bots ids. Note that graphs can be polluted of non-human activity.")
+    return df
+
+
+def build_prepared_data(csv_path, bots_ids):
+    """
+       Write the prepared data file of a wiki if it doesn't exist or it's
+       outdated. Returns True if the file is available.
+    """
+    try:
+        if columnar_cache.read_prepared_cache(csv_path, bots_ids) is not None:
+            return True
+    except (OSError, ValueError, KeyError):
+        pass
+
+    df = prepare_wiki_data(csv_path, bots_ids)
+    try:
+        columnar_cache.write_prepared_cache(df, csv_path, bots_ids)
+        return True
+    except OSError as e:
+        warn('Could not write prepared data for {}: {}'.format(csv_path, e))
+        return False
+
+
+def load_wiki_data(csv_path, bots_ids):
+    """
+       Returns the prepared data of a wiki, memory-mapped from its prepared
+       data file (which is built first if needed). If that file can't be
+       written, the data is prepared and kept in the memory of this process.
+    """
+    csv = os.path.basename(csv_path)
+    print('Loading csv for ' + csv)
+    time_start_loading_one_csv = time.perf_counter()
+
+    if build_prepared_data(csv_path, bots_ids):
+        df = columnar_cache.read_prepared_cache(csv_path, bots_ids)
+    else:
+        df = None
+    if df is None:
+        df = prepare_wiki_data(csv_path, bots_ids)
+
+    print('!!Loaded csv for ' + csv)
+    time_end_loading_one_csv = time.perf_counter() - time_start_loading_one_csv
+    print(' * [Timing] Loading {} : {} seconds'
+                    .format(csv, time_end_loading_one_csv))
+    return df
+
+
+def build_prepared_data_of_all_wikis():
+    """
+       Build the prepared data file of every available wiki. Meant to be run
+       once in the gunicorn master process (see sample_gunicorn_config.py),
+       so workers only have to map these files.
+    """
+    for wiki in data_manager.load_wikis():
+        csv_path = os.path.join(data_dir, wiki['data'])
+        try:
+            build_prepared_data(csv_path, get_bots_ids(wiki))
+        except OSError as e:
+            warn('Could not prepare data of {}: {}'.format(wiki['data'], e))
+    return
+
+
+global _data_store
+_data_store = None
+
+def get_data_store():
+    """ Returns the data store of this process """
+    global _data_store
+    if _data_store is None:
+        max_mbytes = int(os.getenv('WIKICHRON_DATA_STORE_SIZE', DEFAULT_MAX_MBYTES))
+        _data_store = WikiDataStore(data_dir, max_mbytes * 1024 * 1024)
+    return _data_store
+
+
+def get_derived(df, name, builder):
+    """ Shortcut for get_data_store().get_derived() """
+    return get_data_store().get_derived(df, name, builder)
+
+
+def is_stored(df):
+    """ Shortcut for get_data_store().is_stored() """
+    return get_data_store().is_stored(df)
+
+
+def get_stored_fingerprint(df):
+    """ Shortcut for get_data_store().get_fingerprint() """
+    return get_data_store().get_fingerprint(df)
+
+
+def preload_wikis_from_env():
+    """ Load in the data store the wikis listed in WIKICHRON_PRELOAD_WIKIS """
+    wikis_to_preload = os.getenv('WIKICHRON_PRELOAD_WIKIS', '').strip()
+    if not wikis_to_preload:
+        return
+
+    wikis = data_manager.load_wikis()
+    if wikis_to_preload != '*':
+        names = {name.strip() for name in wikis_to_preload.split(',')}
+        wikis = [wiki for wiki in wikis
+                    if wiki['domain'] in names or wiki['data'] in names]
+
+    print(' * [Info] Preloading {} wikis in process {}...'.format(len(wikis), os.getpid()))
+    get_data_store().warm_up(wikis)
+    return
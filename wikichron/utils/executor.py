@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   executor.py
+
+   Descp: Pool of workers the metrics of several wikis (or several metrics
+       of a wiki) are computed in parallel with, instead of one after the
+       other in the process serving the request.
+
+       The kind of pool is set in the env variable WIKICHRON_METRICS_EXECUTOR:
+          * serial (default): no pool, tasks are run one after the other.
+          * thread: threads of this process, which share the data store, so
+             tasks can be as small as one metric of one wiki, but most of
+             the metrics code holds the GIL.
+          * process: child processes, started from a fresh interpreter
+             (forkserver, or spawn where it's not available) instead of
+             forking the process serving the requests. Every task gets its
+             wiki data from the data store of its child process, so tasks
+             are whole wikis.
+             Beware of its memory cost: every child has a data store of its
+             own, which can take up to WIKICHRON_DATA_STORE_SIZE, and builds
+             its own derived tables of the wikis, so every worker of the web
+             server can take up to WIKICHRON_METRICS_WORKERS + 1 times the
+             memory it takes with the other kinds.
+       The number of workers is set in WIKICHRON_METRICS_WORKERS (by
+       default, the number of cpus, up to 4). With a single worker, tasks
+       are run serially.
+       The pool is created on first use, or when start_executor() is called
+       (e.g. in the post_worker_init hook of gunicorn).
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import os
+import time
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+EXECUTOR_KINDS = {'thread', 'process', 'serial'}
+EXECUTOR_KIND = os.getenv('WIKICHRON_METRICS_EXECUTOR', 'serial')
+WORKERS = int(os.getenv('WIKICHRON_METRICS_WORKERS', 0)) or min(4, os.cpu_count() or 1)
+
+if EXECUTOR_KIND not in EXECUTOR_KINDS:
+    raise ValueError('WIKICHRON_METRICS_EXECUTOR must be one of {}, not {}'.format(
+                    EXECUTOR_KINDS, EXECUTOR_KIND))
+
+global debug
+debug = True if os.environ.get('FLASK_ENV') == 'development' else False
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """ Returns the pool of workers, created on first use, or None if serial """
+    global _executor
+    if EXECUTOR_KIND == 'serial' or WORKERS < 2:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            if EXECUTOR_KIND == 'thread':
+                _executor = ThreadPoolExecutor(max_workers=WORKERS)
+            else:
+                _executor = ProcessPoolExecutor(max_workers=WORKERS,
+                                                mp_context=get_process_context())
+    return _executor
+
+
+def get_process_context():
+    """
+       Children are never forked from the process serving the requests,
+       which may hold locks of its other threads, open sockets and so on.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload(['numpy', 'pandas'])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+def start_executor():
+    """ Creates the pool of workers before the first request needs it """
+    executor = get_executor()
+    if executor is not None:
+        # workers are started on demand, so give them something to do
+        list(executor.map(int, range(WORKERS)))
+
+
+def splits_metrics():
+    """ Whether tasks can be single metrics of a wiki, or must be whole wikis """
+    return EXECUTOR_KIND == 'thread'
+
+
+def timed(function, args):
+    """ Returns function(*args) and the seconds it took """
+    time_start = time.perf_counter()
+    result = function(*args)
+    return (result, time.perf_counter() - time_start)
+
+
+def run_tasks(function, tasks, names = None):
+    """
+       Returns [function(*args) for args in tasks], computed in the pool of
+       workers, in the same order as tasks.
+       In debug mode, the time of every task is logged, along with its
+       name if names are given. With the process executor, function and args must be
+       picklable (i.e. functions defined at module level).
+    """
+    executor = get_executor()
+    if executor is None or len(tasks) < 2:
+        results = [timed(function, args) for args in tasks]
+    else:
+        results = list(executor.map(timed, [function] * len(tasks), tasks))
+
+    if debug:
+        names = names or [str(idx) for idx in range(len(tasks))]
+        for name, (_, seconds) in zip(names, results):
+            print(' * [Timing] Task {} : {} seconds'.format(name, seconds))
+    return [result for result, _ in results]
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   metric_cache.py
+
+   Descp: Cache of the metrics computed on every wiki, with one cell per
+       (wiki, metric) pair.
+
+       Missing cells are computed in parallel, see executor.py.
+
+       The data of a whole selection (wikis x metrics) is also kept in a
+       process-local LRU of results, under a token the dash callbacks pass
+       each other, so the callbacks of a page load and the download of its
+       data don't fetch all its cells from the cache again. Its size can
+       be set in the env variable WIKICHRON_RESULTS_CACHE_SIZE.
+
+       Cells are keyed by the domain of the wiki, the fingerprint of its data
+       (see data_store.get_data_fingerprint()) and the code of the metric,
+       so adding a metric to a selection or reordering its wikis only
+       computes the cells which are not in the cache yet, and the metadata
+       of the wikis (e.g. their images) don't take part in the keys.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+from .data_store import get_data_fingerprint
+from . import executor
+
+DEFAULT_TIMEOUT = 3600
+RESULTS_CACHE_SIZE = int(os.getenv('WIKICHRON_RESULTS_CACHE_SIZE', 32))
+
+
+class ResultsStore:
+    """ Process-local LRU of the data of the last selections, by token """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def get(self, token):
+        with self._lock:
+            value = self._entries.get(token)
+            if value is not None:
+                self._entries.move_to_end(token)
+            return value
+
+
+    def put(self, token, value):
+        with self._lock:
+            self._entries[token] = value
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+results = ResultsStore(RESULTS_CACHE_SIZE)
+
+
+def get_selection_token(namespace, wikis, metrics):
+    """
+       Returns the token of the data of a selection, which is the same for
+       the same wikis, data and metrics in every process.
+    """
+    selection = [namespace,
+                [(wiki['domain'], get_data_fingerprint(wiki)) for wiki in wikis],
+                [metric.code for metric in metrics]]
+    return hashlib.sha1(json.dumps(selection).encode()).hexdigest()
+
+
+def get_selection_result(token, compute):
+    """
+       Returns the data of the selection with token from the results of
+       this process, or else compute() (e.g. the token was given by another
+       process), which is then kept under token.
+    """
+    value = results.get(token)
+    if value is None:
+        value = compute()
+        results.put(token, value)
+    return value
+
+
+def get_cell_key(namespace, wiki, fingerprint, metric):
+    return f'{namespace}/{wiki["domain"]}/{fingerprint}/{metric.code}'
+
+
+def compute_cells(read_data, calculate, wiki, metrics):
+    return calculate(metrics, read_data(wiki))
+
+
+def load_cells(cache, namespace, wikis, metrics, read_data, calculate,
+                timeout = DEFAULT_TIMEOUT):
+    """
+       Returns the data of every metric on every wiki, as data[metric][wiki],
+       from the cache or else computed and stored in it.
+
+       cache -- Flask-Caching Cache object.
+       namespace -- prefix of the keys, so apps computing the same metric
+          codes in different ways don't share cells.
+       read_data -- function returning the dataframe of a wiki.
+       calculate -- function (metrics, df) returning the data of each of the
+          metrics computed on df.
+       Both functions must be picklable for the process executor.
+    """
+    keys = [[get_cell_key(namespace, wiki, get_data_fingerprint(wiki), metric)
+                for metric in metrics]
+            for wiki in wikis]
+    data = [[None for _ in wikis] for _ in metrics]
+    flat_keys = [key for wiki_keys in keys for key in wiki_keys]
+    cached = dict(zip(flat_keys, cache.get_many(*flat_keys))) if flat_keys else {}
+
+    # one task per wiki and group of missing metrics
+    tasks = []
+    for wiki_idx, wiki in enumerate(wikis):
+        missing = []
+        for metric_idx, metric in enumerate(metrics):
+            value = cached.get(keys[wiki_idx][metric_idx])
+            if value is None:
+                missing.append(metric_idx)
+            else:
+                data[metric_idx][wiki_idx] = value
+        if not missing:
+            continue
+        groups = [[idx] for idx in missing] if executor.splits_metrics() else [missing]
+        tasks.extend((wiki_idx, group) for group in groups)
+
+    computed = executor.run_tasks(compute_cells,
+                [(read_data, calculate, wikis[wiki_idx], [metrics[idx] for idx in group])
+                    for wiki_idx, group in tasks],
+                names=['{} <> {}'.format(wikis[wiki_idx]['domain'],
+                                        ', '.join(metrics[idx].code for idx in group))
+                    for wiki_idx, group in tasks])
+
+    new_cells = {}
+    for (wiki_idx, group), values in zip(tasks, computed):
+        for metric_idx, value in zip(group, values):
+            data[metric_idx][wiki_idx] = value
+            new_cells[keys[wiki_idx][metric_idx]] = value
+    if new_cells:
+        cache.set_many(new_cells, timeout=timeout)
+    n_computed = len(new_cells)
+
+    print(' * [Info] Metric cells: {} cached, {} computed'.format(
+            len(flat_keys) - n_computed, n_computed))
+    return data
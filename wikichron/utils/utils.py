@@ -11,8 +11,61 @@
 """
 
 import re
+import time
+
+import redis
+from flask_caching.backends import SimpleCache
 
 
 def get_domain_from_url(url):
     domain = re.match('https?://(.*)', url)
     return domain.groups()[0]
+
+
+class SimpleCacheWithStats(SimpleCache):
+    """ Flask-Caching simple cache which tells how much it holds """
+
+    def get_stats(self):
+        """ Number of keys not expired yet and bytes of their (pickled) values """
+        now = time.time()
+        values = [value for (expires, value) in self._cache.values()
+                    if expires == 0 or expires > now]
+        return {'keys': len(values), 'bytes': sum(len(value) for value in values)}
+
+
+def simple_cache_with_stats(app, config, args, kwargs):
+    """
+       Flask-Caching backend factory of SimpleCacheWithStats, to be set as
+       'wikichron.utils.utils.simple_cache_with_stats' in CACHE_TYPE.
+       It takes the same settings as the 'simple' backend.
+    """
+    kwargs.update(threshold = config['CACHE_THRESHOLD'],
+                ignore_errors = config['CACHE_IGNORE_ERRORS'])
+    return SimpleCacheWithStats(*args, **kwargs)
+
+
+def get_cache_stats(cache):
+    """
+       Returns the type of backend of a flask-caching cache object, along
+       with its number of keys and bytes if it can tell them (see
+       SimpleCacheWithStats).
+    """
+    backend = cache.cache
+    stats = {'type': type(backend).__name__}
+    if isinstance(backend, SimpleCacheWithStats):
+        stats.update(backend.get_stats())
+    return stats
+
+
+def get_redis_server_stats(redis_url):
+    """
+       Returns how many keys and bytes the redis server at redis_url holds.
+       These numbers are server-wide: they include the keys of every cache
+       (and any other client) using that server.
+    """
+    client = redis.Redis.from_url(redis_url)
+    try:
+        return {'db_keys': client.dbsize(),
+                'used_memory': client.info('memory')['used_memory']}
+    except redis.exceptions.ConnectionError:
+        return {'error': 'redis not reachable'}
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   zip_stream.py
+
+   Descp: Zip archives of dataframes generated on the fly, for the downloads
+       of computed data.
+
+       Every file of the archive is written in chunks (csv rows, or a whole
+       parquet file if the parquet output is requested) through a zipfile
+       on an unseekable stream, so the bytes of the archive are yielded as
+       soon as they are compressed, and neither the archive nor the whole
+       csv of a dataframe are ever held in memory.
+
+   Created on: 18-oct-2026
+
+   Copyright 2026 The WikiChron Authors (https://github.com/Grasia/WikiChron/graphs/contributors)
+"""
+
+import io
+import zipfile
+
+import flask
+import pandas as pd
+
+CSV_CHUNK_ROWS = 10000
+FORMATS = {'csv', 'parquet'}
+
+
+class _StreamBuffer(io.RawIOBase):
+    """ Unseekable file which keeps what is written until it's popped """
+
+    def __init__(self):
+        self._chunks = []
+
+
+    def writable(self):
+        return True
+
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+
+    def pop(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_zip(files):
+    """
+       Yields the bytes of a zip archive with files, an iterable of
+       (name, iterable of the bytes of the file).
+    """
+    buffer = _StreamBuffer()
+    with zipfile.ZipFile(buffer, mode='w', compression=zipfile.ZIP_DEFLATED) as zip_file:
+        for name, chunks in files:
+            with zip_file.open(name, mode='w') as zip_entry:
+                for chunk in chunks:
+                    zip_entry.write(chunk)
+                    yield buffer.pop()
+            yield buffer.pop()
+    yield buffer.pop()
+
+
+def csv_chunks(df, chunk_rows = CSV_CHUNK_ROWS):
+    """ Yields the csv of df, chunk_rows rows at a time, encoded """
+    for start in range(0, max(len(df), 1), chunk_rows):
+        yield df.iloc[start:start + chunk_rows].to_csv(header=(start == 0)).encode()
+
+
+def parquet_chunks(df):
+    """ Yields the parquet file of df """
+    df = df.copy()
+    df.columns = [str(column) for column in df.columns]
+    buffer = io.BytesIO()
+    df.to_parquet(buffer)
+    yield buffer.getvalue()
+
+
+def is_parquet_available():
+    """ Whether pandas has a parquet engine (pyarrow or fastparquet) installed """
+    try:
+        pd.io.parquet.get_engine('auto')
+        return True
+    except ImportError:
+        return False
+
+
+def dataframe_files(named_dataframes, file_format = 'csv'):
+    """
+       Turns an iterable of (name, dataframe) into the files of
+       stream_zip(), with the extension and the content of file_format.
+    """
+    chunker = parquet_chunks if file_format == 'parquet' else csv_chunks
+    for name, df in named_dataframes:
+        yield ('{}.{}'.format(name, file_format), chunker(df))
+
+
+def send_zip(files, filename):
+    """ Flask response which streams the zip of files (see stream_zip()) """
+    return flask.Response(flask.stream_with_context(stream_zip(files)),
+                        mimetype='application/zip',
+                        headers={'Content-Disposition':
+                                'attachment; filename="{}"'.format(filename)})